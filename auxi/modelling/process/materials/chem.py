@@ -7,6 +7,8 @@ are described with chemical compositions.
 import copy
 from os.path import isfile
 
+import numpy
+
 from auxi.core.objects import Object, NamedObject
 from auxi.tools.chemistry.stoichiometry import element_mass_fractions as emf
 from auxi.tools.chemistry import stoichiometry as stoich
@@ -92,7 +94,7 @@ class Material(NamedObject):
                              .format(file_path))
 
     def _read_configuration_(self, file_path):
-        self.compounds = []
+        compounds = []
 
         # Read the material's data from the file and prepare it for use.
         with open(file_path) as f:
@@ -111,11 +113,15 @@ class Material(NamedObject):
             strings = lines[i].split(' ')
             if len(strings) < len(assay_names) + 1:  # Not a full line.
                 continue
-            self.compounds.append(strings[0])  # Add the new compound.
+            compounds.append(strings[0])  # Add the new compound.
             for j in range(0, len(self.assays)):  # Add mass fractions.
                 assay_name = assay_names[j]
                 self.assays[assay_name].append(float(strings[j+1]))
+        self.compounds = tuple(compounds)
         self.compound_count = len(self.compounds)
+        self._compound_indices = dict()
+        for index, compound in enumerate(self.compounds):
+            self._compound_indices.setdefault(compound, index)
 
         # Determine the list of elements.
         self.elements = self._create_element_list_()
@@ -163,7 +169,27 @@ class Material(NamedObject):
         :returns: The index of the specified compound.
         """
 
-        return self.compounds.index(compound)
+        try:
+            return self._compound_indices[compound]
+        except KeyError:
+            raise ValueError("'{}' is not a compound of the material."
+                             .format(compound))
+
+    def get_compound_indices(self, compounds):
+        """
+        Determine the indices of the specified compounds.
+
+        :param compounds: List of compounds, e.g. ['Fe2O3[S1]', 'FeO[S1]'].
+
+        :returns: Array of compound indices.
+        """
+
+        indices = self._compound_indices
+        try:
+            return numpy.array([indices[x] for x in compounds], dtype=int)
+        except KeyError as e:
+            raise ValueError("'{}' is not a compound of the material."
+                             .format(e.args[0]))
 
     def create_empty_assay(self):
         """
@@ -282,7 +308,7 @@ class MaterialPackage(Object):
             else:  # Packages of different materials.
                 result = self.clone()
                 for compound in other.material.compounds:
-                    if compound not in self.material.compounds:
+                    if compound not in self.material._compound_indices:
                         raise Exception(
                             "Packages of '" + other.material.name +
                             "' cannot be added to packages of '" +
@@ -558,7 +584,7 @@ class MaterialPackage(Object):
             # Packages of different materials.
             else:
                 for compound in other.material.compounds:
-                    if compound not in self.material.compounds:
+                    if compound not in self.material._compound_indices:
                         raise Exception("Packages of '" + other.material.name +
                                         "' cannot be added to packages of '" +
                                         self.material.name +
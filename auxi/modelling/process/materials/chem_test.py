@@ -50,6 +50,16 @@ class ChemMaterialUnitTester(unittest.TestCase):
         self.assertEqual(self.material.get_compound_index("K2O"), 6)
         self.assertEqual(self.material.get_compound_index("P4O10"), 10)
         self.assertEqual(self.material.get_compound_index("V2O5"), 13)
+        self.assertRaises(ValueError, self.material.get_compound_index, "X")
+        with self.assertRaises(TypeError):
+            self.material.compounds[0] = "X"
+
+    def test_get_compound_indices(self):
+        self.assertEqual(
+            list(self.material.get_compound_indices(["V2O5", "Al2O3", "K2O"])),
+            [13, 0, 6])
+        self.assertRaises(ValueError, self.material.get_compound_indices,
+                          ["Al2O3", "X"])
 
     def test_create_empty_assay(self):
         empty_assay = self.material.create_empty_assay()
@@ -66,7 +66,7 @@ class Material(NamedObject):
     def __init__(self, name, file_path, description=None):
         # Initialise the material's properties.
         self.name = name
-        self.size_classes = list()
+        size_classes = list()
 
         # Read the material's data from the file and prepare it for use.
         f = open(file_path, "r")
@@ -88,7 +88,7 @@ class Material(NamedObject):
             if len(strings) < len(assay_names) + 1:  # Not a full line.
                 continue
             # Add the new size class.
-            self.size_classes.append(float(strings[0]))
+            size_classes.append(float(strings[0]))
             # Add the mass fractions to the assays.
             for j in range(0, len(self.assays)):
                 assay_name = assay_names[j]
@@ -96,7 +96,11 @@ class Material(NamedObject):
                     self.assays[assay_name], float(strings[j+1]))
 
         # Initialise the remaining properties.
+        self.size_classes = tuple(size_classes)
         self.size_class_count = len(self.size_classes)
+        self._size_class_indices = dict()
+        for index, size_class in enumerate(self.size_classes):
+            self._size_class_indices.setdefault(size_class, index)
 
     def __str__(self):
         """
@@ -151,7 +155,27 @@ class Material(NamedObject):
         :returns: The index of the specified size class.
         """
 
-        return self.size_classes.index(size_class)
+        try:
+            return self._size_class_indices[size_class]
+        except KeyError:
+            raise ValueError("'{}' is not a size class of the material."
+                             .format(size_class))
+
+    def get_size_class_indices(self, size_classes):
+        """
+        Determine the indices of the specified size classes.
+
+        :param size_classes: List of size classes, e.g. [300.0E-6, 75.0E-6].
+
+        :returns: Array of size class indices.
+        """
+
+        indices = self._size_class_indices
+        try:
+            return numpy.array([indices[x] for x in size_classes], dtype=int)
+        except KeyError as e:
+            raise ValueError("'{}' is not a size class of the material."
+                             .format(e.args[0]))
 
     def create_empty_assay(self):
         """
@@ -284,8 +308,9 @@ class MaterialPackage(Object):
                 return result
             else:  # Packages of different materials.
                 result = self.clone()
+                indices = self.material._size_class_indices
                 for size_class in other.material.size_classes:
-                    if size_class not in self.material.size_classes:
+                    if size_class not in indices:
                         raise Exception(
                             "Packages of '" + other.material.name +
                             "' cannot be added to packages of '" +
@@ -507,8 +532,9 @@ class MaterialPackage(Object):
                 self.size_class_masses = \
                         self.size_class_masses + other.size_class_masses
             else:  # Packages of different materials.
+                indices = self.material._size_class_indices
                 for size_class in other.material.size_classes:
-                    if size_class not in self.material.size_classes:
+                    if size_class not in indices:
                         raise Exception(
                             "Packages of '" + other.material.name +
                             "' cannot be added to packages of '" +
@@ -75,7 +75,7 @@ class Material(NamedObject):
     def __init__(self, name, file_path, description=None):
         # Initialise the material's properties.
         self.name = name
-        self.size_classes = list()
+        size_classes = list()
 
         # Read the material's data from the file and prepare it for use.
         f = open(file_path, "r")
@@ -125,7 +125,7 @@ class Material(NamedObject):
             if len(strings) < len(assay_names) + 1:
                 continue
             # Add the new size class.
-            self.size_classes.append(float(strings[0]))
+            size_classes.append(float(strings[0]))
             # Add the mass fractions to the assays.
             for j in range(0, len(self.assays)):
                 assay_name = assay_names[j]
@@ -133,7 +133,11 @@ class Material(NamedObject):
                     self.assays[assay_name], float(strings[j+1]))
 
         # Initialise the remaining properties.
+        self.size_classes = tuple(size_classes)
         self.size_class_count = len(self.size_classes)
+        self._size_class_indices = dict()
+        for index, size_class in enumerate(self.size_classes):
+            self._size_class_indices.setdefault(size_class, index)
 
     def __str__(self):
         """
@@ -202,7 +206,27 @@ class Material(NamedObject):
         :returns: The index of the specified size class.
         """
 
-        return self.size_classes.index(size_class)
+        try:
+            return self._size_class_indices[size_class]
+        except KeyError:
+            raise ValueError("'{}' is not a size class of the material."
+                             .format(size_class))
+
+    def get_size_class_indices(self, size_classes):
+        """
+        Determine the indices of the specified size classes.
+
+        :param size_classes: List of size classes, e.g. [300.0E-6, 75.0E-6].
+
+        :returns: Array of size class indices.
+        """
+
+        indices = self._size_class_indices
+        try:
+            return numpy.array([indices[x] for x in size_classes], dtype=int)
+        except KeyError as e:
+            raise ValueError("'{}' is not a size class of the material."
+                             .format(e.args[0]))
 
     def create_empty_assay(self):
         """
@@ -392,8 +416,9 @@ class MaterialPackage(Object):
                 result = self.clone()
                 result.solid_density = solid_density
                 result.H2O_mass = H2O_mass
+                indices = self.material._size_class_indices
                 for size_class in other.material.size_classes:
-                    if size_class not in self.material.size_classes:
+                    if size_class not in indices:
                         raise Exception(
                             "Packages of '" + other.material.name +
                             "' cannot be added to packages of '" +
@@ -47,6 +47,16 @@ class SlurryMaterialUnitTester(unittest.TestCase):
         self.assertEqual(self.material.get_size_class_index(38.4E-3), 2)
         self.assertEqual(self.material.get_size_class_index(600.0E-6), 6)
         self.assertEqual(self.material.get_size_class_index(0.0E0), 9)
+        self.assertRaises(ValueError, self.material.get_size_class_index, 1.0)
+        with self.assertRaises(TypeError):
+            self.material.size_classes[0] = 1.0
+
+    def test_get_size_class_indices(self):
+        self.assertEqual(
+            list(self.material.get_size_class_indices([0.0E0, 307.2E-3])),
+            [9, 0])
+        self.assertRaises(ValueError, self.material.get_size_class_indices,
+                          [1.0])
 
     def test_create_empty_assay(self):
         empty_assay = self.material.create_empty_assay()
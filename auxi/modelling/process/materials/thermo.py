@@ -33,6 +33,9 @@ class Material(NamedObject):
     :param name: A name for the material.
     :param file_path: The location of the file containing the material's data.
     :param description: the material's description
+    :param database: The thermochemical database (a ThermoDatabase) to use
+      for the material's compounds. The compounds loaded in the
+      thermochemistry module are used if it is None.
 
     The format of the text file is as follows:
 
@@ -76,16 +79,18 @@ class Material(NamedObject):
       units of MJ/kg.
     """
 
-    def __init__(self, name, file_path, description=None):
+    def __init__(self, name, file_path, description=None, database=None):
         # Initialise the material's properties.
         self.name = name
         """The material's name."""
 
+        self.database = database
+        """The thermochemical database used for the material's compounds."""
+
         self.description = description
         """The material's description."""
 
-        self.compounds = list()
-        """The material's list of chemical compounds."""
+        compounds = list()
 
         # Read the material's data from the file and prepare it for use.
         with open(file_path) as f:
@@ -116,7 +121,7 @@ class Material(NamedObject):
                 continue
 
             # Add the new compound.
-            self.compounds.append(strings[0])
+            compounds.append(strings[0])
 
             # Add the mass fractions to the assays.
             for j in range(0, len(self.raw_assays)):
@@ -146,11 +151,20 @@ class Material(NamedObject):
                     property_dictionary[property_name] = float(strings[j+1])
 
         # Initialise the remaining properties.
+        self.compounds = tuple(compounds)
+        """The material's tuple of chemical compounds."""
+
         self.compound_count = len(self.compounds)
         """The number of chemical compounds in the material."""
 
         self.elements = self._create_element_list()
 
+        self._compound_phase_vector = None
+        self._compound_phase_vector_version = None
+        self._compound_indices = dict()
+        for index, compound in enumerate(self.compounds):
+            self._compound_indices.setdefault(compound, index)
+
     def __str__(self):
         if len(self.raw_assays) > 0:
             line_length = 20 + (3 + 14) * len(self.raw_assays) - 2
@@ -272,7 +286,69 @@ class Material(NamedObject):
         :returns: Compound index.
         """
 
-        return self.compounds.index(compound)
+        try:
+            return self._compound_indices[compound]
+        except KeyError:
+            raise ValueError("'{}' is not a compound of the material."
+                             .format(compound))
+
+    def get_compound_indices(self, compounds):
+        """
+        Determine the indices of the specified compounds.
+
+        :param compounds: List of compounds, e.g. ['Fe2O3[S1]', 'FeO[S1]'].
+
+        :returns: Array of compound indices.
+        """
+
+        indices = self._compound_indices
+        try:
+            return numpy.array([indices[x] for x in compounds], dtype=int)
+        except KeyError as e:
+            raise ValueError("'{}' is not a compound of the material."
+                             .format(e.args[0]))
+
+    def get_compound_handles(self):
+        """
+        Get handles to the thermochemical data of the material's compounds.
+        The handles are created when they are first needed, and recreated if
+        the thermochemical data was reloaded.
+
+        :returns: List of compound phase handles, in the same order as the
+          material's compounds.
+        """
+
+        return self.get_compound_phase_vector().handles
+
+    def get_compound_phase_vector(self):
+        """
+        Get the compiled thermochemical data of the material's compounds,
+        with which a property of all the compounds is calculated at once. It
+        is created when it is first needed, and recreated if the
+        thermochemical data was reloaded.
+
+        :returns: Compound phase vector, in the same order as the material's
+          compounds.
+        """
+
+        version = thermo._get_database_(self.database).version
+        if self._compound_phase_vector_version != version:
+            self._compound_phase_vector = thermo.CompoundPhaseVector(
+                self.compounds, self.database)
+            self._compound_phase_vector_version = version
+        return self._compound_phase_vector
+
+    def get_compound_handle(self, compound):
+        """
+        Get a handle to the thermochemical data of the specified compound.
+
+        :param compound: Formula and phase of a compound, e.g. "Fe2O3[S1]".
+
+        :returns: Compound phase handle.
+        """
+
+        index = self.get_compound_index(compound)
+        return self.get_compound_handles()[index]
 
     def create_empty_assay(self):
         """
@@ -379,13 +455,23 @@ class MaterialPackage(Object):
     compounds, having a specific mass, pressure, temperature and enthalpy.
 
     :param material: a reference to the Material to which self belongs
-    :param compound_masses: [kg] package compound masses
+    :param compound_masses: [kg] package compound masses, which are copied
     :param P: [atm] package pressure
     :param T: [°C] package temperature
     :param isCoal: a boolean that indicates whether the material is coal
     :param HHV: [MJ/kg] higher heating value of the coal
+
+    The tolerance [°C] and maximum number of iterations of the temperature
+    calculation can be changed with the T_tolerance and T_max_iterations
+    attributes, on the class or on a package.
+
+    The temperature and enthalpy are calculated from each other only when
+    they are used, and the results are kept until the package changes.
     """
 
+    T_tolerance = 1.0e-6
+    T_max_iterations = 50
+
     def __init__(self, material, compound_masses, P=1.0, T=25.0, isCoal=False,
                  HHV=None):
         # Confirm that the parameters are OK.
@@ -400,15 +486,15 @@ class MaterialPackage(Object):
         self.material = material
         self._P = P
         self._T = T
+        self._T_stale = False
         self.isCoal = isCoal
         self.HHV = HHV
-        self._compound_masses = compound_masses
-        if self.mass > 0.0:
-            if self.isCoal:
-                self._DH298 = self._calculate_DH298_coal()
-            self._H = self._calculate_H(T)
-        else:
-            self._H = 0.0
+        # The masses are copied, since the package changes them in place.
+        self._compound_masses = numpy.array(compound_masses, dtype=float)
+        if self.isCoal and self.mass > 0.0:
+            self._DH298 = self._calculate_DH298_coal()
+        self._H = 0.0
+        self._H_stale = True
 
         self.custom_properties = dict()
 
@@ -497,14 +583,14 @@ class MaterialPackage(Object):
                 result = MaterialPackage(self.material,
                                          self._compound_masses +
                                          other._compound_masses)
-                result.H = self._H + other._H
+                result.H = self.H + other.H
                 result.P = self.P
                 return result
             else:  # Packages of different materials.
                 H = self.H + other.H
                 result = self.clone()
                 for compound in other.material.compounds:
-                    if compound not in self.material.compounds:
+                    if compound not in self.material._compound_indices:
                         raise Exception("Packages of '" + other.material.name +
                                         "' cannot be added to packages of '" +
                                         self.material.name +
@@ -518,18 +604,8 @@ class MaterialPackage(Object):
 
         # Add the specified mass of the specified compound.
         elif self._is_compound_mass_tuple(other):
-            # Added material varialbes.
-            compound = other[0]
-            index = self.material.get_compound_index(compound)
-            mass = other[1]
-            enthalpy = thermo.H(compound, self._T, mass)
-
-            # Create the result package.
             result = self.clone()
-            result._compound_masses[index] = result._compound_masses[index] + \
-                mass
-            result._H += enthalpy
-            result._P = self._P
+            result.add_to(other)
             return result
 
         # Add the specified mass of 'compound' at the specified temperature.
@@ -539,13 +615,14 @@ class MaterialPackage(Object):
             index = self.material.get_compound_index(compound)
             mass = other[1]
             temperature = other[2]
-            enthalpy = thermo.H(compound, temperature, mass)
+            enthalpy = self.material.get_compound_handle(compound).H(
+                temperature, mass)
 
             # Create the result package.
             result = self * 1.0
             result._compound_masses[index] = result._compound_masses[index] + \
                 mass
-            result.H = self._H + enthalpy
+            result.H = self.H + enthalpy
             result._P = self._P
             return result
 
@@ -572,13 +649,55 @@ class MaterialPackage(Object):
                 raise Exception("Invalid multiplication operation. Cannot "
                                 "multiply package with negative number.")
             result = MaterialPackage(self.material, self._compound_masses *
-                                     scalar, self._P, self._T)
+                                     scalar, self._P, self.T)
             return result
 
         # If not one of the above, it must be an invalid argument.
         else:
             raise TypeError("Invalid multiplication argument.")
 
+    def __iadd__(self, other):
+        """
+        In-place addition operator (+=).
+
+        Add 'other' to this package (self) and return self. See add_to.
+
+        :param other: The package or compound tuple to add.
+
+        :returns: self
+        """
+
+        self.add_to(other)
+        return self
+
+    def __imul__(self, scalar):
+        """
+        In-place multiplication operator (*=).
+
+        Multiply the content of this package (self) with scalar and return
+        self. The enthalpy is scaled directly, and the temperature is
+        unchanged.
+
+        :param scalar: The factor to multiply self with.
+
+        :returns: self
+        """
+
+        # Multiply with a scalar floating point number.
+        if type(scalar) is float or type(scalar) is numpy.float64 or \
+           type(scalar) is numpy.float32:
+            if scalar < 0.0:
+                raise Exception("Invalid multiplication operation. Cannot "
+                                "multiply package with negative number.")
+            self._compound_masses *= scalar
+            if not self._H_stale:
+                self._H *= scalar
+            return self
+
+        # If not one of the above, it must be an invalid argument.
+        else:
+            raise TypeError("Invalid multiplication argument.")
+
     def _calculate_H(self, T):
         """
         Calculate the enthalpy of the package at the specified temperature.
@@ -588,15 +707,14 @@ class MaterialPackage(Object):
         :returns: Enthalpy. [kWh]
         """
 
+        if not self._compound_masses.any():
+            return 0.0
+
         if self.isCoal:
             return self._calculate_Hfr_coal(T)
 
-        H = 0.0
-        for compound in self.material.compounds:
-            index = self.material.get_compound_index(compound)
-            dH = thermo.H(compound, T, self._compound_masses[index])
-            H = H + dH
-        return H
+        vector = self.material.get_compound_phase_vector()
+        return numpy.dot(self._compound_masses, vector.H(T))
 
     def _calculate_DH298_coal(self):
         """
@@ -618,28 +736,38 @@ class MaterialPackage(Object):
             index = self.material.get_compound_index(compound)
             if stoich.element_mass_fraction(compound, 'C') == 1.0:
                 m_C += self._compound_masses[index]
-                Hin = thermo.H(compound, T, self._compound_masses[index])
+                Hin = self.material.get_compound_handle(compound).H(
+                    T, self._compound_masses[index])
             elif stoich.element_mass_fraction(compound, 'H') == 1.0:
                 m_H += self._compound_masses[index]
-                Hin = thermo.H(compound, T, self._compound_masses[index])
+                Hin = self.material.get_compound_handle(compound).H(
+                    T, self._compound_masses[index])
             elif stoich.element_mass_fraction(compound, 'O') == 1.0:
                 m_O += self._compound_masses[index]
-                Hin = thermo.H(compound, T, self._compound_masses[index])
+                Hin = self.material.get_compound_handle(compound).H(
+                    T, self._compound_masses[index])
             elif stoich.element_mass_fraction(compound, 'N') == 1.0:
                 m_N += self._compound_masses[index]
-                Hin = thermo.H(compound, T, self._compound_masses[index])
+                Hin = self.material.get_compound_handle(compound).H(
+                    T, self._compound_masses[index])
             elif stoich.element_mass_fraction(compound, 'S') == 1.0:
                 m_S += self._compound_masses[index]
-                Hin = thermo.H(compound, T, self._compound_masses[index])
+                Hin = self.material.get_compound_handle(compound).H(
+                    T, self._compound_masses[index])
 
         m_total = m_C + m_H + m_O + m_N + m_S  # kg
 
         Hout = 0.0  # kWh
-        Hout += thermo.H('CO2[G]', T, cc(m_C, 'C', 'CO2', 'C'))
-        Hout += thermo.H('H2O[L]', T, cc(m_H, 'H', 'H2O', 'H'))
-        Hout += thermo.H('O2[G]', T, m_O)
-        Hout += thermo.H('N2[G]', T, m_N)
-        Hout += thermo.H('SO2[G]', T, cc(m_S, 'S', 'SO2', 'S'))
+        Hout += thermo.H('CO2[G]', T, cc(m_C, 'C', 'CO2', 'C'),
+                         database=self.material.database)
+        Hout += thermo.H('H2O[L]', T, cc(m_H, 'H', 'H2O', 'H'),
+                         database=self.material.database)
+        Hout += thermo.H('O2[G]', T, m_O,
+                         database=self.material.database)
+        Hout += thermo.H('N2[G]', T, m_N,
+                         database=self.material.database)
+        Hout += thermo.H('SO2[G]', T, cc(m_S, 'S', 'SO2', 'S'),
+                         database=self.material.database)
 
         if self.HHV is None:
             # If no HHV is specified, calculate it from the proximate assay
@@ -681,7 +809,8 @@ class MaterialPackage(Object):
             elif stoich.element_mass_fraction(compound, 'S') == 1.0:
                 m_S += self._compound_masses[index]
             else:
-                dH = thermo.H(compound, T, self._compound_masses[index])
+                dH = self.material.get_compound_handle(compound).H(
+                    T, self._compound_masses[index])
                 H += dH
 
         m_total = y_C + y_H + y_O + y_N + y_S  # kg/h
@@ -706,31 +835,25 @@ class MaterialPackage(Object):
     def _calculate_T(self, H):
         """
         Calculate the temperature of the package given the specified
-        enthalpy using a secant algorithm.
+        enthalpy using Newton's method, with the package's heat capacity as
+        derivative.
 
         :param H: Enthalpy. [kWh]
 
         :returns: Temperature. [°C]
         """
 
-        # Create the initial guesses for temperature.
-        x = list()
-        x.append(self._T)
-        x.append(self._T + 10.0)
-
-        # Evaluate the enthalpy for the initial guesses.
-        y = list()
-        y.append(self._calculate_H(x[0]) - H)
-        y.append(self._calculate_H(x[1]) - H)
+        if not self._compound_masses.any():
+            return self._T
 
-        # Solve for temperature.
-        for i in range(2, 50):
-            x.append(x[i-1] - y[i-1]*((x[i-1] - x[i-2])/(y[i-1] - y[i-2])))
-            y.append(self._calculate_H(x[i]) - H)
-            if abs(y[i-1]) < 1.0e-5:
-                break
+        if self.isCoal:
+            return _calculate_T_secant(self._calculate_H, H, self._T,
+                                       self.T_tolerance,
+                                       self.T_max_iterations)
 
-        return x[len(x) - 1]
+        vector = self.material.get_compound_phase_vector()
+        return vector.T_from_H(H, self._compound_masses, self.T_tolerance,
+                               self.T_max_iterations, self._T)
 
     def _is_compound_mass_tuple(self, value):
         """
@@ -783,46 +906,56 @@ class MaterialPackage(Object):
     @property
     def H(self):
         """
-        Get the enthalpy of the package.
+        Get the enthalpy of the package. If the temperature was set last, the
+        enthalpy is calculated from it and kept until the package changes.
 
         :returns: Enthalpy. [kWh]
         """
 
+        if self._H_stale:
+            self._H = self._calculate_H(self._T)
+            self._H_stale = False
         return self._H
 
     @H.setter
     def H(self, H):
         """
-        Set the enthalpy of the package to the specified value, and
-        recalculate it's temperature.
+        Set the enthalpy of the package to the specified value. The
+        temperature is recalculated when it is next used.
 
         :param H: The new enthalpy value. [kWh]
         """
 
         self._H = H
-        self._T = self._calculate_T(H)
+        self._H_stale = False
+        self._T_stale = True
 
     @property
     def T(self):
         """
-        Get the temperature of of the package.
+        Get the temperature of the package. If the enthalpy was set last, the
+        temperature is calculated from it and kept until the package changes.
 
         :returns: Temperature. [°C]
         """
 
+        if self._T_stale:
+            self._T = self._calculate_T(self._H)
+            self._T_stale = False
         return self._T
 
     @T.setter
     def T(self, T):
         """
-        Set the temperature of the package to the specified value, and
-        recalculate it's enthalpy.
+        Set the temperature of the package to the specified value. The
+        enthalpy is recalculated when it is next used.
 
         :param T: Temperature. [°C]
         """
 
         self._T = T
-        self._H = self._calculate_H(T)
+        self._T_stale = False
+        self._H_stale = True
 
     @property
     def P(self):
@@ -861,7 +994,9 @@ class MaterialPackage(Object):
         self._compound_masses = self._compound_masses * 0.0
         self._P = 1.0
         self._T = 25.0
+        self._T_stale = False
         self._H = 0.0
+        self._H_stale = False
 
     def get_assay(self):
         """
@@ -891,7 +1026,7 @@ class MaterialPackage(Object):
         :returns: Mass. [kg]
         """
 
-        if compound in self.material.compounds:
+        if compound in self.material._compound_indices:
             return self._compound_masses[
                 self.material.get_compound_index(compound)]
         else:
@@ -972,6 +1107,71 @@ class MaterialPackage(Object):
                 numpy.array(stoich.element_mass_fractions(compound, [element]))
         return result[0]
 
+    def add_to(self, other):
+        """
+        Add 'other' to this package (self), modifying self. The enthalpy of
+        self is updated directly, and its temperature is only recalculated
+        when it is next used.
+
+        :param other: Can can be one of the following:
+                 1. MaterialPackage
+                    'other' is added to self.
+                 2. tuple: (compound, mass)
+                    The specified mass of the specified compound is added to \
+                    self, assuming the added material has the same \
+                    temperature as self.
+                 3. tuple: (compound, mass, temperature)
+                    The specified mass of the specified compound at the \
+                    specified temperature is added to self.
+        """
+
+        # Add another package.
+        if type(other) is MaterialPackage:
+            H = self.H + other.H
+            if self.material == other.material:  # Packages of same material.
+                self._compound_masses += other._compound_masses
+            else:  # Packages of different materials.
+                indices = self.material._compound_indices
+                for compound in other.material.compounds:
+                    if compound not in indices:
+                        raise Exception("Packages of '" + other.material.name +
+                                        "' cannot be added to packages of '" +
+                                        self.material.name +
+                                        "'. The compound '" + compound +
+                                        "' was not found in '" +
+                                        self.material.name + "'.")
+                indices = self.material.get_compound_indices(
+                    other.material.compounds)
+                self._compound_masses[indices] += other._compound_masses
+            self._H = H
+            self._T_stale = True
+
+        # Add the specified mass of the specified compound.
+        elif self._is_compound_mass_tuple(other):
+            compound = other[0]
+            index = self.material.get_compound_index(compound)
+            mass = other[1]
+            if not self._H_stale:
+                self._H += self.material.get_compound_handle(compound).H(
+                    self.T, mass)
+            self._compound_masses[index] += mass
+
+        # Add the specified mass of 'compound' at the specified temperature.
+        elif self._is_compound_mass_temperature_tuple(other):
+            compound = other[0]
+            index = self.material.get_compound_index(compound)
+            mass = other[1]
+            temperature = other[2]
+            H = self.H + self.material.get_compound_handle(compound).H(
+                temperature, mass)
+            self._compound_masses[index] += mass
+            self._H = H
+            self._T_stale = True
+
+        # If not one of the above, it must be an invalid argument.
+        else:
+            raise TypeError("Invalid addition argument.")
+
     def extract(self, other):
         """
         Extract 'other' from this package, modifying this package and
@@ -1025,7 +1225,7 @@ class MaterialPackage(Object):
         fraction_to_subtract = mass / self.mass
         result = MaterialPackage(
             self.material, self._compound_masses *
-            fraction_to_subtract, self._P, self._T)
+            fraction_to_subtract, self._P, self.T)
 
         self._compound_masses = self._compound_masses * \
             (1.0 - fraction_to_subtract)
@@ -1036,7 +1236,7 @@ class MaterialPackage(Object):
     def _extract_compound(self, compound):
         result = self.material.create_package()
 
-        if compound not in self.material.compounds:
+        if compound not in self.material._compound_indices:
             return result
 
         index = self.material.get_compound_index(compound)
@@ -1050,15 +1250,16 @@ class MaterialPackage(Object):
         return result
 
     def _extract_compound_mass(self, compound, mass):
-        if compound not in self.material.compounds:
+        if compound not in self.material._compound_indices:
             return self.material.create_package()
 
         index = self.material.get_compound_index(compound)
         if mass > self._compound_masses[index]:
             raise Exception("Invalid extraction operation. Cannot extract a \
                 compound mass larger than what the package contains.")
+        T = self.T
         self._compound_masses[index] = self._compound_masses[index] - mass
-        self.T = self.T
+        self.T = T
 
         result = self.material.create_package(P=self._P, T=self._T)
         result += (compound, mass)
@@ -1082,13 +1283,24 @@ class MaterialStream(Object):
     having a specific mass flow rate, pressure, temperature and enthalpy.
 
     :param material: A reference to the Material to which the stream belongs.
-    :param compound_mfrs: Compound mass flow rates. [kg/h]
+    :param compound_mfrs: Compound mass flow rates, which are copied. [kg/h]
     :param P: Stream pressure. [atm]
     :param T: Stream temperature. [°C]
     :param isCoal: a boolean that indicates whether the material is coal
     :param HHV: [MJ/kg] higher heating value of the coal
+
+    The tolerance [°C] and maximum number of iterations of the temperature
+    calculation can be changed with the T_tolerance and T_max_iterations
+    attributes, on the class or on a stream.
+
+    The temperature and enthalpy flow rate are calculated from each other
+    only when they are used, and the results are kept until the stream
+    changes.
     """
 
+    T_tolerance = 1.0e-6
+    T_max_iterations = 50
+
     def __init__(self, material, compound_mfrs, P=1.0, T=25.0, isCoal=False,
                  HHV=None):
         # Confirm that the parameters are OK.
@@ -1103,13 +1315,14 @@ class MaterialStream(Object):
         self.material = material
         self._P = P
         self._T = T
-        self._compound_mfrs = compound_mfrs
+        self._T_stale = False
+        # The mass flow rates are copied, since the stream changes them in
+        # place.
+        self._compound_mfrs = numpy.array(compound_mfrs, dtype=float)
         self.isCoal = isCoal
         self.HHV = HHV
-        if self.mfr > 0.0:
-            self._Hfr = self._calculate_Hfr(T)
-        else:
-            self._Hfr = 0.0
+        self._Hfr = 0.0
+        self._H_stale = True
 
         self.custom_properties = dict()
 
@@ -1212,14 +1425,14 @@ class MaterialStream(Object):
                 result = MaterialStream(self.material,
                                          self._compound_mfrs +
                                          other._compound_mfrs, isCoal=isCoal, HHV=HHV)
-                result.Hfr = self._Hfr + other._Hfr
+                result.Hfr = self.Hfr + other.Hfr
                 result.P = self.P
                 return result
             else:  # Streams of different materials.
                 Hfr = self.Hfr + other.Hfr
                 result = self.clone()
                 for compound in other.material.compounds:
-                    if compound not in self.material.compounds:
+                    if compound not in self.material._compound_indices:
                         raise Exception("Streams of '" + other.material.name +
                                         "' cannot be added to streams of '" +
                                         self.material.name +
@@ -1233,18 +1446,8 @@ class MaterialStream(Object):
 
         # Add the specified mass flow rate of the specified compound.
         elif self._is_compound_mfr_tuple(other):
-            # Added material variables.
-            compound = other[0]
-            index = self.material.get_compound_index(compound)
-            mfr = other[1]
-            enthalpy = thermo.H(compound, self._T, mfr)
-
-            # Create the result stream.
             result = self.clone()
-            result._compound_mfrs[index] += mfr
-            result._update_HHV(compound, mfr)
-            result._Hfr += enthalpy
-            result._P = self._P
+            result.add_to(other)
             return result
 
         # Add the specified mass flow rate of 'compound' at the specified temperature.
@@ -1254,12 +1457,13 @@ class MaterialStream(Object):
             index = self.material.get_compound_index(compound)
             mfr = other[1]
             temperature = other[2]
-            enthalpy = thermo.H(compound, temperature, mfr)
+            enthalpy = self.material.get_compound_handle(compound).H(
+                temperature, mfr)
 
             # Create the result stream.
             result = self * 1.0
             result._compound_mfrs[index] += mfr
-            result.Hfr = self._Hfr + enthalpy
+            result.Hfr = self.Hfr + enthalpy
             result._P = self._P
             return result
 
@@ -1286,7 +1490,7 @@ class MaterialStream(Object):
                 raise Exception("Invalid multiplication operation. Cannot "
                                 "multiply stream with negative number.")
             result = MaterialStream(self.material, self._compound_mfrs *
-                                    scalar, self._P, self._T, self.isCoal,
+                                    scalar, self._P, self.T, self.isCoal,
                                     self.HHV)
             return result
 
@@ -1294,6 +1498,48 @@ class MaterialStream(Object):
         else:
             raise TypeError("Invalid multiplication argument.")
 
+    def __iadd__(self, other):
+        """
+        In-place addition operator (+=).
+
+        Add 'other' to this stream (self) and return self. See add_to.
+
+        :param other: The stream or compound tuple to add.
+
+        :returns: self
+        """
+
+        self.add_to(other)
+        return self
+
+    def __imul__(self, scalar):
+        """
+        In-place multiplication operator (*=).
+
+        Multiply the content of this stream (self) with scalar and return
+        self. The enthalpy flow rate is scaled directly, and the temperature
+        is unchanged.
+
+        :param scalar: The factor to multiply self with.
+
+        :returns: self
+        """
+
+        # Multiply with a scalar floating point number.
+        if type(scalar) is float or type(scalar) is numpy.float64 or \
+           type(scalar) is numpy.float32:
+            if scalar < 0.0:
+                raise Exception("Invalid multiplication operation. Cannot "
+                                "multiply stream with negative number.")
+            self._compound_mfrs *= scalar
+            if not self._H_stale:
+                self._Hfr *= scalar
+            return self
+
+        # If not one of the above, it must be an invalid argument.
+        else:
+            raise TypeError("Invalid multiplication argument.")
+
     def _calculate_Hfr(self, T):
         """
         Calculate the enthalpy flow rate of the stream at the specified
@@ -1304,15 +1550,14 @@ class MaterialStream(Object):
         :returns: Enthalpy flow rate. [kWh/h]
         """
 
+        if not self._compound_mfrs.any():
+            return 0.0
+
         if self.isCoal:
             return self._calculate_Hfr_coal(T)
 
-        Hfr = 0.0
-        for compound in self.material.compounds:
-            index = self.material.get_compound_index(compound)
-            dHfr = thermo.H(compound, T, self._compound_mfrs[index])
-            Hfr = Hfr + dHfr
-        return Hfr
+        vector = self.material.get_compound_phase_vector()
+        return numpy.dot(self._compound_mfrs, vector.H(T))
 
     def _calculate_DH298_coal(self):
         """
@@ -1334,28 +1579,38 @@ class MaterialStream(Object):
             formula = compound.split('[')[0]
             if stoich.element_mass_fraction(formula, 'C') == 1.0:
                 m_C += self._compound_mfrs[index]
-                Hin += thermo.H(compound, T, self._compound_mfrs[index])
+                Hin += self.material.get_compound_handle(compound).H(
+                    T, self._compound_mfrs[index])
             elif stoich.element_mass_fraction(formula, 'H') == 1.0:
                 m_H += self._compound_mfrs[index]
-                Hin += thermo.H(compound, T, self._compound_mfrs[index])
+                Hin += self.material.get_compound_handle(compound).H(
+                    T, self._compound_mfrs[index])
             elif stoich.element_mass_fraction(formula, 'O') == 1.0:
                 m_O += self._compound_mfrs[index]
-                Hin += thermo.H(compound, T, self._compound_mfrs[index])
+                Hin += self.material.get_compound_handle(compound).H(
+                    T, self._compound_mfrs[index])
             elif stoich.element_mass_fraction(formula, 'N') == 1.0:
                 m_N += self._compound_mfrs[index]
-                Hin += thermo.H(compound, T, self._compound_mfrs[index])
+                Hin += self.material.get_compound_handle(compound).H(
+                    T, self._compound_mfrs[index])
             elif stoich.element_mass_fraction(formula, 'S') == 1.0:
                 m_S += self._compound_mfrs[index]
-                Hin += thermo.H(compound, T, self._compound_mfrs[index])
+                Hin += self.material.get_compound_handle(compound).H(
+                    T, self._compound_mfrs[index])
 
         m_total = m_C + m_H + m_O + m_N + m_S  # kg
 
         Hout = 0.0  # kWh
-        Hout += thermo.H('CO2[G]', T, cc(m_C, 'C', 'CO2', 'C'))
-        Hout += thermo.H('H2O[L]', T, cc(m_H, 'H', 'H2O', 'H'))
-        Hout += thermo.H('O2[G]', T, m_O)
-        Hout += thermo.H('N2[G]', T, m_N)
-        Hout += thermo.H('SO2[G]', T, cc(m_S, 'S', 'SO2', 'S'))
+        Hout += thermo.H('CO2[G]', T, cc(m_C, 'C', 'CO2', 'C'),
+                         database=self.material.database)
+        Hout += thermo.H('H2O[L]', T, cc(m_H, 'H', 'H2O', 'H'),
+                         database=self.material.database)
+        Hout += thermo.H('O2[G]', T, m_O,
+                         database=self.material.database)
+        Hout += thermo.H('N2[G]', T, m_N,
+                         database=self.material.database)
+        Hout += thermo.H('SO2[G]', T, cc(m_S, 'S', 'SO2', 'S'),
+                         database=self.material.database)
         Hout /= m_total
 
         if self.HHV is None:
@@ -1400,7 +1655,8 @@ class MaterialStream(Object):
             elif stoich.element_mass_fraction(formula, 'S') == 1.0:
                 m_S += self._compound_mfrs[index]
             else:
-                dHfr = thermo.H(compound, T, self._compound_mfrs[index])
+                dHfr = self.material.get_compound_handle(compound).H(
+                    T, self._compound_mfrs[index])
                 Hfr += dHfr
 
         m_total = m_C + m_H + m_O + m_N + m_S  # kg/h
@@ -1425,31 +1681,25 @@ class MaterialStream(Object):
     def _calculate_T(self, Hfr):
         """
         Calculate the temperature of the stream given the specified
-        enthalpy flow rate using a secant algorithm.
+        enthalpy flow rate using Newton's method, with the stream's heat
+        capacity flow rate as derivative.
 
-        :param H: Enthalpy flow rate. [kWh/h]
+        :param Hfr: Enthalpy flow rate. [kWh/h]
 
         :returns: Temperature. [°C]
         """
 
-        # Create the initial guesses for temperature.
-        x = list()
-        x.append(self._T)
-        x.append(self._T + 10.0)
-
-        # Evaluate the enthalpy for the initial guesses.
-        y = list()
-        y.append(self._calculate_Hfr(x[0]) - Hfr)
-        y.append(self._calculate_Hfr(x[1]) - Hfr)
+        if not self._compound_mfrs.any():
+            return self._T
 
-        # Solve for temperature.
-        for i in range(2, 50):
-            x.append(x[i-1] - y[i-1]*((x[i-1] - x[i-2])/(y[i-1] - y[i-2])))
-            y.append(self._calculate_Hfr(x[i]) - Hfr)
-            if abs(y[i-1]) < 1.0e-5:
-                break
+        if self.isCoal:
+            return _calculate_T_secant(self._calculate_Hfr, Hfr, self._T,
+                                       self.T_tolerance,
+                                       self.T_max_iterations)
 
-        return x[len(x) - 1]
+        vector = self.material.get_compound_phase_vector()
+        return vector.T_from_H(Hfr, self._compound_mfrs, self.T_tolerance,
+                               self.T_max_iterations, self._T)
 
     def _is_compound_mfr_tuple(self, value):
         """
@@ -1502,46 +1752,58 @@ class MaterialStream(Object):
     @property
     def Hfr(self):
         """
-        Get the enthalpy flow rate of the stream.
+        Get the enthalpy flow rate of the stream. If the temperature was set
+        last, the enthalpy flow rate is calculated from it and kept until the
+        stream changes.
 
         :returns: Enthalpy flow rate. [kWh/h]
         """
 
+        if self._H_stale:
+            self._Hfr = self._calculate_Hfr(self._T)
+            self._H_stale = False
         return self._Hfr
 
     @Hfr.setter
     def Hfr(self, Hfr):
         """
-        Set the enthalpy flow rate of the stream to the specified value, and
-        recalculate it's temperature.
+        Set the enthalpy flow rate of the stream to the specified value. The
+        temperature is recalculated when it is next used.
 
         :param H: The new enthalpy flow rate value. [kWh/h]
         """
 
         self._Hfr = Hfr
-        self._T = self._calculate_T(Hfr)
+        self._H_stale = False
+        self._T_stale = True
 
     @property
     def T(self):
         """
-        Get the temperature of the stream.
+        Get the temperature of the stream. If the enthalpy flow rate was set
+        last, the temperature is calculated from it and kept until the stream
+        changes.
 
         :returns: Temperature. [°C]
         """
 
+        if self._T_stale:
+            self._T = self._calculate_T(self._Hfr)
+            self._T_stale = False
         return self._T
 
     @T.setter
     def T(self, T):
         """
-        Set the temperature of the stream to the specified value, and
-        recalculate it's enthalpy.
+        Set the temperature of the stream to the specified value. The
+        enthalpy flow rate is recalculated when it is next used.
 
         :param T: Temperature. [°C]
         """
 
         self._T = T
-        self._Hfr = self._calculate_Hfr(T)
+        self._T_stale = False
+        self._H_stale = True
 
     @property
     def HHV(self):
@@ -1603,7 +1865,9 @@ class MaterialStream(Object):
         self._compound_mfrs = self._compound_mfrs * 0.0
         self._P = 1.0
         self._T = 25.0
-        self._H = 0.0
+        self._T_stale = False
+        self._Hfr = 0.0
+        self._H_stale = False
 
     def get_assay(self):
         """
@@ -1633,7 +1897,7 @@ class MaterialStream(Object):
         :returns: Mass flow rate. [kg/h]
         """
 
-        if compound in self.material.compounds:
+        if compound in self.material._compound_indices:
             return self._compound_mfrs[
                 self.material.get_compound_index(compound)]
         else:
@@ -1719,6 +1983,85 @@ class MaterialStream(Object):
                 stoich.element_mass_fraction(formula, element)
         return result
 
+    def add_to(self, other):
+        """
+        Add 'other' to this stream (self), modifying self. The enthalpy flow
+        rate of self is updated directly, and its temperature is only
+        recalculated when it is next used.
+
+        :param other: Can can be one of the following:
+                 1. MaterialStream
+                    'other' is added to self.
+                 2. tuple: (compound, mass flow rate)
+                    The specified mass flow rate of the specified compound \
+                    is added to self, assuming the added material has the \
+                    same temperature as self.
+                 3. tuple: (compound, mass flow rate, temperature)
+                    The specified mass flow rate of the specified compound \
+                    at the specified temperature is added to self.
+        """
+
+        # Add another stream.
+        if type(other) is MaterialStream:
+            Hfr = self.Hfr + other.Hfr
+            if self.material == other.material:  # Streams of same material.
+                if self.isCoal or other.isCoal:
+                    HHV = 0
+                    if self.HHV:
+                        HHV += self.HHV * self.mfr
+                    if other.HHV:
+                        HHV += other.HHV * other.mfr
+                    HHV /= self.mfr + other.mfr
+                    self._compound_mfrs += other._compound_mfrs
+                    self.isCoal = True
+                    self.HHV = HHV
+                else:
+                    self._compound_mfrs += other._compound_mfrs
+            else:  # Streams of different materials.
+                indices = self.material._compound_indices
+                for compound in other.material.compounds:
+                    if compound not in indices:
+                        raise Exception("Streams of '" + other.material.name +
+                                        "' cannot be added to streams of '" +
+                                        self.material.name +
+                                        "'. The compound '" + compound +
+                                        "' was not found in '" +
+                                        self.material.name + "'.")
+                for compound in other.material.compounds:
+                    mfr = other.get_compound_mfr(compound)
+                    self._compound_mfrs[indices[compound]] += mfr
+                    self._update_HHV(compound, mfr)
+            self._Hfr = Hfr
+            self._T_stale = True
+
+        # Add the specified mass flow rate of the specified compound.
+        elif self._is_compound_mfr_tuple(other):
+            compound = other[0]
+            index = self.material.get_compound_index(compound)
+            mfr = other[1]
+            if not self._H_stale:
+                self._Hfr += self.material.get_compound_handle(compound).H(
+                    self.T, mfr)
+            self._compound_mfrs[index] += mfr
+            self._update_HHV(compound, mfr)
+
+        # Add the specified mass flow rate of 'compound' at the specified
+        # temperature.
+        elif self._is_compound_mfr_temperature_tuple(other):
+            compound = other[0]
+            index = self.material.get_compound_index(compound)
+            mfr = other[1]
+            temperature = other[2]
+            Hfr = self.Hfr + self.material.get_compound_handle(compound).H(
+                temperature, mfr)
+            self._compound_mfrs[index] += mfr
+            self._Hfr = Hfr
+            self._T_stale = True
+
+        # If not one of the above, it must be an invalid argument.
+        else:
+            raise TypeError("Invalid addition argument.")
+
     def extract(self, other):
         """
         Extract 'other' from this stream, modifying this stream and returning
@@ -1773,7 +2116,7 @@ class MaterialStream(Object):
         fraction_to_subtract = mfr / self.mfr
         result = MaterialStream(
             self.material, self._compound_mfrs *
-            fraction_to_subtract, self._P, self._T)
+            fraction_to_subtract, self._P, self.T)
 
         self._compound_mfrs = self._compound_mfrs * \
             (1.0 - fraction_to_subtract)
@@ -1784,7 +2127,7 @@ class MaterialStream(Object):
     def _extract_compound(self, compound):
         result = self.material.create_stream()
 
-        if compound not in self.material.compounds:
+        if compound not in self.material._compound_indices:
             return result
 
         index = self.material.get_compound_index(compound)
@@ -1816,7 +2159,7 @@ class MaterialStream(Object):
             self.HHV = HHV
 
     def _extract_compound_mfr(self, compound, mfr):
-        if compound not in self.material.compounds:
+        if compound not in self.material._compound_indices:
             return self.material.create_stream()
 
         index = self.material.get_compound_index(compound)
@@ -1825,9 +2168,10 @@ class MaterialStream(Object):
                 "compound mass flow rate larger than what the stream "
                 "contains.")
 
+        T = self.T
         self._compound_mfrs[index] = self._compound_mfrs[index] - mfr
         self._update_HHV(compound, -mfr)
-        self.T = self.T
+        self.T = T
 
         result = self.material.create_stream(P=self._P, T=self._T)
         result += (compound, mfr)
@@ -1845,6 +2189,36 @@ class MaterialStream(Object):
         return result
 
 
+def _calculate_T_secant(calculate_H, H, T, tolerance, max_iterations):
+    """
+    Calculate the temperature at which an enthalpy function has the
+    specified value using a secant algorithm. This is used when the enthalpy
+    is not calculated from the thermochemical data of the compounds.
+
+    :param calculate_H: Function that calculates the enthalpy at a
+      temperature.
+    :param H: The enthalpy value.
+    :param T: [°C] Initial guess of the temperature.
+    :param tolerance: [°C] The solution is accepted when a step is smaller
+      than this.
+    :param max_iterations: The maximum number of iterations.
+
+    :returns: [°C] temperature
+    """
+
+    T0, T1 = T, T + 10.0
+    y0, y1 = calculate_H(T0) - H, calculate_H(T1) - H
+    for i in range(max_iterations):
+        if y1 == y0:
+            break
+        T0, T1 = T1, T1 - y1 * (T1 - T0) / (y1 - y0)
+        y0, y1 = y1, calculate_H(T1) - H
+        if abs(T1 - T0) <= tolerance:
+            break
+
+    return T1
+
+
 def _get_default_data_path():
     module_path = os.path.dirname(sys.modules[__name__].__file__)
     data_path = os.path.join(module_path, r"../data")
@@ -46,6 +46,39 @@ class ThermoMaterialUnitTester(unittest.TestCase):
         self.assertEqual(self.m.get_compound_index("Al2O3[S]"), 0)
         self.assertEqual(self.m.get_compound_index("Fe3O4[Salpha]"), 3)
         self.assertEqual(self.m.get_compound_index("TiO2[Srutile]"), 7)
+        self.assertRaises(ValueError, self.m.get_compound_index, "X[S]")
+        with self.assertRaises(TypeError):
+            self.m.compounds[0] = "TiO2[Srutile]"
+
+    def test_get_compound_indices(self):
+        self.assertEqual(
+            list(self.m.get_compound_indices(["TiO2[Srutile]", "Al2O3[S]"])),
+            [7, 0])
+        self.assertRaises(ValueError, self.m.get_compound_indices, ["X[S]"])
+
+    def test_get_compound_handles(self):
+        handles = self.m.get_compound_handles()
+        self.assertEqual(tuple(h.compound_string for h in handles),
+                         self.m.compounds)
+        self.assertIs(self.m.get_compound_handles(), handles)
+        self.assertIs(self.m.get_compound_handle("Fe3O4[Salpha]"), handles[3])
+        thermo.compounds["Al2O3"] = thermo.compounds["Al2O3"]
+        self.assertIsNot(self.m.get_compound_handles(), handles)
+        self.assertEqual(len(self.m.get_compound_phase_vector().H(25.0)),
+                         len(self.m.compounds))
+
+    def test_database(self):
+        database = thermo.ThermoDatabase.read_auxi(
+            thermo._get_default_data_path_())
+        m = Material("material", get_path(
+            __file__, 'data/thermomaterial.test.ilmenite.txt'),
+            database=database)
+        self.assertIs(m.get_compound_handles()[0]._phase,
+                      database["Al2O3"]._phases["S"])
+        package = m.create_package("IlmeniteA", 100.0, 1.0, 1000.0)
+        self.assertAlmostEqual(
+            package.H,
+            self.m.create_package("IlmeniteA", 100.0, 1.0, 1000.0).H)
 
     def test_create_empty_assay(self):
         empty_assay = self.m.create_empty_assay()
@@ -230,10 +263,61 @@ class ThermoMaterialPackageUnitTester(unittest.TestCase):
 
         self.assertEqual(pkg.mass, 1357.9)
         self.assertEqual(pkg.P, 0.8)
-        self.assertEqual(pkg.T, 147.99821390140727)
+        self.assertAlmostEqual(pkg.T, 147.99821390140727)
         self.assertEqual(pkg.H, self.ilm_pkg_a.H + thermo.H("Al2O3[S]", 500.0,
                                                             123.4))
 
+    def test_add_to(self):
+        """
+        Test whether add_to and the in-place add operator modify the package
+        to the same result as the add operator.
+        """
+
+        pkg = self.ilm_pkg_a + self.ilm_pkg_b
+        pkg_ip = self.ilm_pkg_a.clone()
+        pkg_ip.add_to(self.ilm_pkg_b)
+        self.assertAlmostEqual(pkg_ip.mass, pkg.mass)
+        self.assertAlmostEqual(pkg_ip.H, pkg.H)
+        self.assertTrue(pkg_ip._T_stale)
+        self.assertAlmostEqual(pkg_ip.T, pkg.T)
+        self.assertFalse(pkg_ip._T_stale)
+
+        pkg = self.ilm_pkg_a + ("Al2O3[S]", 123.4, 500.0)
+        pkg_ip = self.ilm_pkg_a.clone()
+        pkg_ip += ("Al2O3[S]", 123.4, 500.0)
+        self.assertEqual(pkg_ip.mass, pkg.mass)
+        self.assertEqual(pkg_ip.H, pkg.H)
+        self.assertAlmostEqual(pkg_ip.T, pkg.T)
+
+        pkg = self.ilm_pkg_a + ("Al2O3[S]", 123.4)
+        pkg_ip = self.ilm_pkg_a.clone()
+        pkg_ip += ("Al2O3[S]", 123.4)
+        self.assertEqual(pkg_ip.H, pkg.H)
+        self.assertEqual(pkg_ip.T, pkg.T)
+
+        mix_pkg = self.mix.create_package(None, 0.0)
+        mix_pkg_ip = mix_pkg
+        mix_pkg += self.ilm_pkg_a
+        mix_pkg += self.red_pkg_a
+        self.assertIs(mix_pkg, mix_pkg_ip)
+        self.assertAlmostEqual(mix_pkg.mass,
+                               self.ilm_pkg_a.mass + self.red_pkg_a.mass)
+        self.assertAlmostEqual(mix_pkg.T, 147.8339440141861)
+
+        self.assertRaises(Exception, self.ilm_pkg_a.add_to, self.red_pkg_a)
+        self.assertRaises(TypeError, self.ilm_pkg_a.add_to, 1.0)
+
+        # The array a package was created with is not changed in place.
+        compound_masses = self.ilm_pkg_a._compound_masses.copy()
+        expected = compound_masses.copy()
+        pkg_a = MaterialPackage(self.ilm, compound_masses, 0.8, 100.0)
+        pkg_b = MaterialPackage(self.ilm, compound_masses, 0.8, 100.0)
+        pkg_a += self.ilm_pkg_b
+        pkg_a *= 2.0
+        pkg_a += ("Al2O3[S]", 123.4)
+        self.assertTrue(np.all(compound_masses == expected))
+        self.assertTrue(np.all(pkg_b._compound_masses == expected))
+
     def test_extract_1(self):
         pkg = self.ilm_pkg_a.clone()
         mass = 432.1
@@ -311,6 +395,23 @@ class ThermoMaterialPackageUnitTester(unittest.TestCase):
         self.assertEqual(mul2Package.T, pkg.T)
         self.assertAlmostEqual(mul2Package.H, pkg.H * 123.4 - 6.0E-11)
 
+    def test_in_place_multiply_operator(self):
+        pkg = self.ilm_pkg_a.clone()
+        T = pkg.T
+        pkg *= 123.4
+        self.assertAlmostEqual(pkg.mass, self.ilm_pkg_a.mass * 123.4)
+        self.assertAlmostEqual(pkg.H, self.ilm_pkg_a.H * 123.4)
+        self.assertEqual(pkg.T, T)
+
+        pkg *= 0.0
+        self.assertEqual(pkg.mass, 0.0)
+        self.assertEqual(pkg.H, 0.0)
+
+        def multiply_negative():
+            pkg = self.ilm_pkg_a.clone()
+            pkg *= -1.0
+        self.assertRaises(Exception, multiply_negative)
+
     def test_clone(self):
         clone = self.ilm_pkg_a.clone()
 
@@ -344,6 +445,52 @@ class ThermoMaterialPackageUnitTester(unittest.TestCase):
         self.assertEqual(tempPackageA.H, H)
         self.assertAlmostEqual(tempPackageA.T, 121.42451286247233)
 
+    def test_set_H_tolerance(self):
+        tempPackageA = self.ilm_pkg_a.clone()
+        H = tempPackageA.H + 5.67
+        tempPackageA.T_tolerance = 1.0e-9
+        tempPackageA.H = H
+
+        self.assertAlmostEqual(tempPackageA._calculate_H(tempPackageA.T), H,
+                               places=9)
+
+        tempPackageA.T_max_iterations = 0
+        tempPackageA.H = H + 1.0
+        self.assertRaises(Exception, getattr, tempPackageA, 'T')
+
+        tempPackageA = self.ilm_pkg_a.clone()
+        tempPackageA.H = self.ilm_pkg_a.H - 100.0
+        self.assertRaises(Exception, getattr, tempPackageA, 'T')
+
+    def test_lazy_T_H(self):
+        """
+        Test whether T and H are only calculated from each other when they
+        are used, and are kept until the package changes.
+        """
+
+        package = self.ilm.create_package("IlmeniteA", 1234.5, 0.8, 100.0)
+        self.assertTrue(package._H_stale)
+        H = package.H
+        self.assertFalse(package._H_stale)
+        self.assertEqual(H, package._calculate_H(100.0))
+
+        package.H = H + 5.67
+        self.assertTrue(package._T_stale)
+        self.assertEqual(package.H, H + 5.67)
+        T = package.T
+        self.assertFalse(package._T_stale)
+        self.assertAlmostEqual(package._calculate_H(T), H + 5.67)
+
+        package.T = 100.0
+        self.assertTrue(package._H_stale)
+        self.assertAlmostEqual(package.H, H)
+
+        # Changing the masses before the temperature was calculated must not
+        # affect the temperature calculated from the enthalpy.
+        package.H = H + 5.67
+        package.extract(("Al2O3[S]", 1.0))
+        self.assertAlmostEqual(package.T, T)
+
     def test_get_H(self):
         self.assertEqual(self.ilm_pkg_a.H, self.ilm_pkg_a._H)
 
@@ -11,6 +11,9 @@ from auxi.core.time_test import ClockUnitTester
 
 from auxi.tools.chemistry.stoichiometry_test import StoichFunctionTester
 from auxi.tools.chemistry.thermochemistry_test import ThermoFunctionTester
+from auxi.tools.chemistry.thermochemistry_test import PhaseTester
+from auxi.tools.chemistry.thermochemistry_test import CompoundRegistryTester
+from auxi.tools.chemistry.thermochemistry_test import ThermoDatabaseTester
 from auxi.tools.materialphysicalproperties.core_test import DataSetTester
 from auxi.tools.materialphysicalproperties.idealgas_test \
     import BetaTTester, RhoTTester, RhoTPTester, RhoTPxTester
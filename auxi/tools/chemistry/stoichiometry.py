@@ -6,7 +6,10 @@ calculations.
 
 import collections
 import functools
+import re
+import weakref
 
+import numpy
 import parsimonious
 
 from auxi.core.objects import Object
@@ -73,19 +76,35 @@ def count_with_multiplier(groups, multiplier):
 class Group:
     """ Represent a part of a compound formula
 
+    Groups are immutable, and their element counts are calculated once.
+
     :param group: iterable of Group/Element parts
     :param multiplier: multiplier in subscript or prefix of group
     :param dotted: True of the group is like '.2H2O'
 
     """
 
+    __slots__ = ('group', 'multiplier', 'dotted', '_count')
+
     def __init__(self, group, multiplier=1, dotted=False):
-        self.group = group
-        self.multiplier = multiplier
-        self.dotted = dotted
+        object.__setattr__(self, 'group', tuple(group))
+        object.__setattr__(self, 'multiplier', multiplier)
+        object.__setattr__(self, 'dotted', dotted)
+        object.__setattr__(self, '_count', None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            "'{}' objects are immutable.".format(type(self).__name__))
+
+    def __reduce__(self):
+        return (type(self), (self.group, self.multiplier, self.dotted))
 
     def count(self):
-        return count_with_multiplier(self.group, self.multiplier)
+        if self._count is None:
+            object.__setattr__(
+                self, '_count',
+                dict(count_with_multiplier(self.group, self.multiplier)))
+        return collections.defaultdict(float, self._count)
 
     def __repr__(self):
         return "Group({}, multiplier={}, dotted={})".format(self.group,
@@ -96,24 +115,50 @@ class Group:
 class Compound:
     """ Represents a full compound formula
 
+    Compounds are immutable, and their element counts and molar mass are
+    calculated once. parse_compound returns the same instance for the same
+    formula, so do not create them directly.
+
     :param group: iterable of Group/Element
     :param dottedgroup: A Group if there is a .H2O part, None otherwise
     :param phase: The phase if there is a [phase] part, None otherwise
 
     """
 
+    __slots__ = ('group', 'phase', '_count', '_molar_mass', '__weakref__')
+
     def __init__(self, group, dottedgroup=None, phase=None):
-        self.group = [group]
         if dottedgroup:
-            self.group.append(dottedgroup)
-        self.phase = phase
+            object.__setattr__(self, 'group', (group, dottedgroup))
+        else:
+            object.__setattr__(self, 'group', (group,))
+        object.__setattr__(self, 'phase', phase or None)
+        object.__setattr__(self, '_count', None)
+        object.__setattr__(self, '_molar_mass', None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            "'{}' objects are immutable.".format(type(self).__name__))
+
+    def __reduce__(self):
+        return (type(self), self.group[:1] +
+                (self.group[1] if len(self.group) > 1 else None,
+                 self.phase))
 
     def count(self):
-        return count_with_multiplier(self.group, multiplier=1)
+        if self._count is None:
+            object.__setattr__(
+                self, '_count',
+                dict(count_with_multiplier(self.group, multiplier=1)))
+        return collections.defaultdict(float, self._count)
 
     def molar_mass(self):
-        return sum(_element_dictionary_[element].molar_mass*count
-                   for element, count in self.count().items())
+        if self._molar_mass is None:
+            object.__setattr__(
+                self, '_molar_mass',
+                sum(_element_dictionary_[element].molar_mass*count
+                    for element, count in self.count().items()))
+        return self._molar_mass
 
     def __repr__(self):
         return "Compound({}, {})".format(self.group, self.phase)
@@ -178,11 +223,123 @@ grammar = parsimonious.grammar.Grammar(
     """)
 
 
-@functools.lru_cache()
+_element_pattern = re.compile(r"([A-Z][a-z]*)([0-9]*)")
+_number_pattern = re.compile(r"[0-9]*")
+_phase_pattern = re.compile(r"\[([A-Za-z0-9]+)\]")
+
+
+def _parse_group_(string, position):
+    """
+    Parse a group of a compound formula without using the grammar.
+
+    :param string: Compound formula.
+    :param position: Position in the string where the group starts.
+
+    :returns: The Group and the position after it, or None if the string
+      cannot be parsed here.
+    """
+
+    group = []
+    length = len(string)
+    while position < length:
+        if string[position] == '(':
+            result = _parse_group_(string, position + 1)
+            if result is None:
+                return None
+            subgroup, position = result
+            if position >= length or string[position] != ')':
+                return None
+            number = _number_pattern.match(string, position + 1)
+            position = number.end()
+            group.append(Group([subgroup], int(number.group() or 1)))
+        else:
+            match = _element_pattern.match(string, position)
+            if match is None:
+                break
+            symbol, number = match.groups()
+            if symbol not in _element_dictionary_:
+                return None
+            element = _element_dictionary_[symbol]
+            group.append(Group([element], int(number)) if number else element)
+            position = match.end()
+
+    if len(group) == 0:
+        return None
+    return Group(group), position
+
+
+def _parse_compound_fast_(string):
+    """
+    Parse a compound formula with a hand-written parser that produces the
+    same objects as the grammar.
+
+    :param string: Compound formula, e.g. 'CuSO4.5H2O[S1]'.
+
+    :returns: Compound, or None if the formula is not supported.
+    """
+
+    result = _parse_group_(string, 0)
+    if result is None:
+        return None
+    group, position = result
+
+    dottedgroup = None
+    if position < len(string) and string[position] == '.':
+        number = _number_pattern.match(string, position + 1)
+        result = _parse_group_(string, number.end())
+        if result is None:
+            return None
+        subgroup, position = result
+        dottedgroup = Group([subgroup], int(number.group() or 1),
+                            dotted=True)
+
+    phase = None
+    match = _phase_pattern.match(string, position)
+    if match is not None:
+        phase = match.group(1)
+        position = match.end()
+
+    if position != len(string):
+        return None
+    return Compound(group, dottedgroup, phase)
+
+
+# Every compound that is still referenced is interned here, so that all
+# users of the same formula share one instance, even after it has been
+# evicted from the parse cache.
+_compound_instances = weakref.WeakValueDictionary()
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_compound_(string):
+    compound = _compound_instances.get(string)
+    if compound is not None:
+        return compound
+
+    compound = _parse_compound_fast_(string)
+    if compound is None:
+        # Unsupported and invalid formulas are left to the grammar, which
+        # also raises the appropriate exception.
+        visitor = CompoundVisitor()
+        parsed_tree = grammar.parse(string)
+        compound = visitor.visit(parsed_tree)
+    return _compound_instances.setdefault(string, compound)
+
+
 def parse_compound(string):
-    visitor = CompoundVisitor()
-    parsed_tree = grammar.parse(string)
-    return visitor.visit(parsed_tree)
+    """
+    Parse a compound formula.
+
+    Leading and trailing whitespace is ignored, and the same Compound
+    instance is returned for the same formula.
+
+    :param string: Formula and phase of a compound, e.g. 'Fe2O3[S1]'. The
+      phase may be omitted.
+
+    :returns: Compound.
+    """
+
+    return _parse_compound_(string.strip())
 
 
 def amount(compound, mass):
@@ -292,6 +449,57 @@ def convert_compound(mass, source, target, element):
         return mass * source_mass_fraction / target_mass_fraction
 
 
+def conversion_factors(sources, targets, elements):
+    """
+    Calculate the factors to convert masses of source compounds to masses of
+    target compounds, each using an element as basis.
+
+    :param sources: List of formulas and phases of the original compounds,
+      e.g. ['Fe2O3[S1]', 'SiO2'].
+    :param targets: List of formulas and phases of the target compounds,
+      e.g. ['Fe[S1]', 'Si'].
+    :param elements: List of elements to use as basis for the conversions,
+      e.g. ['Fe', 'Si'].
+
+    :returns: Array of the target masses per unit mass of the sources.
+    """
+
+    if not len(sources) == len(targets) == len(elements):
+        raise Exception(
+            "The number of sources, targets and elements must be the same.")
+
+    result = numpy.zeros(len(sources))
+    for i, (source, target, element) in enumerate(zip(sources, targets,
+                                                      elements)):
+        target_mass_fraction = element_mass_fraction(target, element)
+        if target_mass_fraction != 0.0:
+            result[i] = (element_mass_fraction(source, element) /
+                         target_mass_fraction)
+    return result
+
+
+def convert_compounds(masses, sources, targets, elements):
+    """
+    Convert arrays of masses of source compounds to the target compounds,
+    each using an element as basis.
+
+    :param masses: [kg] Array of source compound masses with a column per
+      conversion, e.g. a row per sample.
+    :param sources: List of formulas and phases of the original compounds,
+      e.g. ['Fe2O3[S1]', 'SiO2'].
+    :param targets: List of formulas and phases of the target compounds,
+      e.g. ['Fe[S1]', 'Si'].
+    :param elements: List of elements to use as basis for the conversions,
+      e.g. ['Fe', 'Si'].
+
+    :returns: [kg] Array of target compound masses with the same shape as
+      masses.
+    """
+
+    factors = conversion_factors(sources, targets, elements)
+    return numpy.asarray(masses) * factors
+
+
 def element_mass_fraction(compound, element):
     """
     Determine the mass fraction of an element in a chemical compound.
@@ -398,6 +606,131 @@ def stoichiometry_coefficients(compound, elements):
     return [stoichiometry[element] for element in elements]
 
 
+def stoichiometry_matrix(compounds, elements):
+    """
+    Determine the stoichiometry coefficients of the specified elements in
+    each of the specified chemical compounds.
+
+    :param compounds: List of compound formulas and phases, e.g.
+      ['Fe2O3[S1]', 'SiO2'].
+    :param elements: List of elements, e.g. ['Si', 'O', 'Fe'].
+
+    :returns: Matrix of stoichiometry coefficients with a row per compound
+      and a column per element.
+    """
+
+    result = numpy.zeros((len(compounds), len(elements)))
+    for i, compound in enumerate(compounds):
+        result[i] = stoichiometry_coefficients(compound, elements)
+    return result
+
+
+def molar_masses(compounds):
+    """
+    Determine the molar masses of a list of chemical compounds.
+
+    :param compounds: List of compound formulas and phases, e.g.
+      ['Fe2O3[S1]', 'SiO2'].
+
+    :returns: Array of molar masses. [kg/kmol]
+    """
+
+    return _molar_mass_vector_(tuple(compounds)).copy()
+
+
+@functools.lru_cache(maxsize=256)
+def _molar_mass_vector_(compounds):
+    result = numpy.array([molar_mass(compound) for compound in compounds],
+                         dtype=float)
+    result.flags.writeable = False
+    return result
+
+
+def amounts_array(compounds, masses):
+    """
+    Calculate the amounts from arrays of compound masses.
+
+    :param compounds: List of compound formulas and phases, e.g.
+      ['SiO2', 'FeO'].
+    :param masses: [kg] Array with a column per compound, e.g. a row per
+      sample.
+
+    :returns: [kmol] Array with the same shape as masses.
+    """
+
+    return numpy.asarray(masses) / _molar_mass_vector_(tuple(compounds))
+
+
+def amount_fractions_array(compounds, masses):
+    """
+    Calculate the mole fractions from arrays of compound masses.
+
+    :param compounds: List of compound formulas and phases, e.g.
+      ['SiO2', 'FeO'].
+    :param masses: [kg] Array with a column per compound, e.g. a row per
+      sample.
+
+    :returns: [mole fractions] Array with the same shape as masses.
+    """
+
+    n = amounts_array(compounds, masses)
+    return n / n.sum(axis=-1, keepdims=True)
+
+
+def masses_array(compounds, amounts):
+    """
+    Calculate the masses from arrays of compound amounts.
+
+    :param compounds: List of compound formulas and phases, e.g.
+      ['SiO2', 'FeO'].
+    :param amounts: [kmol] Array with a column per compound, e.g. a row per
+      sample.
+
+    :returns: [kg] Array with the same shape as amounts.
+    """
+
+    return numpy.asarray(amounts) * _molar_mass_vector_(tuple(compounds))
+
+
+def mass_fractions_array(compounds, amounts):
+    """
+    Calculate the mass fractions from arrays of compound amounts.
+
+    :param compounds: List of compound formulas and phases, e.g.
+      ['SiO2', 'FeO'].
+    :param amounts: [kmol] Array with a column per compound, e.g. a row per
+      sample.
+
+    :returns: [mass fractions] Array with the same shape as amounts.
+    """
+
+    m = masses_array(compounds, amounts)
+    return m / m.sum(axis=-1, keepdims=True)
+
+
+def element_mass_fraction_matrix(compounds, elements):
+    """
+    Determine the mass fractions of the specified elements in each of the
+    specified chemical compounds.
+
+    The mass of each element in a set of compound masses can be calculated
+    from the matrix product of the masses and this matrix.
+
+    :param compounds: List of compound formulas and phases, e.g.
+      ['Fe2O3[S1]', 'SiO2'].
+    :param elements: List of elements, e.g. ['Si', 'O', 'Fe'].
+
+    :returns: Matrix of element mass fractions with a row per compound and a
+      column per element.
+    """
+
+    coefficients = stoichiometry_matrix(compounds, elements)
+    element_masses = numpy.array([molar_mass(element)
+                                  for element in elements], dtype=float)
+    formula_masses = molar_masses(compounds)
+    return coefficients * element_masses / formula_masses[:, numpy.newaxis]
+
+
 # Initialise the module.
 # Create all the elements of the periodic table and add them to the
 # element dictionary.
@@ -4,8 +4,11 @@ This module contains all the code used to test the testee module.
 """
 
 
+import pickle
 import unittest
 
+import numpy
+
 from auxi.tools.chemistry import stoichiometry as testee
 
 
@@ -99,6 +102,38 @@ class StoichFunctionTester(unittest.TestCase):
 
         self.assertEqual(func(ms), xs)
 
+    def test_amounts_array(self):
+        """
+        Test whether compound amounts are calculated correctly from an array
+        of masses.
+        """
+
+        func = testee.amounts_array
+
+        compounds = ['SiO2', 'CaO', 'MgO', 'FeO']
+        ms = numpy.array([[1.0, 2.0, 3.0, 4.0], [0.5, 0.0, 1.5, 2.5]])
+        ns = func(compounds, ms)
+        self.assertEqual(ns.shape, ms.shape)
+        for m_row, n_row in zip(ms, ns):
+            n_dict = testee.amounts(dict(zip(compounds, m_row)))
+            self.assertEqual(list(n_row), [n_dict[c] for c in compounds])
+
+    def test_amount_fractions_array(self):
+        """
+        Test whether compound amount fractions are calculated correctly from
+        an array of masses.
+        """
+
+        func = testee.amount_fractions_array
+
+        compounds = ['SiO2', 'CaO', 'MgO', 'FeO']
+        ms = numpy.array([[1.0, 2.0, 3.0, 4.0], [0.5, 0.0, 1.5, 2.5]])
+        xs = func(compounds, ms)
+        for m_row, x_row in zip(ms, xs):
+            x_dict = testee.amount_fractions(dict(zip(compounds, m_row)))
+            numpy.testing.assert_allclose(
+                x_row, [x_dict[c] for c in compounds], rtol=1.0e-14)
+
     def test_mass(self):
         """
         Test whether the mass of a compound is calculated correctly.
@@ -138,6 +173,38 @@ class StoichFunctionTester(unittest.TestCase):
 
         self.assertEqual(func(ns), ys)
 
+    def test_masses_array(self):
+        """
+        Test whether compound masses are calculated correctly from an array
+        of amounts.
+        """
+
+        func = testee.masses_array
+
+        compounds = ['SiO2', 'CaO', 'MgO', 'FeO']
+        ns = numpy.array([[1.0, 2.0, 3.0, 4.0], [0.5, 0.0, 1.5, 2.5]])
+        ms = func(compounds, ns)
+        self.assertEqual(ms.shape, ns.shape)
+        for n_row, m_row in zip(ns, ms):
+            m_dict = testee.masses(dict(zip(compounds, n_row)))
+            self.assertEqual(list(m_row), [m_dict[c] for c in compounds])
+
+    def test_mass_fractions_array(self):
+        """
+        Test whether compound mass fractions are calculated correctly from an
+        array of amounts.
+        """
+
+        func = testee.mass_fractions_array
+
+        compounds = ['SiO2', 'CaO', 'MgO', 'FeO']
+        ns = numpy.array([[1.0, 2.0, 3.0, 4.0], [0.5, 0.0, 1.5, 2.5]])
+        ys = func(compounds, ns)
+        for n_row, y_row in zip(ns, ys):
+            y_dict = testee.mass_fractions(dict(zip(compounds, n_row)))
+            numpy.testing.assert_allclose(
+                y_row, [y_dict[c] for c in compounds], rtol=1.0e-14)
+
     def test_convert_compound(self):
         """
         Test whether compound conversions are calculated correctly.
@@ -160,6 +227,30 @@ class StoichFunctionTester(unittest.TestCase):
         self.assertAlmostEqual(m_TiO2, 526.4365876519838)
         self.assertAlmostEqual(m_FeO + m_TiO2, m_FeTiO3)
 
+    def test_convert_compounds(self):
+        """
+        Test whether arrays of compound masses are converted correctly.
+        """
+
+        func = testee.convert_compounds
+
+        sources = ['Fe2O3', 'Fe', 'SiO2', 'CaO']
+        targets = ['Fe', 'FeO', 'Si', 'Fe']
+        elements = ['Fe', 'Fe', 'Si', 'Fe']
+        masses = numpy.array([[1.0, 2.0, 3.0, 4.0], [0.5, 0.0, 1.5, 2.5]])
+        result = func(masses, sources, targets, elements)
+        self.assertEqual(result.shape, masses.shape)
+        for m_row, r_row in zip(masses, result):
+            numpy.testing.assert_allclose(
+                r_row,
+                [testee.convert_compound(m, source, target, element)
+                 for m, source, target, element in
+                 zip(m_row, sources, targets, elements)],
+                rtol=1.0e-14)
+
+        self.assertRaises(Exception, func, masses, sources, targets,
+                          elements[:3])
+
     def test_element_mass_fraction(self):
         """
         Test whether an element mass fraction is calculated correctly.
@@ -232,6 +323,54 @@ class StoichFunctionTester(unittest.TestCase):
             self.assertEqual(testee.parse_compound(compound).phase, phase)
 
 
+    def test_parse_compound(self):
+        """
+        Test whether compound formulas are parsed to the same result as the
+        grammar, and whether surrounding whitespace is ignored.
+        """
+
+        def parse_with_grammar(string):
+            visitor = testee.CompoundVisitor()
+            return visitor.visit(testee.grammar.parse(string))
+
+        compounds = ['FeO', 'Fe2O3[S1]', 'Ca(OH)2', '(FeO)(Fe2O3)',
+                     'CuSO4.5H2O[S1]', 'MgCO3.CaCO3', 'Fe((OH)2)3.2H2O',
+                     'CaAl2(Si2O7)(OH)2.H2O']
+        for compound in compounds:
+            parsed = testee.parse_compound(compound)
+            self.assertEqual(repr(parsed),
+                             repr(parse_with_grammar(compound)))
+            self.assertEqual(parsed.count(),
+                             parse_with_grammar(compound).count())
+
+        self.assertIs(testee.parse_compound(' Fe2O3[S1]\n'),
+                      testee.parse_compound('Fe2O3[S1]'))
+        self.assertRaises(Exception, testee.parse_compound, 'Xx2')
+        self.assertRaises(Exception, testee.parse_compound, 'Fe[S1]O')
+
+    def test_compound_instances(self):
+        """
+        Test whether parsed compounds are shared, immutable and return
+        independent element counts.
+        """
+
+        compound = testee.parse_compound('Ca(OH)2[S1]')
+        self.assertIs(compound, testee.parse_compound('Ca(OH)2[S1] '))
+        self.assertIsNone(testee.parse_compound('Ca(OH)2').phase)
+        self.assertRaises(AttributeError, setattr, compound, 'phase', 'L')
+        self.assertRaises(AttributeError, setattr, compound.group[0],
+                          'multiplier', 2)
+
+        count = compound.count()
+        self.assertEqual(count['Fe'], 0.0)
+        count['Ca'] = 5.0
+        self.assertEqual(compound.count(), {'Ca': 1.0, 'O': 2.0, 'H': 2.0})
+        self.assertEqual(compound.molar_mass(), testee.molar_mass('Ca(OH)2'))
+
+        copy = pickle.loads(pickle.dumps(compound))
+        self.assertEqual(repr(copy), repr(compound))
+        self.assertEqual(copy.count(), compound.count())
+
     def test_stoichiometry_coefficient(self):
         """
         Test whether the stoichiometry coefficient of a specified element in a
@@ -278,6 +417,60 @@ class StoichFunctionTester(unittest.TestCase):
                               ['Al', 'Ca', 'Si', 'O', 'H']),
                          [2.0, 1.0, 2.0, 10.0, 4.0])
 
+    def test_stoichiometry_matrix(self):
+        """
+        Test whether the stoichiometry matrix of a list of compounds is
+        calculated correctly.
+        """
+
+        func = testee.stoichiometry_matrix
+
+        compounds = ['FeO', 'Fe2O3[S1]', 'Ca(OH)2']
+        elements = ['Fe', 'O', 'Ca', 'H', 'Si']
+        result = func(compounds, elements)
+        self.assertEqual(result.shape, (3, 5))
+        for i, compound in enumerate(compounds):
+            self.assertEqual(
+                list(result[i]),
+                testee.stoichiometry_coefficients(compound, elements))
+
+    def test_molar_masses(self):
+        """
+        Test whether the molar masses of a list of compounds are calculated
+        correctly.
+        """
+
+        func = testee.molar_masses
+
+        compounds = ['FeO', 'Fe2O3', 'SiO2', 'Ca(OH)2']
+        self.assertEqual(list(func(compounds)),
+                         [testee.molar_mass(c) for c in compounds])
+
+    def test_element_mass_fraction_matrix(self):
+        """
+        Test whether the element mass fraction matrix of a list of compounds
+        is calculated correctly, and whether it can be used for an element
+        balance.
+        """
+
+        func = testee.element_mass_fraction_matrix
+
+        compounds = ['FeO', 'Fe2O3[S1]', 'Ca(OH)2']
+        elements = ['Fe', 'O', 'Ca', 'H', 'Si']
+        result = func(compounds, elements)
+        for i, compound in enumerate(compounds):
+            self.assertAlmostEqual(
+                list(result[i]),
+                testee.element_mass_fractions(compound, elements))
+
+        masses = numpy.array([1.0, 2.0, 3.0])
+        element_masses = masses.dot(result)
+        self.assertAlmostEqual(sum(element_masses), sum(masses))
+        self.assertAlmostEqual(
+            element_masses[0],
+            sum(m * testee.element_mass_fraction(c, 'Fe')
+                for m, c in zip(masses, compounds)))
+
 
 if __name__ == '__main__':
     unittest.main()
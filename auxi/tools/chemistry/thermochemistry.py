@@ -4,16 +4,31 @@ This module provides classes and functions for doing thermochemical
 calculations.
 """
 
+import io
 import os
+import re
 import sys
 import glob
 import math
 import warnings
 import json
+import time
+import logging
+import functools
+import threading
+import concurrent.futures
+from multiprocessing import resource_tracker, shared_memory
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Mapping, MutableMapping
+
+import numpy
+import jsonpickle
 
 from auxi.core.objects import Object, NamedObject
 from auxi.core.helpers import get_path_relative_to_module as get_path
 from auxi.tools.chemistry.stoichiometry import molar_mass as mm
+from auxi.tools.chemistry.stoichiometry import _element_dictionary_
 from auxi.tools.physicalconstants import R
 
 
@@ -27,6 +42,33 @@ __email__ = 'johan.zietsman@ex-mente.co.za'
 __status__ = 'Planning'
 
 
+_logger = logging.getLogger(__name__)
+
+
+class _CompiledDataHandler(jsonpickle.handlers.BaseHandler):
+    """
+    A jsonpickle handler that leaves an object's compiled calculation data
+    out when it is written to a file. The compiled data is rebuilt by the
+    object's _init method after the object is read.
+    """
+
+    def flatten(self, obj, data):
+        for k, v in obj.__dict__.items():
+            if k in obj._compiled_attributes_ or callable(v):
+                continue
+            data[k] = self.context.flatten(v, reset=False)
+        return data
+
+    def restore(self, data):
+        cls = jsonpickle.unpickler.loadclass(data[jsonpickle.tags.OBJECT])
+        result = cls.__new__(cls)
+        for k, v in data.items():
+            if k == jsonpickle.tags.OBJECT:
+                continue
+            setattr(result, k, self.context.restore(v, reset=False))
+        return result
+
+
 class CpRecord(Object):
     """
     A heat capacity (Cp) equation record for a compound phase over a
@@ -141,6 +183,358 @@ class CpRecord(Object):
         return result
 
 
+class PhaseTable(Object):
+    """
+    A table of a compound phase's enthalpy and entropy on an evenly spaced
+    temperature grid, from which the phase's properties are interpolated.
+
+    Each grid interval is described by cubic Hermite polynomials that match
+    the analytically calculated enthalpy and entropy, and their temperature
+    derivatives, at the interval's end points. The heat capacity is the
+    derivative of the enthalpy polynomial. Intervals that contain a Cp record
+    boundary or the magnetic critical temperature are not interpolated, since
+    the heat capacity is not smooth there. The properties in these intervals
+    and outside the table are calculated analytically.
+
+    For an interval of width h, the interpolation error of the enthalpy is at
+    most h**4/384 times the largest fourth derivative of the enthalpy in the
+    interval. The actual largest errors are measured when the table is
+    created and stored in the errors dictionary.
+
+    :param phase: The phase to tabulate.
+    :param Tmin: [K] The table's minimum temperature.
+    :param Tmax: [K] The table's maximum temperature.
+    :param dT: [K] The grid interval.
+    """
+
+    def __init__(self, phase, Tmin, Tmax, dT=10.0):
+        count = max(1, int(math.ceil((Tmax - Tmin) / dT)))
+
+        self.Tmin = Tmin
+        """[K] The table's minimum temperature."""
+
+        self.Tmax = Tmin + count * dT
+        """[K] The table's maximum temperature."""
+
+        self.dT = dT
+        """[K] The grid interval."""
+
+        self._phase = phase
+        self._inverse_dT = 1.0 / dT
+
+        # Calculate the property values and derivatives at the grid points.
+        T = Tmin + dT * numpy.arange(count + 1)
+        H = phase._H_array(T) + phase.H_mag(T)
+        S = phase._S_array(T) + phase.S_mag(T)
+        Cp = phase._Cp_array(T) + phase.Cp_mag(T)
+
+        # Intervals in which the heat capacity is not smooth must be
+        # calculated analytically.
+        breaks = list(phase._Tmax_list)
+        if hasattr(phase, 'Tc_mag'):
+            breaks.append(phase.Tc_mag)
+        self._exact = [False] * count
+        for b in breaks:
+            k_break = int((b - Tmin) // dT)
+            for k in range(k_break - 1, k_break + 2):
+                if 0 <= k < count and T[k] <= b <= T[k+1]:
+                    self._exact[k] = True
+
+        self._H_polynomials = self._create_polynomials(H, Cp)
+        self._S_polynomials = self._create_polynomials(S, Cp / T)
+        self._H_coefficients = self._H_polynomials.tolist()
+        self._S_coefficients = self._S_polynomials.tolist()
+
+        self.errors = self._calculate_errors()
+        """[J/mol, J/mol/K] The largest absolute interpolation errors of the
+        enthalpy, entropy and heat capacity in the table."""
+
+    def _create_polynomials(self, y, d):
+        """
+        Create the cubic Hermite polynomials for the grid intervals.
+
+        :param y: Array of values at the grid points.
+        :param d: Array of derivatives at the grid points.
+
+        :returns: Array with the coefficients of each interval's polynomial,
+          in order of increasing power of the distance from the interval's
+          start.
+        """
+
+        h = self.dT
+        slope = (y[1:] - y[:-1]) / h
+        c2 = (3.0*slope - 2.0*d[:-1] - d[1:]) / h
+        c3 = (d[:-1] + d[1:] - 2.0*slope) / h**2
+        return numpy.column_stack((y[:-1], d[:-1], c2, c3))
+
+    def _calculate_errors(self):
+        """
+        Determine the largest interpolation errors by comparing interpolated
+        and analytically calculated values inside each interval.
+
+        :returns: Dictionary of the largest errors of H, S and Cp.
+        """
+
+        phase = self._phase
+        count = len(self._exact)
+        starts = self.Tmin + self.dT * numpy.arange(count)
+        T = (starts[:, numpy.newaxis] +
+             self.dT * numpy.array([0.25, 0.5, 0.75])).ravel()
+        indices = numpy.repeat(numpy.arange(count), 3)
+        smooth = ~numpy.array(self._exact)[indices]
+        if not smooth.any():
+            return {'H': 0.0, 'S': 0.0, 'Cp': 0.0}
+        T = T[smooth]
+        indices = indices[smooth]
+        H = phase._H_array(T) + phase.H_mag(T)
+        S = phase._S_array(T) + phase.S_mag(T)
+        Cp = phase._Cp_array(T) + phase.Cp_mag(T)
+        return {
+            'H': float(abs(self._evaluate(T, indices, 'H') - H).max()),
+            'S': float(abs(self._evaluate(T, indices, 'S') - S).max()),
+            'Cp': float(abs(self._evaluate(T, indices, 'Cp') - Cp).max())}
+
+    def _evaluate(self, T, indices, prop):
+        """
+        Evaluate the interpolating polynomials for arrays of temperatures and
+        interval indices.
+        """
+
+        if prop == 'S':
+            c = self._S_polynomials[indices]
+        else:
+            c = self._H_polynomials[indices]
+        x = T - (self.Tmin + self.dT * indices)
+        if prop == 'Cp':
+            return c[:, 1] + x*(2.0*c[:, 2] + x*3.0*c[:, 3])
+        return c[:, 0] + x*(c[:, 1] + x*(c[:, 2] + x*c[:, 3]))
+
+    def interval(self, T):
+        """
+        Determine the index of the table interval in which a temperature
+        falls.
+
+        :param T: [K] temperature
+
+        :returns: The interval index, or -1 if the temperature must be
+          calculated analytically.
+        """
+
+        if T < self.Tmin or T >= self.Tmax:
+            return -1
+        k = int((T - self.Tmin) * self._inverse_dT)
+        if self._exact[k]:
+            return -1
+        return k
+
+    def Cp(self, T, k):
+        """
+        Interpolate the heat capacity in the specified interval.
+
+        :param T: [K] temperature
+        :param k: Interval index.
+
+        :returns: [J/mol/K] Heat capacity.
+        """
+
+        c0, c1, c2, c3 = self._H_coefficients[k]
+        x = T - (self.Tmin + self.dT * k)
+        return c1 + x*(2.0*c2 + x*3.0*c3)
+
+    def H(self, T, k):
+        """
+        Interpolate the enthalpy in the specified interval.
+
+        :param T: [K] temperature
+        :param k: Interval index.
+
+        :returns: [J/mol] Enthalpy.
+        """
+
+        c0, c1, c2, c3 = self._H_coefficients[k]
+        x = T - (self.Tmin + self.dT * k)
+        return c0 + x*(c1 + x*(c2 + x*c3))
+
+    def S(self, T, k):
+        """
+        Interpolate the entropy in the specified interval.
+
+        :param T: [K] temperature
+        :param k: Interval index.
+
+        :returns: [J/mol/K] Entropy.
+        """
+
+        c0, c1, c2, c3 = self._S_coefficients[k]
+        x = T - (self.Tmin + self.dT * k)
+        return c0 + x*(c1 + x*(c2 + x*c3))
+
+    def evaluate(self, T, prop):
+        """
+        Calculate a property for an array of temperatures, interpolating in
+        the table where possible and calculating analytically elsewhere.
+
+        :param T: [K] temperature array
+        :param prop: The property to calculate: 'Cp', 'H' or 'S'.
+
+        :returns: Array of property values.
+        """
+
+        phase = self._phase
+        shape = T.shape
+        T = T.ravel()
+        indices = numpy.floor((T - self.Tmin) * self._inverse_dT)
+        inside = (T >= self.Tmin) & (T < self.Tmax)
+        indices = numpy.where(inside, indices, 0).astype(int)
+        inside &= ~numpy.array(self._exact)[indices]
+
+        result = numpy.empty(len(T))
+        result[inside] = self._evaluate(T[inside], indices[inside], prop)
+        outside = ~inside
+        if outside.any():
+            To = T[outside]
+            if prop == 'Cp':
+                result[outside] = phase._Cp_array(To) + phase.Cp_mag(To)
+            elif prop == 'H':
+                result[outside] = phase._H_array(To) + phase.H_mag(To)
+            else:
+                result[outside] = phase._S_array(To) + phase.S_mag(To)
+        return result.reshape(shape)
+
+
+def _solve_T_(H, Cp, target, T_bounds, H_bounds=None, tolerance=1.0e-6,
+              max_iterations=50, T_guess=None):
+    """
+    Calculate the temperature at which a monotonically increasing enthalpy
+    function has the specified value.
+
+    The solution is first bracketed between two of the specified bounds by
+    binary search, and is then found by Newton's method with the heat
+    capacity as derivative. Steps that leave the bracket are replaced by
+    bisection steps.
+
+    :param H: Function that calculates the enthalpy at a temperature.
+    :param Cp: Function that calculates the heat capacity at a temperature.
+    :param target: The enthalpy value.
+    :param T_bounds: [K] Sorted temperatures used to bracket the solution,
+      usually the boundaries of the Cp ranges.
+    :param H_bounds: The enthalpies at T_bounds. They are calculated when
+      needed if it is None.
+    :param tolerance: [K] The solution is accepted when a Newton step is
+      smaller than this.
+    :param max_iterations: The maximum number of Newton iterations.
+    :param T_guess: [K] An estimate of the solution, e.g. the previous
+      temperature. If it is specified, Newton's method starts here and the
+      bracket is narrowed by the iterations themselves. The bounds are only
+      used if this does not converge.
+
+    :returns: [K] temperature
+    """
+
+    if T_guess is not None:
+        T = _newton_T_(H, Cp, target, T_guess, 0.0, math.inf, tolerance,
+                       max_iterations)
+        if T is not None:
+            return T
+
+    if H_bounds is None:
+        H_bound = functools.lru_cache()(lambda i: H(T_bounds[i]))
+    else:
+        H_bound = H_bounds.__getitem__
+
+    # Find the bracket among the bounds.
+    last = len(T_bounds) - 1
+    if target < H_bound(0):
+        hi, H_hi = T_bounds[0], H_bound(0)
+        lo = hi / 2.0
+        H_lo = H(lo)
+        while H_lo > target:
+            if lo < 1.0e-3 or H_lo >= H_hi:
+                raise Exception('The enthalpy is below the range of the '
+                                'thermochemical data.')
+            hi, H_hi = lo, H_lo
+            lo = lo / 2.0
+            H_lo = H(lo)
+    elif target > H_bound(last):
+        lo, H_lo = T_bounds[last], H_bound(last)
+        hi = lo * 2.0
+        H_hi = H(hi)
+        while H_hi < target:
+            lo, H_lo = hi, H_hi
+            hi = hi * 2.0
+            H_hi = H(hi)
+    else:
+        i, j = 0, last
+        while j - i > 1:
+            k = (i + j) // 2
+            if H_bound(k) < target:
+                i = k
+            else:
+                j = k
+        lo, H_lo, hi, H_hi = T_bounds[i], H_bound(i), T_bounds[j], H_bound(j)
+
+    if H_hi > H_lo:
+        T = lo + (target - H_lo) * (hi - lo) / (H_hi - H_lo)
+    else:
+        T = (lo + hi) / 2.0
+
+    T = _newton_T_(H, Cp, target, T, lo, hi, tolerance, max_iterations)
+    if T is None:
+        raise Exception('The temperature calculation did not converge '
+                        'within {} iterations.'.format(max_iterations))
+    return T
+
+
+def _newton_T_(H, Cp, target, T, lo, hi, tolerance, max_iterations):
+    """
+    Calculate the temperature at which a monotonically increasing enthalpy
+    function has the specified value with a safeguarded Newton's method.
+
+    :param H: Function that calculates the enthalpy at a temperature.
+    :param Cp: Function that calculates the heat capacity at a temperature.
+    :param target: The enthalpy value.
+    :param T: [K] The initial temperature.
+    :param lo: [K] Temperature below the solution, or 0.0 if unknown.
+    :param hi: [K] Temperature above the solution, or infinity if unknown.
+    :param tolerance: [K] The solution is accepted when a Newton step is
+      smaller than this.
+    :param max_iterations: The maximum number of Newton iterations.
+
+    :returns: [K] temperature, or None if the calculation did not converge.
+    """
+
+    for iteration in range(max_iterations):
+        difference = H(T) - target
+        if difference == 0.0:
+            return T
+        if difference < 0.0:
+            lo = T
+        else:
+            hi = T
+        derivative = Cp(T)
+        if derivative > 0.0:
+            T_new = T - difference / derivative
+        else:
+            T_new = (lo + hi) / 2.0
+        if not lo <= T_new <= hi:
+            T_new = (lo + hi) / 2.0
+        if math.isinf(T_new):
+            T_new = T * 2.0
+        if abs(T_new - T) <= tolerance:
+            # Bisection steps towards 0 K also become small, e.g. when the
+            # enthalpy is below the range of the data. A small step is
+            # therefore only accepted if the enthalpy is within the
+            # tolerance of the target, or if the solution is bracketed by
+            # temperatures at which the enthalpy was calculated.
+            if abs(difference) <= tolerance * derivative or \
+                    (lo > 0.0 and hi < math.inf):
+                return T_new
+            return None
+        T = T_new
+
+    return None
+
+
 class Phase(NamedObject):
     """
     A phase of a chemical compound.
@@ -149,6 +543,15 @@ class Phase(NamedObject):
       the phase.
     """
 
+    _compiled_attributes_ = [
+        '_records', '_Tmax_list', '_H_starts', '_S_starts', '_Cp_extrapolated',
+        '_Tmaxes', '_Tmins', '_Tuppers', '_coefficients', '_exponents',
+        '_H_log', '_H_powers', '_S_log', '_S_powers', '_table',
+        '_T_bounds', '_H_bounds',
+        '_A_mag', '_B_mag', '_D_mag', '_factor_mag', '_Cp_mag_coefficients',
+        '_H_mag_coefficients', '_S_mag_coefficients', '_G_mag_coefficients']
+    """The attributes created by _compile, which are not written to file."""
+
     def __init__(self, dictionary):
         self.name = dictionary['Symbol']
         """The phase's name, e.g. solid, liquid, gas, etc."""
@@ -166,15 +569,15 @@ class Phase(NamedObject):
         """[J/mol/K] The standard entropy of the phase at Tref."""
 
         if 'magnetic' in dictionary:
-            self.Tc_mag = ['magnetic']['Tc']
+            self.Tc_mag = dictionary['magnetic']['Tc']
             """The critical temperature, which is the Curie temperature for
             ferromagnetic materials or the Neel temperature for
             antiferromagnetic materials."""
 
-            self.beta0_mag = ['magnetic']['beta0']
+            self.beta0_mag = dictionary['magnetic']['beta0']
             """The average magnetic moment per atom."""
 
-            self.p_mag = ['magnetic']['p']
+            self.p_mag = dictionary['magnetic']['p']
             """This value can be thought of as the fraction of the magnetic
             enthalpy absorbed above the critical. It depends on structure."""
 
@@ -190,17 +593,250 @@ class Phase(NamedObject):
         self._init()
 
     def _init(self):
-        if 'Tc_mag' in dir(self) and 'beta0_mag' in dir(self) and \
-           'p_mag' in dir(self):
-            self._A_mag = 79/(140*self.p_mag)
-            self._B_mag = (474/497)*(1/self.p_mag - 1)
-            self._D_mag = (518/1125) + (11692/15975)*(1/self.p_mag - 1)
+        if hasattr(self, 'Tc_mag') and hasattr(self, 'beta0_mag') and \
+           hasattr(self, 'p_mag'):
+            self._init_mag()
         else:
             self.Cp_mag = self.Zero_mag
             self.H_mag = self.Zero_mag
             self.S_mag = self.Zero_mag
             self.G_mag = self.Zero_mag
 
+        self._compile()
+
+    def _init_mag(self):
+        """
+        Precalculate the constants of the magnetic contribution functions.
+
+        Below the critical temperature (tau <= 1) each function has the form
+        k0 + k1/tau + k3*tau**3 + k9*tau**9 + k15*tau**15, and above it the
+        form m5/tau**5 + m15/tau**15 + m25/tau**25. The coefficients include
+        the division by D. The functions are multiplied by R*ln(beta0 + 1),
+        and by T for enthalpy and Gibbs energy.
+        """
+
+        self._A_mag = 79/(140*self.p_mag)
+        self._B_mag = (474/497)*(1/self.p_mag - 1)
+        self._D_mag = (518/1125) + (11692/15975)*(1/self.p_mag - 1)
+        self._factor_mag = R*math.log(self.beta0_mag + 1)
+
+        A = self._A_mag / self._D_mag
+        B = self._B_mag / self._D_mag
+        D = self._D_mag
+        self._Cp_mag_coefficients = (
+            0.0, 0.0, 2*B, 2*B/3, 2*B/5, 2/D, 2/(3*D), 2/(5*D))
+        self._H_mag_coefficients = (
+            0.0, -A, B/2, B/15, B/40, -1/(2*D), -1/(21*D), -1/(60*D))
+        self._S_mag_coefficients = (
+            -1.0, 0.0, 2*B/3, 2*B/27, 2*B/75,
+            -2/(5*D), -2/(45*D), -2/(125*D))
+        self._G_mag_coefficients = (
+            1.0, -A, -B/6, -B/135, -B/600,
+            -1/(10*D), -1/(315*D), -1/(1500*D))
+
+    def _calculate_mag(self, T, coefficients):
+        """
+        Evaluate a magnetic contribution function.
+
+        :param T: [K] temperature, or array of temperatures
+        :param coefficients: The function's coefficients, as calculated by
+          _init_mag.
+
+        :returns: The function's value, excluding the factor R*ln(beta0 + 1).
+        """
+
+        k0, k1, k3, k9, k15, m5, m15, m25 = coefficients
+        tau = T / self.Tc_mag
+
+        if type(tau) is numpy.ndarray:
+            t3 = tau**3
+            t9 = t3*t3*t3
+            u5 = tau**-5
+            u15 = u5*u5*u5
+            return numpy.where(
+                tau <= 1.0,
+                k0 + k1/tau + k3*t3 + k9*t9 + k15*t9*t3*t3,
+                m5*u5 + m15*u15 + m25*u15*u5*u5)
+        elif tau <= 1.0:
+            t3 = tau**3
+            t9 = t3*t3*t3
+            return k0 + k1/tau + k3*t3 + k9*t9 + k15*t9*t3*t3
+        else:
+            u5 = tau**-5
+            u15 = u5*u5*u5
+            return m5*u5 + m15*u15 + m25*u15*u5*u5
+
+    def _compile(self):
+        """
+        Compile the phase's Cp records into a form that is quick to evaluate.
+
+        The records are sorted by their maximum temperatures, their terms are
+        packed into coefficient and exponent matrices, and the enthalpy and
+        entropy accumulated up to the start of each record's range are
+        precalculated. Calculating a property then requires a search for the
+        applicable range and the evaluation of one record.
+        """
+
+        keys = sorted(self._Cp_records.keys(), key=float)
+
+        self._records = [self._Cp_records[k] for k in keys]
+        """The Cp records sorted by their maximum temperatures."""
+
+        self._Tmax_list = [float(k) for k in keys]
+        """[K] The sorted maximum temperatures of the Cp record ranges."""
+
+        # Calculate the enthalpy and entropy at the start of each range. The
+        # last item is the value at the maximum temperature of the last range.
+        self._H_starts = [self.DHref]
+        self._S_starts = [self.Sref]
+        for record in self._records:
+            self._H_starts.append(self._H_starts[-1] + record.H(record.Tmax))
+            self._S_starts.append(self._S_starts[-1] + record.S(record.Tmax))
+
+        # The heat capacity used to extrapolate beyond the last range.
+        Tmax = self._Tmax_list[-1]
+        self._Cp_extrapolated = self._records[-1].Cp(Tmax)
+
+        # Pack the records into arrays for calculations on temperature arrays.
+        record_count = len(self._records)
+        term_count = max([1] + [len(r._coefficients) for r in self._records])
+        self._Tmaxes = numpy.array(self._Tmax_list)
+        self._Tmins = numpy.array([r.Tmin for r in self._records])
+        self._Tuppers = numpy.array([r.Tmax for r in self._records])
+        self._coefficients = numpy.zeros((record_count, term_count))
+        self._exponents = numpy.zeros((record_count, term_count))
+        for i, record in enumerate(self._records):
+            count = len(record._coefficients)
+            self._coefficients[i, :count] = record._coefficients
+            self._exponents[i, :count] = record._exponents
+
+        # Terms that integrate to logarithms, and the powers of the others.
+        self._H_log = self._exponents == -1.0
+        self._H_powers = numpy.where(self._H_log, 1.0, self._exponents + 1.0)
+        self._S_log = self._exponents == 0.0
+        self._S_powers = numpy.where(self._S_log, 1.0, self._exponents)
+
+        # The enthalpy at the boundaries of the ranges, used to bracket the
+        # solution when calculating temperature from enthalpy.
+        self._T_bounds = [self._records[0].Tmin] + self._Tmax_list
+        self._H_bounds = [H + self.H_mag(T)
+                          for H, T in zip(self._H_starts, self._T_bounds)]
+
+        self._table = None
+        """The phase's property table, if it has been tabulated."""
+
+    def tabulate(self, Tmin, Tmax, dT=10.0):
+        """
+        Tabulate the phase's properties over a temperature range, after which
+        properties in that range are interpolated from the table instead of
+        being calculated analytically.
+
+        :param Tmin: [K] The table's minimum temperature.
+        :param Tmax: [K] The table's maximum temperature.
+        :param dT: [K] The table's grid interval.
+
+        :returns: [J/mol, J/mol/K] Dictionary with the largest absolute
+          interpolation errors of H, S and Cp.
+        """
+
+        global _table_version
+        self._table = None
+        table = PhaseTable(self, Tmin, Tmax, dT)
+        self._table = table
+        _table_version += 1
+        return table.errors
+
+    def untabulate(self):
+        """
+        Remove the phase's property table, so that properties are calculated
+        analytically again.
+        """
+
+        global _table_version
+        if self._table is not None:
+            self._table = None
+            _table_version += 1
+
+    def _integrate_records(self, T, indices, log, powers):
+        """
+        Integrate the Cp records at the specified indices up to the specified
+        temperatures.
+
+        :param T: [K] temperature array
+        :param indices: Array of record indices, one for each temperature.
+        :param log: Matrix indicating the terms that integrate to logarithms.
+        :param powers: Matrix of the exponents of the integrated terms.
+
+        :returns: Array of integrals.
+        """
+
+        lT = numpy.minimum(T, self._Tuppers[indices])[:, numpy.newaxis]
+        Tref = self._Tmins[indices][:, numpy.newaxis]
+        c = self._coefficients[indices]
+        p = powers[indices]
+        terms = numpy.where(log[indices], c * numpy.log(lT/Tref),
+                            c * (lT**p - Tref**p) / p)
+        return terms.sum(axis=1)
+
+    def _Cp_array(self, T):
+        """
+        Calculate the heat capacity of the Cp records, without the magnetic
+        contribution, for an array of temperatures.
+
+        :param T: [K] temperature array
+
+        :returns: [J/mol/K] Array of heat capacities.
+        """
+
+        T = T.ravel()
+        indices = numpy.searchsorted(self._Tmaxes, T, side='right')
+        beyond = indices == len(self._records)
+        indices[beyond] = len(self._records) - 1
+        lT = numpy.where(beyond, self._Tmaxes[-1], T)[:, numpy.newaxis]
+        c = self._coefficients[indices]
+        e = self._exponents[indices]
+        return (c * lT**e).sum(axis=1)
+
+    def _H_array(self, T):
+        """
+        Calculate the enthalpy of the Cp records, without the magnetic
+        contribution, for an array of temperatures.
+
+        :param T: [K] temperature array
+
+        :returns: [J/mol] Array of enthalpies.
+        """
+
+        T = T.ravel()
+        indices = numpy.searchsorted(self._Tmaxes, T, side='left')
+        beyond = indices == len(self._records)
+        indices[beyond] = len(self._records) - 1
+        result = numpy.array(self._H_starts)[indices] + \
+            self._integrate_records(T, indices, self._H_log, self._H_powers)
+        result[beyond] = self._H_starts[-1] + \
+            self._Cp_extrapolated * (T[beyond] - self._Tmaxes[-1])
+        return result
+
+    def _S_array(self, T):
+        """
+        Calculate the entropy of the Cp records, without the magnetic
+        contribution, for an array of temperatures.
+
+        :param T: [K] temperature array
+
+        :returns: [J/mol/K] Array of entropies.
+        """
+
+        T = T.ravel()
+        indices = numpy.searchsorted(self._Tmaxes, T, side='left')
+        beyond = indices == len(self._records)
+        indices[beyond] = len(self._records) - 1
+        result = numpy.array(self._S_starts)[indices] + \
+            self._integrate_records(T, indices, self._S_log, self._S_powers)
+        result[beyond] = self._S_starts[-1] + \
+            self._Cp_extrapolated * numpy.log(T[beyond] / self._Tmaxes[-1])
+        return result
+
     def __str__(self):
         result = '\tPHASE: ' + self.name + '\n'
         result += '\t\tName: ' + self.name + '\n'
@@ -236,14 +872,38 @@ class Phase(NamedObject):
         :returns: [J/mol/K] The heat capacity of the compound phase.
         """
 
-        # TODO: Fix str/float conversion
-        for Tmax in sorted([float(TT) for TT in self._Cp_records.keys()]):
-            if T < Tmax:
-                return self._Cp_records[str(Tmax)].Cp(T) + self.Cp_mag(T)
+        if self._table is not None:
+            if type(T) is numpy.ndarray:
+                return self._table.evaluate(T, 'Cp')
+            k = self._table.interval(T)
+            if k >= 0:
+                return self._table.Cp(T, k)
+
+        if type(T) is numpy.ndarray:
+            return self._Cp_array(T).reshape(T.shape) + self.Cp_mag(T)
+
+        i = bisect_right(self._Tmax_list, T)
+        if i < len(self._records):
+            return self._records[i].Cp(T) + self.Cp_mag(T)
+
+        Tmax = self._Tmax_list[-1]
+
+        return self._records[-1].Cp(Tmax) + self.Cp_mag(T)
+
+    def T_from_H(self, H, tolerance=1.0e-6, max_iterations=50):
+        """
+        Calculate the temperature at which the compound phase has the
+        specified enthalpy.
+
+        :param H: [J/mol] enthalpy
+        :param tolerance: [K] The tolerance of the calculated temperature.
+        :param max_iterations: The maximum number of Newton iterations.
 
-        Tmax = max([float(TT) for TT in self._Cp_records.keys()])
+        :returns: [K] temperature
+        """
 
-        return self._Cp_records[str(Tmax)].Cp(Tmax) + self.Cp_mag(T)
+        return _solve_T_(self.H, self.Cp, H, self._T_bounds, self._H_bounds,
+                         tolerance, max_iterations)
 
     def Cp_mag(self, T):
         """
@@ -258,16 +918,8 @@ class Phase(NamedObject):
         317–425. http://doi.org/10.1016/0364-5916(91)90030-N
         """
 
-        tau = T / self.Tc_mag
-
-        if tau <= 1.0:
-            c = (self._B_mag*(2*tau**3 + 2*tau**9/3 + 2*tau**15/5))/self._D_mag
-        else:
-            c = (2*tau**-5 + 2*tau**-15/3 + 2*tau**-25/5)/self._D_mag
-
-        result = R*math.log(self.beta0_mag + 1)*c
-
-        return result
+        return self._factor_mag*self._calculate_mag(
+            T, self._Cp_mag_coefficients)
 
     def H(self, T):
         """
@@ -279,16 +931,23 @@ class Phase(NamedObject):
         :returns: [J/mol] The enthalpy of the compound phase.
         """
 
-        result = self.DHref
+        if self._table is not None:
+            if type(T) is numpy.ndarray:
+                return self._table.evaluate(T, 'H')
+            k = self._table.interval(T)
+            if k >= 0:
+                return self._table.H(T, k)
+
+        if type(T) is numpy.ndarray:
+            return self._H_array(T).reshape(T.shape) + self.H_mag(T)
 
-        for Tmax in sorted([float(TT) for TT in self._Cp_records.keys()]):
-            result += self._Cp_records[str(Tmax)].H(T)
-            if T <= Tmax:
-                return result + self.H_mag(T)
+        i = bisect_left(self._Tmax_list, T)
+        if i < len(self._records):
+            return self._H_starts[i] + self._records[i].H(T) + self.H_mag(T)
 
         # Extrapolate beyond the upper limit by using a constant heat capacity.
-        Tmax = max([float(TT) for TT in self._Cp_records.keys()])
-        result += self.Cp(Tmax)*(T - Tmax)
+        Tmax = self._Tmax_list[-1]
+        result = self._H_starts[-1] + self._Cp_extrapolated*(T - Tmax)
 
         return result + self.H_mag(T)
 
@@ -305,15 +964,8 @@ class Phase(NamedObject):
         317–425. http://doi.org/10.1016/0364-5916(91)90030-N
         """
 
-        tau = T / self.Tc_mag
-
-        if tau <= 1.0:
-            h = (-self._A_mag/tau +
-                 self._B_mag*(tau**3/2 + tau**9/15 + tau**15/40))/self._D_mag
-        else:
-            h = -(tau**-5/2 + tau**-15/21 + tau**-25/60)/self._D_mag
-
-        return R*T*math.log(self.beta0_mag + 1)*h
+        return self._factor_mag*T*self._calculate_mag(
+            T, self._H_mag_coefficients)
 
     def S(self, T):
         """
@@ -325,16 +977,23 @@ class Phase(NamedObject):
         :returns: [J/mol/K] The entropy of the compound phase.
         """
 
-        result = self.Sref
+        if self._table is not None:
+            if type(T) is numpy.ndarray:
+                return self._table.evaluate(T, 'S')
+            k = self._table.interval(T)
+            if k >= 0:
+                return self._table.S(T, k)
 
-        for Tmax in sorted([float(TT) for TT in self._Cp_records.keys()]):
-            result += self._Cp_records[str(Tmax)].S(T)
-            if T <= Tmax:
-                return result + self.S_mag(T)
+        if type(T) is numpy.ndarray:
+            return self._S_array(T).reshape(T.shape) + self.S_mag(T)
+
+        i = bisect_left(self._Tmax_list, T)
+        if i < len(self._records):
+            return self._S_starts[i] + self._records[i].S(T) + self.S_mag(T)
 
         # Extrapolate beyond the upper limit by using a constant heat capacity.
-        Tmax = max([float(TT) for TT in self._Cp_records.keys()])
-        result += self.Cp(Tmax)*math.log(T / Tmax)
+        Tmax = self._Tmax_list[-1]
+        result = self._S_starts[-1] + self._Cp_extrapolated*math.log(T / Tmax)
 
         return result + self.S_mag(T)
 
@@ -351,15 +1010,8 @@ class Phase(NamedObject):
         317–425. http://doi.org/10.1016/0364-5916(91)90030-N
         """
 
-        tau = T / self.Tc_mag
-
-        if tau <= 1.0:
-            s = 1 - (self._B_mag*(2*tau**3/3 + 2*tau**9/27 + 2*tau**15/75)) / \
-                self._D_mag
-        else:
-            s = (2*tau**-5/5 + 2*tau**-15/45 + 2*tau**-25/125)/self._D_mag
-
-        return -R*math.log(self.beta0_mag + 1)*s
+        return self._factor_mag*self._calculate_mag(
+            T, self._S_mag_coefficients)
 
     def G(self, T):
         """Calculate the heat capacity of the compound phase at the specified
@@ -370,19 +1022,30 @@ class Phase(NamedObject):
         :returns: [J/mol] The Gibbs free energy of the compound phase.
         """
 
-        h = self.DHref
-        s = self.Sref
-
-        for Tmax in sorted([float(TT) for TT in self._Cp_records.keys()]):
-            h = h + self._Cp_records[str(Tmax)].H(T)
-            s = s + self._Cp_records[str(Tmax)].S(T)
-            if T <= Tmax:
-                return h - T * s + self.G_mag(T)
+        if self._table is not None:
+            if type(T) is numpy.ndarray:
+                return self._table.evaluate(T, 'H') - \
+                    T * self._table.evaluate(T, 'S')
+            k = self._table.interval(T)
+            if k >= 0:
+                return self._table.H(T, k) - T * self._table.S(T, k)
+
+        if type(T) is numpy.ndarray:
+            h = self._H_array(T).reshape(T.shape)
+            s = self._S_array(T).reshape(T.shape)
+            return h - T * s + self.G_mag(T)
+
+        i = bisect_left(self._Tmax_list, T)
+        if i < len(self._records):
+            record = self._records[i]
+            h = self._H_starts[i] + record.H(T)
+            s = self._S_starts[i] + record.S(T)
+            return h - T * s + self.G_mag(T)
 
         # Extrapolate beyond the upper limit by using a constant heat capacity.
-        Tmax = max([float(TT) for TT in self._Cp_records.keys()])
-        h = h + self.Cp(Tmax)*(T - Tmax)
-        s = s + self.Cp(Tmax)*math.log(T / Tmax)
+        Tmax = self._Tmax_list[-1]
+        h = self._H_starts[-1] + self._Cp_extrapolated*(T - Tmax)
+        s = self._S_starts[-1] + self._Cp_extrapolated*math.log(T / Tmax)
 
         return h - T * s + self.G_mag(T)
 
@@ -399,16 +1062,92 @@ class Phase(NamedObject):
         317–425. http://doi.org/10.1016/0364-5916(91)90030-N
         """
 
-        tau = T / self.Tc_mag
+        return self._factor_mag*T*self._calculate_mag(
+            T, self._G_mag_coefficients)
 
-        if tau <= 1.0:
-            g = 1 - (self._A_mag/tau +
-                     self._B_mag*(tau**3/6 + tau**9/135 + tau**15/600)) /\
-                    self._D_mag
-        else:
-            g = -(tau**-5/10 + tau**-15/315 + tau**-25/1500)/self._D_mag
 
-        return R*T*math.log(self.beta0_mag + 1)*g
+class PhaseStabilityIndex(Object):
+    """
+    An index of the phases of a compound that are stable, i.e. have the
+    lowest Gibbs free energy, in the temperature intervals between the
+    compound's phase transition temperatures.
+
+    The transitions are located by evaluating the Gibbs free energy of all
+    the phases on a temperature grid, and are then refined by bisection.
+    Phases that are stable over an interval smaller than the grid interval
+    may be missed.
+
+    :param compound: The compound to create the index for.
+    :param dT: [K] The grid interval used to locate the transitions.
+    """
+
+    def __init__(self, compound, dT=1.0):
+        symbols = compound.get_phase_list()
+        phases = [compound._phases[s] for s in symbols]
+        Tmin = 298.15
+        Tmax = max(phase._Tmax_list[-1] for phase in phases)
+        T = numpy.append(numpy.arange(Tmin, Tmax, dT), Tmax)
+        stable = numpy.argmin([phase.G(T) for phase in phases], axis=0)
+
+        self.transitions = []
+        """[K] The sorted phase transition temperatures."""
+
+        self.phases = [symbols[stable[0]]]
+        """The stable phase below the first transition, between each pair of
+        transitions, and above the last transition."""
+
+        for i in numpy.nonzero(stable[1:] != stable[:-1])[0]:
+            a = phases[stable[i]]
+            b = phases[stable[i + 1]]
+            self.transitions.append(self._find_transition(
+                a, b, float(T[i]), float(T[i + 1])))
+            self.phases.append(symbols[stable[i + 1]])
+
+    def _find_transition(self, a, b, T1, T2):
+        """
+        Find the temperature at which two phases have equal Gibbs free
+        energies by bisection.
+
+        :param a: The stable phase at T1.
+        :param b: The stable phase at T2.
+        :param T1: [K] The lower temperature.
+        :param T2: [K] The upper temperature.
+
+        :returns: [K] The transition temperature.
+        """
+
+        for i in range(60):
+            T = (T1 + T2) / 2.0
+            if T == T1 or T == T2:
+                break
+            if a.G(T) <= b.G(T):
+                T1 = T
+            else:
+                T2 = T
+        return (T1 + T2) / 2.0
+
+    def get_phase(self, T):
+        """
+        Get the stable phase at the specified temperature.
+
+        :param T: [K] temperature
+
+        :returns: The phase's symbol.
+        """
+
+        return self.phases[bisect_right(self.transitions, T)]
+
+    def get_phase_indices(self, T):
+        """
+        Get the index into the phases list of the stable phase at each of the
+        specified temperatures.
+
+        :param T: [K] array of temperatures
+
+        :returns: Array of indices.
+        """
+
+        return numpy.searchsorted(self.transitions, T, side='right')
 
 
 class Compound(Object):
@@ -441,6 +1180,8 @@ class Compound(Object):
                 v['Symbol'] = k
             self._phases[k] = Phase(v)
 
+        self._stability_index = None
+
 #    def __str__(self):
 #        result = 'COMPOUND: ' + '\n'
 #        result += '\tFormula: ' + self.formula + '\n'
@@ -450,9 +1191,60 @@ class Compound(Object):
 #
 #        return result
 
+    _compiled_attributes_ = ['_stability_index']
+    """The attributes created when needed, which are not written to file."""
+
     def _init(self):
         for p in self._phases:
             self._phases[p]._init()
+        self._stability_index = None
+
+    def get_stability_index(self):
+        """
+        Get the index of the compound's stable phases, creating it if it does
+        not exist yet.
+
+        :returns: PhaseStabilityIndex object.
+        """
+
+        if self._stability_index is None:
+            self._stability_index = PhaseStabilityIndex(self)
+        return self._stability_index
+
+    def get_stable_phase(self, T):
+        """
+        Get the phase of the compound that is stable at the specified
+        temperature, i.e. the phase with the lowest Gibbs free energy.
+
+        :param T: [K] temperature
+
+        :returns: The phase's symbol.
+        """
+
+        return self.get_stability_index().get_phase(T)
+
+    def _calculate_for_stable_phases(self, function, T):
+        """
+        Calculate a property of the compound's stable phase at the specified
+        temperature, or temperatures.
+
+        :param function: The Phase method used to calculate the property.
+        :param T: [K] temperature, or array of temperatures
+
+        :returns: The property value, or array of values.
+        """
+
+        index = self.get_stability_index()
+        if type(T) is not numpy.ndarray:
+            return function(self._phases[index.get_phase(T)], T)
+
+        indices = index.get_phase_indices(T)
+        result = numpy.empty(T.shape)
+        for i, symbol in enumerate(index.phases):
+            selected = indices == i
+            if selected.any():
+                result[selected] = function(self._phases[symbol], T[selected])
+        return result
 
     def get_phase_list(self):
         """
@@ -473,12 +1265,15 @@ class Compound(Object):
         Calculate the heat capacity of a phase of the compound at a specified
         temperature.
 
-        :param phase: A phase of the compound, e.g. 'S', 'L', 'G'.
+        :param phase: A phase of the compound, e.g. 'S', 'L', 'G', or None
+          to use the phase that is stable at the temperature.
         :param T: [K] temperature
 
         :returns: [J/mol/K] Heat capacity.
         """
 
+        if phase is None:
+            return self._calculate_for_stable_phases(Phase.Cp, T)
         if phase not in self._phases:
             raise Exception("The phase '%s' was not found in compound '%s'." %
                             (phase, self.formula))
@@ -490,169 +1285,785 @@ class Compound(Object):
         Calculate the enthalpy of a phase of the compound at a specified
         temperature.
 
-        :param phase: A phase of the compound, e.g. 'S', 'L', 'G'.
+        :param phase: A phase of the compound, e.g. 'S', 'L', 'G', or None
+          to use the phase that is stable at the temperature.
         :param T: [K] temperature
 
         :returns: [J/mol] Enthalpy.
         """
 
-        try:
-            return self._phases[phase].H(T)
-        except KeyError:
-            raise Exception("The phase '{}' was not found in compound '{}'."
-                            .format(phase, self.formula))
+        if phase is None:
+            return self._calculate_for_stable_phases(Phase.H, T)
+        if phase not in self._phases:
+            raise Exception("The phase '%s' was not found in compound '%s'." %
+                            (phase, self.formula))
+
+        return self._phases[phase].H(T)
 
     def S(self, phase, T):
         """
         Calculate the enthalpy of a phase of the compound at a specified
         temperature.
 
-        :param phase: A phase of the compound, e.g. 'S', 'L', 'G'.
+        :param phase: A phase of the compound, e.g. 'S', 'L', 'G', or None
+          to use the phase that is stable at the temperature.
         :param T: [K] temperature
 
         :returns: [J/mol/K] Entropy.
         """
 
-        try:
-            return self._phases[phase].S(T)
-        except KeyError:
-            raise Exception("The phase '{}' was not found in compound '{}'."
-                            .format(phase, self.formula))
+        if phase is None:
+            return self._calculate_for_stable_phases(Phase.S, T)
+        if phase not in self._phases:
+            raise Exception("The phase '%s' was not found in compound '%s'." %
+                            (phase, self.formula))
+
+        return self._phases[phase].S(T)
 
     def G(self, phase, T):
         """
         Calculate the Gibbs free energy of a phase of the compound at a
         specified temperature.
 
-        :param phase: A phase of the compound, e.g. 'S', 'L', 'G'.
+        :param phase: A phase of the compound, e.g. 'S', 'L', 'G', or None
+          to use the phase that is stable at the temperature.
         :param T: [K] temperature
 
         :returns: [J/mol] Gibbs free energy.
         """
 
-        try:
-            return self._phases[phase].G(T)
-        except KeyError:
-            raise Exception("The phase '{}' was not found in compound '{}'."
-                            .format(phase, self.formula))
+        if phase is None:
+            return self._calculate_for_stable_phases(Phase.G, T)
+        if phase not in self._phases:
+            raise Exception("The phase '%s' was not found in compound '%s'." %
+                            (phase, self.formula))
 
+        return self._phases[phase].G(T)
 
-def _get_default_data_path_():
+
+class CompoundRegistry(MutableMapping):
     """
-    Calculate the default path in which thermochemical data is stored.
+    A dictionary of compounds, keyed by formula, that reads a compound's data
+    only when the compound is first accessed.
 
-    :returns: Default path.
+    Compounds can be added directly, like in a normal dictionary, or be
+    registered with a loader function that creates the compound when it is
+    needed. Compounds are created under a lock, so that the registry can be
+    read from several threads.
     """
 
-    module_path = os.path.dirname(sys.modules[__name__].__file__)
-    data_path = os.path.join(module_path, r'data/rao')
-    data_path = os.path.abspath(data_path)
-    return data_path
+    def __init__(self):
+        self._compounds = {}
+        self._loaders = {}
+        self._version = 0  # incremented whenever compounds are replaced
+        self._lock = threading.RLock()
 
+    def __repr__(self):
+        return 'CompoundRegistry({})'.format(sorted(self.keys()))
 
-def _read_compound_from_factsage_file_(file_name):
-    """
-    Build a dictionary containing the factsage thermochemical data of a
-    compound by reading the data from a file.
+    @property
+    def version(self):
+        """
+        The number of times compounds were added to, replaced in or removed
+        from the registry. It can be used to detect that objects that refer
+        to compounds in the registry are out of date.
+        """
 
-    :param file_name: Name of file to read the data from.
+        return self._version
 
-    :returns: Dictionary containing compound data.
-    """
+    def __getitem__(self, formula):
+        try:
+            return self._compounds[formula]
+        except KeyError:
+            pass
+        with self._lock:
+            if formula in self._compounds:  # created by another thread
+                return self._compounds[formula]
+            # The loader is removed only after the compound was stored, so
+            # that the formula remains in the registry while it is loaded,
+            # and when the loader fails.
+            compound = self._loaders[formula]()
+            self._compounds[formula] = compound
+            del self._loaders[formula]
+            return compound
+
+    def __setitem__(self, formula, compound):
+        with self._lock:
+            self._loaders.pop(formula, None)
+            self._compounds[formula] = compound
+            self._version += 1
+
+    def __delitem__(self, formula):
+        with self._lock:
+            if formula in self._loaders:
+                del self._loaders[formula]
+            else:
+                del self._compounds[formula]
+            self._version += 1
 
-    with open(file_name) as f:
-        lines = f.readlines()
+    def __contains__(self, formula):
+        # The loaders are checked first, since a compound is stored before
+        # its loader is removed.
+        return formula in self._loaders or formula in self._compounds
 
-    compound = {'Formula': lines[0].split(' ')[1]}
-    # FIXME: replace with logging
-    print(compound['Formula'])
-    compound['Phases'] = phs = {}
+    def __iter__(self):
+        with self._lock:
+            formulas = list(self._compounds) + list(self._loaders)
+        return iter(formulas)
 
-    started = False
-    phaseold = 'zz'
-    recordold = '0'
+    def __len__(self):
+        with self._lock:
+            return len(self._compounds) + len(self._loaders)
 
-    for line in lines:
-        if started:
-            if line.startswith('_'):  # line indicating end of data
-                break
-            line = line.replace(' 298 ', ' 298.15 ')
-            line = line.replace(' - ', ' ')
-            while '  ' in line:
-                line = line.replace('  ', ' ')
-            line = line.replace(' \n', '')
-            line = line.replace('\n', '')
-            strings = line.split(' ')
-            if len(strings) < 2:  # empty line
-                continue
-            phase = strings[0]
-            if phase != phaseold:  # new phase detected
-                phaseold = phase
-                ph = phs[phase] = {}
-                ph['Symbol'] = phase
-                ph['DHref'] = float(strings[2])
-                ph['Sref'] = float(strings[3])
-                cprecs = ph['Cp_records'] = {}
-                record = strings[1]
-                if record != recordold:  # new record detected
-                    recordold = record
-                    Tmax = float(strings[len(strings) - 1])
-                    cprecs[Tmax] = {}
-                    cprecs[Tmax]['Tmin'] = float(strings[len(strings) - 2])
-                    cprecs[Tmax]['Tmax'] = float(strings[len(strings) - 1])
-                    cprecs[Tmax]['Terms'] = []
-                    t = {'Coefficient': float(strings[4]),
-                         'Exponent': float(strings[5])}
-                    cprecs[Tmax]['Terms'].append(t)
-                    if len(strings) == 10:
-                        t = {'Coefficient': float(strings[6]),
-                             'Exponent': float(strings[7])}
-                        cprecs[Tmax]['Terms'].append(t)
-                else:  # old record detected
-                    t = {'Coefficient': float(strings[2]),
-                         'Exponent': float(strings[3])}
-                    cprecs[Tmax]['Terms'].append(t)
-                    if len(strings) == 8:
-                        t = {'Coefficient': float(strings[4]),
-                             'Exponent': float(strings[5])}
-                        cprecs[Tmax]['Terms'].append(t)
-            else:  # old phase detected
-                ph = phs[phase]
-                record = strings[1]
-                if record != recordold:  # new record detected
-                    recordold = record
-                    Tmax = float(strings[len(strings) - 1])
-                    cprecs = ph['Cp_records']
-                    cprecs[Tmax] = {}
-                    cprecs[Tmax]['Tmin'] = float(strings[len(strings) - 2])
-                    cprecs[Tmax]['Tmax'] = float(strings[len(strings) - 1])
-                    cprecs[Tmax]['Terms'] = []
-                    t = {'Coefficient': float(strings[2]),
-                         'Exponent': float(strings[3])}
-                    cprecs[Tmax]['Terms'].append(t)
-                    if len(strings) == 8:
-                        t = {'Coefficient': float(strings[4]),
-                             'Exponent': float(strings[5])}
-                        cprecs[Tmax]['Terms'].append(t)
-                else:  # old record detected
-                    t = {'Coefficient': float(strings[2]),
-                         'Exponent': float(strings[3])}
-                    cprecs[Tmax]['Terms'].append(t)
-                    if len(strings) == 8:
-                        t = {'Coefficient': float(strings[4]),
-                             'Exponent': float(strings[5])}
-                        cprecs[Tmax]['Terms'].append(t)
-        if line.startswith('_'):  # line indicating the start of the data
-            started = True
-
-    for name, ph in phs.items():
-        cprecs = ph['Cp_records']
-        first = cprecs[min(cprecs.keys())]
-        first['Tmin'] = 298.15
+    def clear(self):
+        """
+        Remove all the compounds.
+        """
+
+        with self._lock:
+            self._compounds.clear()
+            self._loaders.clear()
+            self._version += 1
+
+    def register(self, formula, loader):
+        """
+        Register a compound that will be created when it is first accessed.
+
+        :param formula: The compound's formula, e.g. 'Fe2O3'.
+        :param loader: A function without parameters that creates the
+          compound.
+        """
+
+        with self._lock:
+            self._compounds.pop(formula, None)
+            self._loaders[formula] = loader
+            self._version += 1
+
+    def get_loaded(self):
+        """
+        Get the compounds that have already been created.
+
+        :returns: List of compounds.
+        """
+
+        return list(self._compounds.values())
+
+
+class ThermoDatabase(Mapping):
+    """
+    A read-only dictionary of the compounds of one thermochemical dataset,
+    keyed by formula.
+
+    Unlike the module's compounds registry, a database cannot be modified
+    after it was loaded, so several databases can be used side by side, and
+    a database can be shared between threads. Compounds are still read when
+    they are first accessed, which is done under the registry's lock.
+
+    Databases are created with the read_auxi, read_factsage and
+    read_compiled methods, and can be passed to the module functions, e.g.
+    H('Fe2O3[S1]', 1000.0, database=db), and to materials.
+
+    :param registry: The compound registry containing the dataset. It must
+      not be modified after the database was created.
+    """
+
+    def __init__(self, registry):
+        self._registry = registry
+
+    def __repr__(self):
+        return 'ThermoDatabase({})'.format(sorted(self.keys()))
+
+    @staticmethod
+    def read_auxi(path=''):
+        """
+        Create a database from the thermochemical data auxi files located at
+        a path.
+
+        :param path: Path at which the data files are located. The default
+          data path is used if it is not specified.
+
+        :returns: ThermoDatabase object.
+        """
+
+        registry = CompoundRegistry()
+        _load_data_auxi_(registry, path)
+        return ThermoDatabase(registry)
+
+    @staticmethod
+    def read_factsage(path=''):
+        """
+        Create a database from the thermochemical data factsage files
+        located at a path.
+
+        :param path: Path at which the data files are located. The default
+          data path is used if it is not specified.
+
+        :returns: ThermoDatabase object.
+        """
+
+        registry = CompoundRegistry()
+        _load_data_factsage_(registry, path)
+        return ThermoDatabase(registry)
+
+    @staticmethod
+    def read_compiled(file_name, mmap=False):
+        """
+        Create a database from a compiled data file.
+
+        :param file_name: Name of the compiled data file.
+        :param mmap: Indicates whether the file must be memory-mapped instead
+          of being read into memory.
+
+        :returns: ThermoDatabase object.
+        """
+
+        registry = CompoundRegistry()
+        _load_data_compiled_(registry, file_name, mmap)
+        return ThermoDatabase(registry)
+
+    @property
+    def version(self):
+        """
+        The version of the database's compounds, which never changes. See
+        CompoundRegistry.version.
+        """
+
+        return 0
+
+    def __getitem__(self, formula):
+        return self._registry[formula]
+
+    def __contains__(self, formula):
+        return formula in self._registry
+
+    def __iter__(self):
+        return iter(self._registry)
+
+    def __len__(self):
+        return len(self._registry)
+
+
+class CompoundPhaseHandle(Object):
+    """
+    A compound phase resolved from a compound string, e.g. 'Fe2O3[S1]'.
+    Calculating properties with a handle is faster than with the module
+    functions, since the compound string is parsed and looked up only once.
+
+    The handle refers to the compound data that was loaded when it was
+    created, and has to be recreated if the data is reloaded.
+
+    :param compound_string: Formula and phase of a chemical compound, e.g.
+      'Fe2O3[S1]'.
+    :param database: The ThermoDatabase to use. The module's compounds are
+      used if it is None.
+    """
+
+    def __init__(self, compound_string, database=None):
+        formula, phase = _split_compound_string_(compound_string)
+        compound = _get_database_(database)[formula]
+        if phase not in compound._phases:
+            raise Exception("The phase '{}' was not found in compound '{}'."
+                            .format(phase, formula))
+
+        self.compound_string = compound_string
+        self.formula = formula
+        self.phase = phase
+        self.molar_mass = compound.molar_mass
+        self._phase = compound._phases[phase]
+        # The H cache is used only while the module's compounds are those
+        # from which the handle's phase was taken.
+        self._version = compounds.version if database is None else None
+
+    def __str__(self):
+        return 'CompoundPhaseHandle({})'.format(self.compound_string)
+
+    def Cp(self, T, mass=1.0):
+        """
+        Calculate the heat capacity of the compound phase for the specified
+        temperature and mass.
+
+        :param T: [°C] temperature, or array of temperatures
+        :param mass: [kg]
+
+        :returns: [kWh/K] Heat capacity.
+        """
+
+        TK, mass = _prepare_arguments_(T, mass)
+        return self._phase.Cp(TK) / 3.6E6 / self.molar_mass * mass
+
+    def H(self, T, mass=1.0):
+        """
+        Calculate the enthalpy of the compound phase for the specified
+        temperature and mass.
+
+        :param T: [°C] temperature, or array of temperatures
+        :param mass: [kg]
+
+        :returns: [kWh] Enthalpy.
+        """
+
+        TK, mass = _prepare_arguments_(T, mass)
+        if _H_cache is not None and self._version == compounds.version and \
+                numpy.isscalar(TK):
+            result = _H_cache.get(self.formula, self.phase, float(TK),
+                                  Compound.H)[1]
+        else:
+            result = self._phase.H(TK)
+        return result / 3.6E6 / self.molar_mass * mass
+
+    def S(self, T, mass=1.0):
+        """
+        Calculate the entropy of the compound phase for the specified
+        temperature and mass.
+
+        :param T: [°C] temperature, or array of temperatures
+        :param mass: [kg]
+
+        :returns: [kWh/K] Entropy.
+        """
+
+        TK, mass = _prepare_arguments_(T, mass)
+        return self._phase.S(TK) / 3.6E6 / self.molar_mass * mass
+
+    def G(self, T, mass=1.0):
+        """
+        Calculate the Gibbs free energy of the compound phase for the
+        specified temperature and mass.
+
+        :param T: [°C] temperature, or array of temperatures
+        :param mass: [kg]
+
+        :returns: [kWh] Gibbs free energy.
+        """
+
+        TK, mass = _prepare_arguments_(T, mass)
+        return self._phase.G(TK) / 3.6E6 / self.molar_mass * mass
+
+
+class CompoundPhaseVector(Object):
+    """
+    The phases of a list of compounds, compiled so that a property of all of
+    them is calculated at once with array operations. This is faster than
+    using a handle for each compound when the list is long, e.g. to
+    calculate the enthalpy of a mixture.
+
+    Like a handle, the vector refers to the compound data that was loaded
+    when it was created, and has to be recreated if the data is reloaded.
+
+    :param compound_strings: List of formulas and phases of chemical
+      compounds, e.g. ['Fe2O3[S1]', 'FeO[S1]'].
+    :param database: The ThermoDatabase to use. The module's compounds are
+      used if it is None.
+    """
+
+    def __init__(self, compound_strings, database=None):
+        self.handles = [CompoundPhaseHandle(c, database)
+                        for c in compound_strings]
+        """The handles of the compound phases."""
+
+        self._database = _get_database_(database)
+        self._compile()
+
+    def __str__(self):
+        return 'CompoundPhaseVector({})'.format(
+            [h.compound_string for h in self.handles])
+
+    def _compile(self):
+        """
+        Pack the Cp records of all the phases into arrays with a row per
+        phase, padded to the largest number of records and terms.
+
+        The extrapolation beyond the last range is added as an extra record
+        with a constant heat capacity. The enthalpy of each record is
+        rearranged to the form K + sum(A*T**P) + L*ln(T), so that it can be
+        calculated without the record's minimum temperature.
+        """
+
+        self._phases = [h._phase for h in self.handles]
+        count = len(self._phases)
+        record_count = max([0] + [len(p._records) for p in self._phases]) + 1
+        term_count = max([1] + [p._coefficients.shape[1]
+                                for p in self._phases])
+
+        self._Tmaxes = numpy.full((count, record_count), numpy.inf)
+        Cp_coefficients = numpy.zeros((count, record_count, term_count))
+        Cp_exponents = numpy.zeros((count, record_count, term_count))
+        H_constants = numpy.zeros((count, record_count))
+        H_coefficients = numpy.zeros((count, record_count, term_count))
+        H_exponents = numpy.zeros((count, record_count, term_count))
+        H_log_coefficients = numpy.zeros((count, record_count))
+        for i, phase in enumerate(self._phases):
+            k, t = phase._coefficients.shape
+            self._Tmaxes[i, :k] = phase._Tmaxes
+            Cp_coefficients[i, :k, :t] = phase._coefficients
+            Cp_exponents[i, :k, :t] = phase._exponents
+
+            for j, record in enumerate(phase._records):
+                Tref = record.Tmin
+                H_constants[i, j] = phase._H_starts[j]
+                for n, (c, e) in enumerate(zip(record._coefficients,
+                                               record._exponents)):
+                    if e == -1.0:
+                        H_log_coefficients[i, j] += c
+                        H_constants[i, j] -= c * math.log(Tref)
+                    else:
+                        H_coefficients[i, j, n] = c / (e + 1.0)
+                        H_exponents[i, j, n] = e + 1.0
+                        H_constants[i, j] -= c * Tref**(e + 1.0) / (e + 1.0)
+
+            # The extrapolation record.
+            Cp_coefficients[i, k, 0] = phase._Cp_extrapolated
+            H_constants[i, k] = phase._H_starts[-1] - \
+                phase._Cp_extrapolated * phase._Tmax_list[-1]
+            H_coefficients[i, k, 0] = phase._Cp_extrapolated
+            H_exponents[i, k, 0] = 1.0
+
+        # The properties are calculated with all the records, and the
+        # applicable ones are then selected by their index in the flattened
+        # arrays.
+        self._offsets = numpy.arange(count) * record_count
+        self._Cp_coefficients = Cp_coefficients.reshape(-1, term_count)
+        self._Cp_exponents = Cp_exponents.reshape(-1, term_count)
+        self._H_constants = H_constants.ravel()
+        self._H_coefficients = H_coefficients.reshape(-1, term_count)
+        self._H_exponents = H_exponents.reshape(-1, term_count)
+        self._H_log_coefficients = H_log_coefficients.ravel()
+
+        # [kWh/kg per J/mol] The factors that convert the molar properties.
+        self._factors = numpy.array([1.0 / 3.6E6 / h.molar_mass
+                                     for h in self.handles])
+
+        self._index_phases()
+
+    def _index_phases(self):
+        """
+        Find the phases with magnetic terms and the tabulated phases, whose
+        array results have to be corrected. The indices are found again
+        only when the compounds or the phases' tables change.
+        """
+
+        self._magnetic = [i for i, p in enumerate(self._phases)
+                          if hasattr(p, '_factor_mag')]
+        self._tabulated = [i for i, p in enumerate(self._phases)
+                           if p._table is not None]
+        self._database_version = self._database.version
+        self._table_version = _table_version
+
+    def _check_indices(self):
+        """
+        Find the indices of the phases again if they are out of date.
+        """
+
+        if self._table_version != _table_version or \
+                self._database_version != self._database.version:
+            self._index_phases()
+
+    def _Cp(self, T):
+        """
+        Calculate the molar heat capacity of each phase.
+
+        :param T: [K] temperature
+
+        :returns: [J/mol/K] Array of heat capacities.
+        """
+
+        self._check_indices()
+        indices = self._offsets + (self._Tmaxes <= T).sum(axis=1)
+        result = (self._Cp_coefficients *
+                  T**self._Cp_exponents).sum(axis=1)[indices]
+        for i in self._magnetic:
+            result[i] += self._phases[i].Cp_mag(T)
+        for i in self._tabulated:
+            result[i] = self._phases[i].Cp(T)
+        return result
+
+    def _H(self, T):
+        """
+        Calculate the molar enthalpy of each phase.
+
+        :param T: [K] temperature
+
+        :returns: [J/mol] Array of enthalpies.
+        """
+
+        self._check_indices()
+        indices = self._offsets + (self._Tmaxes < T).sum(axis=1)
+        result = (self._H_constants +
+                  self._H_log_coefficients * math.log(T) +
+                  (self._H_coefficients *
+                   T**self._H_exponents).sum(axis=1))[indices]
+        for i in self._magnetic:
+            result[i] += self._phases[i].H_mag(T)
+        for i in self._tabulated:
+            result[i] = self._phases[i].H(T)
+        return result
+
+    def Cp(self, T):
+        """
+        Calculate the heat capacity per unit mass of each compound phase at
+        the specified temperature.
+
+        :param T: [°C] temperature
+
+        :returns: [kWh/K/kg] Array of heat capacities.
+        """
+
+        return self._Cp(T + 273.15) * self._factors
+
+    def H(self, T):
+        """
+        Calculate the enthalpy per unit mass of each compound phase at the
+        specified temperature.
+
+        :param T: [°C] temperature
+
+        :returns: [kWh/kg] Array of enthalpies.
+        """
+
+        return self._H(T + 273.15) * self._factors
+
+    def T_from_H(self, H, mass, tolerance=1.0e-6, max_iterations=50,
+                 T_guess=None):
+        """
+        Calculate the temperature at which a mixture of the compound phases
+        has the specified enthalpy.
+
+        :param H: [kWh] enthalpy
+        :param mass: [kg] Sequence with the mass of each compound phase.
+        :param tolerance: [°C] The tolerance of the calculated temperature.
+        :param max_iterations: The maximum number of Newton iterations.
+        :param T_guess: [°C] An estimate of the temperature, e.g. the
+          previous temperature of the mixture.
+
+        :returns: [°C] temperature
+        """
+
+        mass = numpy.asarray(mass, dtype=float)
+        if len(mass) != len(self.handles):
+            raise Exception("The number of masses must be equal to the "
+                            "number of compounds.")
+        phases = [p for p, m in zip(self._phases, mass) if m != 0.0]
+        if len(phases) == 0:
+            raise Exception("The temperature of a mixture without mass "
+                            "cannot be calculated.")
+
+        factors = mass * self._factors
+
+        def H_mixture(T):
+            return numpy.dot(factors, self._H(T))
+
+        def Cp_mixture(T):
+            return numpy.dot(factors, self._Cp(T))
+
+        T_bounds = sorted({T for phase in phases for T in phase._T_bounds})
+        if T_guess is not None:
+            T_guess = T_guess + 273.15
+        return _solve_T_(H_mixture, Cp_mixture, H, T_bounds,
+                         tolerance=tolerance, max_iterations=max_iterations,
+                         T_guess=T_guess) - 273.15
+
+
+class ResultCache(Object):
+    """
+    A bounded cache of compound phase property values, keyed by formula,
+    phase and temperature. The least recently used value is discarded when
+    the cache is full.
+
+    The cache is cleared automatically when the compounds in the registry it
+    is associated with are replaced.
+
+    :param registry: The compound registry the cached values were calculated
+      from.
+    :param maxsize: The maximum number of values to keep.
+    """
+
+    def __init__(self, registry, maxsize=10000):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._registry = registry
+        self._version = registry._version
+        self._values = OrderedDict()
+
+    def __len__(self):
+        return len(self._values)
+
+    def get(self, formula, phase, T, function):
+        """
+        Get a cached value, calculating and caching it if it is not in the
+        cache.
+
+        :param formula: Formula of the compound, e.g. 'Fe2O3'.
+        :param phase: Phase of the compound, e.g. 'S1'.
+        :param T: [K] temperature
+        :param function: The Compound method used to calculate the value,
+          e.g. Compound.H.
+
+        :returns: The compound and the [J/mol] value.
+        """
+
+        if self._version != self._registry._version:
+            self.clear()
+
+        key = (formula, phase, T)
+        values = self._values
+        try:
+            result = values[key]
+        except KeyError:
+            self.misses += 1
+            compound = self._registry[formula]
+            result = values[key] = (compound, function(compound, phase, T))
+            if len(values) > self.maxsize:
+                values.popitem(last=False)
+            return result
+
+        self.hits += 1
+        values.move_to_end(key)
+        return result
+
+    def clear(self):
+        """
+        Remove all the cached values.
+        """
+
+        self._values.clear()
+        self._version = self._registry._version
+
+    def get_info(self):
+        """
+        Get the cache statistics.
+
+        :returns: Dictionary containing the number of hits, misses, the
+          current size and the maximum size of the cache.
+        """
+
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self._values), 'maxsize': self.maxsize}
+
+
+def _get_default_data_path_():
+    """
+    Calculate the default path in which thermochemical data is stored.
+
+    :returns: Default path.
+    """
+
+    module_path = os.path.dirname(sys.modules[__name__].__file__)
+    data_path = os.path.join(module_path, r'data/rao')
+    data_path = os.path.abspath(data_path)
+    return data_path
+
+
+def _read_compound_from_factsage_file_(file_name):
+    """
+    Build a dictionary containing the factsage thermochemical data of a
+    compound by reading the data from a file.
+
+    The file is read one line at a time. Each data line is split into tokens
+    of the form::
+
+        phase record [DHref Sref] coefficient exponent [coefficient exponent]
+        Tmin Tmax
+
+    where DHref and Sref are only present on the first line of a phase.
+
+    :param file_name: Name of file to read the data from.
+
+    :returns: Dictionary containing compound data.
+    """
+
+    phases = {}
+    compound = {'Phases': phases}
+
+    with open(file_name) as f:
+        compound['Formula'] = next(f).split()[1]
+        _logger.debug('Reading %s from %s.', compound['Formula'], file_name)
+
+        # Skip the header, which ends with a line starting with '_'.
+        for line in f:
+            if line.startswith('_'):
+                break
+
+        phase_old = None
+        record_old = None
+        for line in f:
+            if line.startswith('_'):  # line indicating end of data
+                break
+            tokens = ['298.15' if t == '298' else t
+                      for t in line.split() if t != '-']
+            if len(tokens) < 2:  # empty line
+                continue
+
+            phase, record = tokens[0], tokens[1]
+            if phase != phase_old:  # new phase detected
+                ph = phases[phase] = {'Symbol': phase,
+                                      'DHref': float(tokens[2]),
+                                      'Sref': float(tokens[3]),
+                                      'Cp_records': {}}
+                terms = tokens[4:8] if len(tokens) == 10 else tokens[4:6]
+                is_new_record = True
+            else:
+                terms = tokens[2:6] if len(tokens) == 8 else tokens[2:4]
+                is_new_record = record != record_old
+            phase_old, record_old = phase, record
+
+            if is_new_record:
+                Tmax = float(tokens[-1])
+                cprec = ph['Cp_records'][Tmax] = {'Tmin': float(tokens[-2]),
+                                                  'Tmax': Tmax,
+                                                  'Terms': []}
+            for c, e in zip(terms[0::2], terms[1::2]):
+                cprec['Terms'].append({'Coefficient': float(c),
+                                       'Exponent': float(e)})
+
+    for ph in phases.values():
+        cprecs = ph['Cp_records']
+        cprecs[min(cprecs.keys())]['Tmin'] = 298.15
 
     return compound
 
 
+def _convert_factsage_file_(arguments):
+    """
+    Read a factsage data file and, optionally, write it to an auxi data file.
+    This function is executed by the worker processes of
+    convert_data_factsage.
+
+    :param arguments: Tuple containing the name of the file to convert, and
+      the directory to write the auxi file to, or None.
+
+    :returns: Dictionary with the file name, formula, compound data,
+      conversion time and error message, if any.
+    """
+
+    file_name, directory = arguments
+    result = {'file': file_name, 'formula': None, 'data': None,
+              'time': 0.0, 'error': None}
+    start = time.perf_counter()
+    try:
+        data = _read_compound_from_factsage_file_(file_name)
+        result['formula'] = data['Formula']
+        result['data'] = data
+        if directory is not None:
+            write_compound_to_auxi_file(directory, Compound(data))
+    except Exception as ex:
+        result['error'] = '{}: {}'.format(type(ex).__name__, ex)
+    result['time'] = time.perf_counter() - start
+    return result
+
+
+def _get_database_(database):
+    """
+    Get the compounds to use in a calculation.
+
+    :param database: A ThermoDatabase, or None.
+
+    :returns: The database, or the module's compounds if it is None.
+    """
+
+    return compounds if database is None else database
+
+
 def _split_compound_string_(compound_string):
     """
     Split a compound's combined formula and phase into separate strings for
@@ -665,6 +2076,9 @@ def _split_compound_string_(compound_string):
     :returns: Phase of chemical compound.
     """
 
+    if '[' not in compound_string:
+        return compound_string, None
+
     formula = compound_string.replace(']', '').split('[')[0]
     phase = compound_string.replace(']', '').split('[')[1]
 
@@ -704,6 +2118,28 @@ def _read_compound_from_auxi_file_(file_name):
         return json.load(f)
 
 
+def _get_formula_from_file_name_(file_name):
+    """
+    Determine the formula of the compound in an auxi data file.
+
+    The formula is taken from the file name, e.g. 'Compound_Fe2O3.json'. If
+    the name is not a valid formula, e.g. 'Compound_Cobalt.json', the file is
+    read to find it.
+
+    :param file_name: Name of the file.
+
+    :returns: Formula of the compound.
+    """
+
+    name = os.path.splitext(os.path.basename(file_name))[0]
+    formula = name[len('Compound_'):]
+    symbols = re.findall('[A-Z][a-z]*', formula)
+    if re.match('^([A-Z][a-z]*[0-9]*)+$', formula) is not None and \
+       all(symbol in _element_dictionary_ for symbol in symbols):
+        return formula
+    return _read_compound_from_auxi_file_(file_name)['formula']
+
+
 def write_compound_to_auxi_file(directory, compound):
     """
     Writes a compound to an auxi file at the specified directory.
@@ -724,7 +2160,19 @@ def load_data_factsage(path=''):
     :param path: Path at which the data files are located.
     """
 
-    compounds.clear()
+    _load_data_factsage_(compounds, path)
+
+
+def _load_data_factsage_(registry, path):
+    """
+    Replace the compounds in a registry with the compounds in all the
+    thermochemical data factsage files located at a path.
+
+    :param registry: The compound registry to load the compounds into.
+    :param path: Path at which the data files are located.
+    """
+
+    registry.clear()
 
     if path == '':
         path = default_data_path
@@ -736,17 +2184,76 @@ def load_data_factsage(path=''):
 
     for file in files:
         compound = Compound(_read_compound_from_factsage_file_(file))
-        compounds[compound.formula] = compound
+        registry[compound.formula] = compound
+
+
+def convert_data_factsage(path, target_path=None, compiled_file_name=None,
+                          processes=None):
+    """
+    Convert all the thermochemical data factsage files located at a path to
+    the auxi format. The files are converted in parallel by a pool of
+    processes.
+
+    :param path: Path at which the factsage files are located.
+    :param target_path: Path to write the auxi data files to. No auxi files
+      are written if it is None.
+    :param compiled_file_name: Name of a compiled data file to write all the
+      converted compounds to. No compiled file is written if it is None.
+    :param processes: The number of processes to use. The number of CPUs is
+      used if it is None. If it is 1, the files are converted in the current
+      process.
+
+    :returns: List containing a dictionary for each file, with the file name
+      ('file'), compound formula ('formula'), conversion time in seconds
+      ('time') and an error message ('error'), which is None if the file
+      was converted successfully.
+    """
+
+    files = sorted(glob.glob(os.path.join(path, 'Compound_*.txt')))
+    arguments = [(file, target_path) for file in files]
+
+    if processes == 1:
+        results = [_convert_factsage_file_(a) for a in arguments]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+            results = list(executor.map(_convert_factsage_file_, arguments,
+                                        chunksize=16))
+
+    if compiled_file_name is not None:
+        converted = {r['formula']: Compound(r['data']) for r in results
+                     if r['error'] is None}
+        write_compiled_data_file(compiled_file_name, converted)
+
+    for r in results:
+        del r['data']
+        if r['error'] is not None:
+            _logger.warning('Could not convert %s. %s', r['file'], r['error'])
+    return results
 
 
 def load_data_auxi(path=''):
     """
     Load all the thermochemical data auxi files located at a path.
 
+    Only the file names are indexed here. A compound's file is read when the
+    compound is first used.
+
     :param path: Path at which the data files are located.
     """
 
-    compounds.clear()
+    _load_data_auxi_(compounds, path)
+
+
+def _load_data_auxi_(registry, path):
+    """
+    Replace the compounds in a registry with the compounds in all the
+    thermochemical data auxi files located at a path.
+
+    :param registry: The compound registry to load the compounds into.
+    :param path: Path at which the data files are located.
+    """
+
+    registry.clear()
 
     if path == '':
         path = default_data_path
@@ -757,8 +2264,312 @@ def load_data_auxi(path=''):
     files = glob.glob(os.path.join(path, 'Compound_*.json'))
 
     for file in files:
-        compound = Compound.read(file)
-        compounds[compound.formula] = compound
+        registry.register(_get_formula_from_file_name_(file),
+                           functools.partial(Compound.read, file))
+
+
+def _get_compiled_data_dtype_(formula_length, phase_length,
+                              reference_length, term_count):
+    """
+    Create the NumPy data type of the records in a compiled data file.
+
+    :param formula_length: Maximum length of the compound formulas.
+    :param phase_length: Maximum length of the phase symbols.
+    :param reference_length: Maximum length of the data references.
+    :param term_count: Maximum number of terms in the Cp records.
+
+    :returns: Structured data type.
+    """
+
+    return numpy.dtype([
+        ('formula', 'U{}'.format(formula_length)),
+        ('reference', 'U{}'.format(reference_length)),
+        ('phase', 'U{}'.format(phase_length)),
+        ('DHref', 'f8'),
+        ('Sref', 'f8'),
+        ('key', 'f8'),
+        ('Tmin', 'f8'),
+        ('Tmax', 'f8'),
+        ('term_count', 'i4'),
+        ('coefficients', 'f8', (term_count,)),
+        ('exponents', 'f8', (term_count,)),
+        ('Tc', 'f8'),
+        ('beta0', 'f8'),
+        ('p', 'f8')])
+
+
+def _create_compound_from_compiled_data_(records):
+    """
+    Create a compound from its records in a compiled data file.
+
+    :param records: Structured array with the compound's Cp records.
+
+    :returns: Compound object.
+    """
+
+    # Files written before magnetic data was added have no magnetic fields.
+    magnetic = 'Tc' in records.dtype.names
+
+    phases = {}
+    for r in records:
+        phase = str(r['phase'])
+        if phase not in phases:
+            phases[phase] = {'Symbol': phase,
+                             'DHref': float(r['DHref']),
+                             'Sref': float(r['Sref']),
+                             'Cp_records': {}}
+            if magnetic and not numpy.isnan(r['Tc']):
+                phases[phase]['magnetic'] = {'Tc': float(r['Tc']),
+                                             'beta0': float(r['beta0']),
+                                             'p': float(r['p'])}
+        count = int(r['term_count'])
+        phases[phase]['Cp_records'][float(r['key'])] = {
+            'Tmin': float(r['Tmin']),
+            'Tmax': float(r['Tmax']),
+            'Terms': [{'Coefficient': float(c), 'Exponent': float(e)}
+                      for c, e in zip(r['coefficients'][:count],
+                                      r['exponents'][:count])]}
+
+    return Compound({'Formula': str(records[0]['formula']),
+                     'Reference': str(records[0]['reference']),
+                     'Phases': phases})
+
+
+def write_compiled_data_file(file_name, compound_dictionary=None):
+    """
+    Write compounds to a single compiled data file, which can be loaded much
+    faster than the individual compound files.
+
+    The file is a NumPy .npy file containing a structured array with one
+    record for each Cp record of each compound phase. The magnetic fields of
+    phases without magnetic data are NaN.
+
+    :param file_name: Name of the file to write the data to.
+    :param compound_dictionary: Dictionary of the compounds to write, keyed
+      by formula. The currently loaded compounds are written if it is None.
+    """
+
+    if compound_dictionary is None:
+        compound_dictionary = compounds
+
+    with open(file_name, 'wb') as f:
+        numpy.save(f, _create_compiled_data_(compound_dictionary))
+
+
+def _create_compiled_data_(compound_dictionary):
+    """
+    Create the structured array that is stored in a compiled data file.
+
+    :param compound_dictionary: Dictionary of the compounds, keyed by
+      formula.
+
+    :returns: Structured array with compiled compound data.
+    """
+
+    rows = []
+    for formula in sorted(compound_dictionary.keys()):
+        compound = compound_dictionary[formula]
+        for symbol in compound.get_phase_list():
+            phase = compound._phases[symbol]
+            for key, record in zip(phase._Tmax_list, phase._records):
+                rows.append((compound.formula, compound.reference, symbol,
+                             phase, key, record))
+
+    dtype = _get_compiled_data_dtype_(
+        max([1] + [len(r[0]) for r in rows]),
+        max([1] + [len(r[2]) for r in rows]),
+        max([1] + [len(r[1]) for r in rows]),
+        max([1] + [len(r[5]._coefficients) for r in rows]))
+    data = numpy.zeros(len(rows), dtype=dtype)
+    for i, (formula, reference, symbol, phase, key, record) in \
+            enumerate(rows):
+        count = len(record._coefficients)
+        data[i]['formula'] = formula
+        data[i]['reference'] = reference
+        data[i]['phase'] = symbol
+        data[i]['DHref'] = phase.DHref
+        data[i]['Sref'] = phase.Sref
+        data[i]['key'] = key
+        data[i]['Tmin'] = record.Tmin
+        data[i]['Tmax'] = record.Tmax
+        data[i]['term_count'] = count
+        data[i]['coefficients'][:count] = record._coefficients
+        data[i]['exponents'][:count] = record._exponents
+        if hasattr(phase, 'Tc_mag'):
+            data[i]['Tc'] = phase.Tc_mag
+            data[i]['beta0'] = phase.beta0_mag
+            data[i]['p'] = phase.p_mag
+        else:
+            data[i]['Tc'] = numpy.nan
+            data[i]['beta0'] = numpy.nan
+            data[i]['p'] = numpy.nan
+
+    return data
+
+
+def load_data_compiled(file_name, mmap=False):
+    """
+    Load all the thermochemical data in a compiled data file.
+
+    The file is read in one operation. Compound objects are created from the
+    data when the compounds are first used.
+
+    :param file_name: Name of the compiled data file.
+    :param mmap: Indicates whether the file must be memory-mapped instead of
+      being read into memory.
+    """
+
+    _load_data_compiled_(compounds, file_name, mmap)
+
+
+def _load_data_compiled_(registry, file_name, mmap):
+    """
+    Replace the compounds in a registry with the compounds in a compiled
+    data file.
+
+    :param registry: The compound registry to load the compounds into.
+    :param file_name: Name of the compiled data file.
+    :param mmap: Indicates whether the file must be memory-mapped.
+    """
+
+    registry.clear()
+
+    if not os.path.exists(file_name):
+        warnings.warn('The specified data file does not exist. (%s)' %
+                      file_name)
+        return
+
+    data = numpy.load(file_name, mmap_mode='r' if mmap else None)
+    _register_compiled_data_(registry, data)
+
+
+def _register_compiled_data_(registry, data):
+    """
+    Register the compounds in a compiled data array with a compound
+    registry.
+
+    :param registry: The compound registry to register the compounds with.
+    :param data: Structured array with compiled compound data.
+    """
+
+    formulas = data['formula']
+    start = 0
+    for i in range(1, len(formulas) + 1):
+        if i == len(formulas) or formulas[i] != formulas[start]:
+            registry.register(str(formulas[start]), functools.partial(
+                _create_compound_from_compiled_data_, data[start:i]))
+            start = i
+
+
+def publish_shared_data(database=None, name=None):
+    """
+    Publish compounds in a block of shared memory, so that other processes,
+    e.g. the workers of a process pool, can use them without reading the
+    data files. The data is stored in the compiled data file format.
+
+    The caller owns the shared memory block, and has to call its close and
+    unlink methods when it is not needed anymore.
+
+    :param database: The ThermoDatabase to publish. The module's compounds
+      are published if it is None.
+    :param name: The name of the shared memory block. A unique name is
+      generated if it is None.
+
+    :returns: multiprocessing.shared_memory.SharedMemory object, whose name
+      is passed to attach_shared_data or load_data_shared.
+    """
+
+    buffer = io.BytesIO()
+    numpy.save(buffer, _create_compiled_data_(_get_database_(database)))
+    content = buffer.getbuffer()
+
+    memory = shared_memory.SharedMemory(name, create=True, size=len(content))
+    memory.buf[:len(content)] = content
+    return memory
+
+
+def _attach_shared_memory_(name):
+    """
+    Attach to a block of shared memory that was created by
+    publish_shared_data, and create an array of the data in it.
+
+    :param name: The name of the shared memory block.
+
+    :returns: The SharedMemory object and the structured array.
+    """
+
+    if sys.version_info >= (3, 13):
+        memory = shared_memory.SharedMemory(name, track=False)
+    else:
+        # Attaching registers the block with the resource tracker, which
+        # would remove the publisher's block when this process exits.
+        with _attach_lock:
+            register = resource_tracker.register
+            resource_tracker.register = lambda name, rtype: None
+            try:
+                memory = shared_memory.SharedMemory(name)
+            finally:
+                resource_tracker.register = register
+
+    header = io.BytesIO(bytes(memory.buf[:min(memory.size, 65536)]))
+    if numpy.lib.format.read_magic(header) == (1, 0):
+        read_header = numpy.lib.format.read_array_header_1_0
+    else:
+        read_header = numpy.lib.format.read_array_header_2_0
+    shape, fortran_order, dtype = read_header(header)
+    data = numpy.ndarray(shape, dtype, buffer=memory.buf,
+                         offset=header.tell(),
+                         order='F' if fortran_order else 'C')
+    return memory, data
+
+
+def attach_shared_data(name):
+    """
+    Create a database from compounds that were published in shared memory by
+    publish_shared_data. The compound data is not copied. Compound objects
+    are created from it when the compounds are first used.
+
+    :param name: The name of the shared memory block.
+
+    :returns: ThermoDatabase object.
+    """
+
+    memory, data = _attach_shared_memory_(name)
+    registry = CompoundRegistry()
+    _register_compiled_data_(registry, data)
+    database = ThermoDatabase(registry)
+    database._shared_memory = memory  # keeps the memory block attached
+    return database
+
+
+def load_data_shared(name):
+    """
+    Load the compounds that were published in shared memory by
+    publish_shared_data, replacing the module's compounds. This function can
+    be used as the initializer of a process pool.
+
+    :param name: The name of the shared memory block.
+    """
+
+    global _shared_memory
+
+    # Release the compounds that refer to the previous memory block before
+    # closing it.
+    compounds.clear()
+    if _H_cache is not None:
+        _H_cache.clear()
+    if _shared_memory is not None:
+        try:
+            _shared_memory.close()
+        except BufferError:
+            # Objects outside the module, e.g. compound phase handles, still
+            # refer to the block. It is closed when they are released.
+            pass
+        _shared_memory = None
+
+    memory, data = _attach_shared_memory_(name)
+    _shared_memory = memory  # keeps the memory block attached
+    _register_compiled_data_(compounds, data)
 
 
 def list_compounds():
@@ -795,92 +2606,441 @@ def molar_mass(compound):
     return mm(compound) / 1000.0
 
 
-def Cp(compound_string, T, mass=1.0):
+def _prepare_arguments_(T, mass):
+    """
+    Convert temperature and mass sequences to arrays so that they can be used
+    in vectorised calculations.
+
+    :param T: [°C] temperature, or sequence of temperatures
+    :param mass: [kg] mass, or sequence of masses
+
+    :returns: [K] temperature
+    :returns: [kg] mass
+    """
+
+    if type(T) is list or type(T) is tuple:
+        T = numpy.array(T, dtype=float)
+    if type(mass) is list or type(mass) is tuple:
+        mass = numpy.array(mass, dtype=float)
+    return T + 273.15, mass
+
+
+def _calculate_for_compounds_(function, compound_strings, T, mass,
+                              database):
+    """
+    Calculate a property for each compound in a list of compounds.
+
+    :param function: The module function used to calculate the property.
+    :param compound_strings: List of formulas and phases of chemical
+      compounds, e.g. ['Fe2O3[S1]', 'FeO[S1]'].
+    :param T: [°C] temperature, or array of temperatures
+    :param mass: [kg] mass of all the compounds, or sequence with the mass
+      of each compound.
+    :param database: The ThermoDatabase to use, or None.
+
+    :returns: Array with one row per compound.
+    """
+
+    if numpy.isscalar(mass):
+        mass = [mass] * len(compound_strings)
+    elif len(mass) != len(compound_strings):
+        raise Exception("The number of masses must be equal to the number "
+                        "of compounds.")
+    return numpy.array([function(c, T, m, database)
+                        for c, m in zip(compound_strings, mass)])
+
+
+def tabulate(compound_strings, Tmin=25.0, Tmax=2000.0, dT=10.0):
+    """
+    Tabulate the properties of the specified compound phases over a
+    temperature range. Subsequent calculations in that range interpolate the
+    properties from the tables, which is faster than calculating them
+    analytically, but slightly less accurate.
+
+    :param compound_strings: List of formulas and phases of chemical
+      compounds, e.g. ['Fe2O3[S1]', 'FeO[S1]'].
+    :param Tmin: [°C] The tables' minimum temperature.
+    :param Tmax: [°C] The tables' maximum temperature.
+    :param dT: [°C] The tables' grid interval.
+
+    :returns: Dictionary containing a dictionary for each compound with the
+      largest absolute interpolation errors of H [kWh/kg], S [kWh/K/kg] and
+      Cp [kWh/K/kg].
+    """
+
+    result = {}
+    for compound_string in compound_strings:
+        formula, phase = _split_compound_string_(compound_string)
+        compound = compounds[formula]
+        if phase not in compound._phases:
+            raise Exception("The phase '{}' was not found in compound '{}'."
+                            .format(phase, formula))
+        errors = compound._phases[phase].tabulate(Tmin + 273.15,
+                                                  Tmax + 273.15, dT)
+        result[compound_string] = {
+            k: _finalise_result_(compound, v, 1.0) for k, v in errors.items()}
+    if _H_cache is not None:
+        _H_cache.clear()
+    return result
+
+
+def untabulate(compound_strings=None):
+    """
+    Remove the property tables of the specified compound phases, so that
+    their properties are calculated analytically again.
+
+    :param compound_strings: List of formulas and phases of chemical
+      compounds, e.g. ['Fe2O3[S1]', 'FeO[S1]']. The tables of all compound
+      phases are removed if no list is specified.
+    """
+
+    if _H_cache is not None:
+        _H_cache.clear()
+
+    if compound_strings is None:
+        for compound in compounds.get_loaded():
+            for phase in compound._phases.values():
+                phase.untabulate()
+        return
+
+    for compound_string in compound_strings:
+        formula, phase = _split_compound_string_(compound_string)
+        compounds[formula]._phases[phase].untabulate()
+
+
+def get_stable_phase(formula, T, database=None):
+    """
+    Get the phase of a compound that is stable at the specified temperature,
+    i.e. the phase with the lowest Gibbs free energy.
+
+    :param formula: Formula of a chemical compound, e.g. 'Fe2O3'.
+    :param T: [°C] temperature
+    :param database: The ThermoDatabase to use. The module's compounds are
+      used if it is None.
+
+    :returns: The phase's symbol.
+    """
+
+    return _get_database_(database)[formula].get_stable_phase(T + 273.15)
+
+
+def enable_H_cache(maxsize=10000):
+    """
+    Cache the enthalpy values calculated by the H function. This speeds up
+    calculations that repeatedly evaluate the enthalpy of the same compounds
+    at the same temperatures.
+
+    Values are cached per mole, so that calculations for different masses
+    share them. The cache is cleared when the compound data is reloaded.
+
+    :param maxsize: The maximum number of values to cache. The least recently
+      used value is discarded when the cache is full.
+    """
+
+    global _H_cache
+    _H_cache = ResultCache(compounds, maxsize)
+
+
+def disable_H_cache():
+    """
+    Stop caching the enthalpy values calculated by the H function.
+    """
+
+    global _H_cache
+    _H_cache = None
+
+
+def get_H_cache_info():
+    """
+    Get the statistics of the enthalpy cache.
+
+    :returns: Dictionary containing the number of hits, misses, the current
+      size and the maximum size of the cache, or None if it is disabled.
+    """
+
+    if _H_cache is None:
+        return None
+    return _H_cache.get_info()
+
+
+def Cp(compound_string, T, mass=1.0, database=None):
     """
     Calculate the heat capacity of the compound for the specified temperature
     and mass.
 
+    The temperature and mass can also be arrays, in which case an array of
+    results is returned. If a list of compounds is specified, the result
+    contains a row for each compound.
+
     :param compound_string: Formula and phase of chemical compound, e.g.
-      'Fe2O3[S1]'.
+      'Fe2O3[S1]', or a list of them. If the phase is omitted, e.g. 'Fe2O3',
+      the phase that is stable at the temperature is used.
     :param T: [°C] temperature
     :param mass: [kg]
-
+    :param database: The ThermoDatabase to use. The module's compounds are
+      used if it is None.
     :returns: [kWh/K] Heat capacity.
     """
 
+    if type(compound_string) is not str:
+        return _calculate_for_compounds_(Cp, compound_string, T, mass,
+                                         database)
+
     formula, phase = _split_compound_string_(compound_string)
-    TK = T + 273.15
-    compound = compounds[formula]
+    TK, mass = _prepare_arguments_(T, mass)
+    compound = _get_database_(database)[formula]
     result = compound.Cp(phase, TK)
 
     return _finalise_result_(compound, result, mass)
 
 
-def H(compound_string, T, mass=1.0):
+def H(compound_string, T, mass=1.0, database=None):
     """
     Calculate the enthalpy of the compound for the specified temperature and
     mass.
 
+    The temperature and mass can also be arrays, in which case an array of
+    results is returned. If a list of compounds is specified, the result
+    contains a row for each compound.
+
     :param compound_string: Formula and phase of chemical compound, e.g.
-      'Fe2O3[S1]'.
+      'Fe2O3[S1]', or a list of them. If the phase is omitted, e.g. 'Fe2O3',
+      the phase that is stable at the temperature is used.
     :param T: [°C] temperature
     :param mass: [kg]
-
+    :param database: The ThermoDatabase to use. The module's compounds are
+      used if it is None.
     :returns: [kWh] Enthalpy.
     """
 
+    if type(compound_string) is not str:
+        return _calculate_for_compounds_(H, compound_string, T, mass,
+                                         database)
+
     formula, phase = _split_compound_string_(compound_string)
-    TK = T + 273.15
-    compound = compounds[formula]
+    TK, mass = _prepare_arguments_(T, mass)
+    if _H_cache is not None and database is None and numpy.isscalar(TK):
+        compound, result = _H_cache.get(formula, phase, float(TK), Compound.H)
+        return _finalise_result_(compound, result, mass)
+    compound = _get_database_(database)[formula]
     result = compound.H(phase, TK)
 
     return _finalise_result_(compound, result, mass)
 
 
-def S(compound_string, T, mass=1.0):
+def S(compound_string, T, mass=1.0, database=None):
     """
     Calculate the entropy of the compound for the specified temperature and
     mass.
 
+    The temperature and mass can also be arrays, in which case an array of
+    results is returned. If a list of compounds is specified, the result
+    contains a row for each compound.
+
     :param compound_string: Formula and phase of chemical compound, e.g.
-      'Fe2O3[S1]'.
+      'Fe2O3[S1]', or a list of them. If the phase is omitted, e.g. 'Fe2O3',
+      the phase that is stable at the temperature is used.
     :param T: [°C] temperature
     :param mass: [kg]
-
+    :param database: The ThermoDatabase to use. The module's compounds are
+      used if it is None.
     :returns: [kWh/K] Entropy.
     """
 
+    if type(compound_string) is not str:
+        return _calculate_for_compounds_(S, compound_string, T, mass,
+                                         database)
+
     formula, phase = _split_compound_string_(compound_string)
-    TK = T + 273.15
-    compound = compounds[formula]
+    TK, mass = _prepare_arguments_(T, mass)
+    compound = _get_database_(database)[formula]
     result = compound.S(phase, TK)
 
     return _finalise_result_(compound, result, mass)
 
 
-def G(compound_string, T, mass=1.0):
+def G(compound_string, T, mass=1.0, database=None):
     """
     Calculate the Gibbs free energy of the compound for the specified
     temperature and mass.
 
+    The temperature and mass can also be arrays, in which case an array of
+    results is returned. If a list of compounds is specified, the result
+    contains a row for each compound.
+
     :param compound_string: Formula and phase of chemical compound, e.g.
-      'Fe2O3[S1]'.
+      'Fe2O3[S1]', or a list of them. If the phase is omitted, e.g. 'Fe2O3',
+      the phase that is stable at the temperature is used.
     :param T: [°C] temperature
     :param mass: [kg]
-
+    :param database: The ThermoDatabase to use. The module's compounds are
+      used if it is None.
 
     :returns: [kWh] Gibbs free energy.
     """
 
+    if type(compound_string) is not str:
+        return _calculate_for_compounds_(G, compound_string, T, mass,
+                                         database)
+
     formula, phase = _split_compound_string_(compound_string)
-    TK = T + 273.15
-    compound = compounds[formula]
+    TK, mass = _prepare_arguments_(T, mass)
+    compound = _get_database_(database)[formula]
     result = compound.G(phase, TK)
 
     return _finalise_result_(compound, result, mass)
 
 
-compounds = {}
+def T_from_H(compound_string, H, mass=1.0, database=None,
+             tolerance=1.0e-6, max_iterations=50):
+    """
+    Calculate the temperature at which a compound, or a mixture of compounds,
+    has the specified enthalpy.
+
+    :param compound_string: Formula and phase of chemical compound, e.g.
+      'Fe2O3[S1]', or a list of them for a mixture.
+    :param H: [kWh] enthalpy
+    :param mass: [kg] mass of the compound, or a sequence with the mass of
+      each compound in the mixture. A single mass is used for every compound
+      in a mixture.
+    :param database: The ThermoDatabase to use. The module's compounds are
+      used if it is None.
+    :param tolerance: [°C] The tolerance of the calculated temperature.
+    :param max_iterations: The maximum number of Newton iterations.
+
+    :returns: [°C] temperature
+    """
+
+    if type(compound_string) is str:
+        if not mass > 0.0:
+            raise Exception("The mass must be larger than zero.")
+        handle = CompoundPhaseHandle(compound_string, database)
+        H_molar = H * 3.6E6 * handle.molar_mass / mass  # kWh -> J/mol
+        return handle._phase.T_from_H(H_molar, tolerance,
+                                      max_iterations) - 273.15
+
+    if numpy.isscalar(mass):
+        mass = [mass] * len(compound_string)
+    if len(mass) != len(compound_string):
+        raise Exception("The number of masses must be equal to the number "
+                        "of compounds.")
+    if not any(m > 0.0 for m in mass):
+        raise Exception("The mass of the mixture must be larger than zero.")
+    vector = CompoundPhaseVector(
+        [c for c, m in zip(compound_string, mass) if m != 0.0], database)
+    return vector.T_from_H(H, [m for m in mass if m != 0.0], tolerance,
+                           max_iterations)
+
+
+def _calculate_molar_matrix_(function, compound_strings, T, database):
+    """
+    Calculate a molar property of each compound phase in a list at each
+    temperature in a sequence.
+
+    :param function: The Phase method used to calculate the property.
+    :param compound_strings: List of formulas and phases of chemical
+      compounds, e.g. ['Fe2O3[S1]', 'FeO[S1]'].
+    :param T: [°C] temperature, or sequence of temperatures
+    :param database: The ThermoDatabase to use, or None.
+
+    :returns: Array with a row per compound and a column per temperature.
+    """
+
+    TK = numpy.atleast_1d(numpy.asarray(T, dtype=float)) + 273.15
+    result = numpy.empty((len(compound_strings), len(TK)))
+    for i, compound_string in enumerate(compound_strings):
+        handle = CompoundPhaseHandle(compound_string, database)
+        result[i] = function(handle._phase, TK)
+    return result
+
+
+def H_matrix(compound_strings, T, database=None):
+    """
+    Calculate the molar enthalpy of each of the specified compounds at each
+    of the specified temperatures.
+
+    :param compound_strings: List of formulas and phases of chemical
+      compounds, e.g. ['Fe2O3[S1]', 'FeO[S1]'].
+    :param T: [°C] temperature, or sequence of temperatures
+    :param database: The ThermoDatabase to use. The module's compounds are
+      used if it is None.
+
+    :returns: [J/mol] Array with a row per compound and a column per
+      temperature.
+    """
+
+    return _calculate_molar_matrix_(Phase.H, compound_strings, T,
+                                    database)
+
+
+def G_matrix(compound_strings, T, database=None):
+    """
+    Calculate the molar Gibbs free energy of each of the specified compounds
+    at each of the specified temperatures.
+
+    :param compound_strings: List of formulas and phases of chemical
+      compounds, e.g. ['Fe2O3[S1]', 'FeO[S1]'].
+    :param T: [°C] temperature, or sequence of temperatures
+    :param database: The ThermoDatabase to use. The module's compounds are
+      used if it is None.
+
+    :returns: [J/mol] Array with a row per compound and a column per
+      temperature.
+    """
+
+    return _calculate_molar_matrix_(Phase.G, compound_strings, T,
+                                    database)
+
+
+def calculate_reactions(reactions, T, database=None):
+    """
+    Calculate the Gibbs free energy change, enthalpy change and equilibrium
+    constant of each of the specified reactions at each of the specified
+    temperatures.
+
+    The properties of every compound that takes part in the reactions are
+    calculated only once, after which the properties of all the reactions
+    are calculated with one matrix multiplication.
+
+    :param reactions: List of reactions. Each reaction is a dictionary that
+      maps compounds to stoichiometric coefficients, which are negative for
+      reactants and positive for products, e.g.
+      {'Fe2O3[S1]': -1.0, 'C[S]': -3.0, 'Fe[S1]': 2.0, 'CO[G]': 3.0}.
+    :param T: [°C] temperature, or sequence of temperatures
+    :param database: The ThermoDatabase to use. The module's compounds are
+      used if it is None.
+
+    :returns: Dictionary containing arrays with a row per reaction and a
+      column per temperature: 'DG' [J/mol] Gibbs free energy change,
+      'DH' [J/mol] enthalpy change, 'lnK' natural logarithm of the
+      equilibrium constant and 'K' equilibrium constant.
+    """
+
+    compound_strings = sorted({c for reaction in reactions for c in reaction})
+    indices = {c: i for i, c in enumerate(compound_strings)}
+    coefficients = numpy.zeros((len(reactions), len(compound_strings)))
+    for i, reaction in enumerate(reactions):
+        for compound_string, coefficient in reaction.items():
+            coefficients[i, indices[compound_string]] = coefficient
+
+    TK = numpy.atleast_1d(numpy.asarray(T, dtype=float)) + 273.15
+    DG = coefficients @ G_matrix(compound_strings, T, database)
+    DH = coefficients @ H_matrix(compound_strings, T, database)
+    lnK = -DG / (R * TK)
+    with numpy.errstate(over='ignore'):
+        K = numpy.exp(lnK)
+
+    return {'DG': DG, 'DH': DH, 'lnK': lnK, 'K': K}
+
+
+jsonpickle.handlers.register(Phase, _CompiledDataHandler)
+jsonpickle.handlers.register(Compound, _CompiledDataHandler)
+
+compounds = CompoundRegistry()
+_H_cache = None
+_shared_memory = None
+_table_version = 0  # incremented whenever a phase's table changes
+_attach_lock = threading.Lock()
 default_data_path = _get_default_data_path_()
 load_data_auxi()
 
@@ -3,8 +3,17 @@
 This module provides testing code for the thermochemistry module.
 """
 
+import concurrent.futures
+import copy
+import math
+import os
+import shutil
+import tempfile
+import threading
 import unittest
 
+import numpy
+
 from auxi.tools.chemistry import thermochemistry as thermo
 
 
@@ -22,6 +31,10 @@ __status__ = 'Planning'
 #   load_data_auxi, list_compounds, molar_mass
 # TODO: Test CpRecord, Phase and Compound classes separately?
 
+def _calculate_H_(compound_string):
+    return thermo.H(compound_string, 1000.0)
+
+
 class ThermoFunctionTester(unittest.TestCase):
     """
     The function tester for the thermochemistry module.
@@ -42,6 +55,70 @@ class ThermoFunctionTester(unittest.TestCase):
         thermo.load_data_auxi()
         self.assertEqual(len(thermo.compounds), 81)
 
+    def test_load_data_auxi_lazy(self):
+        thermo.load_data_auxi(thermo._get_default_data_path_())
+        self.assertEqual(len(thermo.compounds.get_loaded()), 0)
+        self.assertTrue("Co" in thermo.compounds)
+        self.assertFalse("Cobalt" in thermo.compounds)
+        self.assertEqual(thermo.compounds["Fe2O3"].formula, "Fe2O3")
+        self.assertEqual(len(thermo.compounds.get_loaded()), 1)
+        self.assertEqual(len(thermo.compounds), 81)
+
+    def test_load_data_compiled(self):
+        thermo.load_data_auxi(thermo._get_default_data_path_())
+        expected = {f: thermo.compounds[f] for f in thermo.compounds}
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        file_name = os.path.join(directory, 'compounds.npy')
+        thermo.write_compiled_data_file(file_name)
+        for mmap in [False, True]:
+            thermo.load_data_compiled(file_name, mmap=mmap)
+            self.assertEqual(len(thermo.compounds), 81)
+            self.assertEqual(len(thermo.compounds.get_loaded()), 0)
+            for formula, compound in expected.items():
+                loaded = thermo.compounds[formula]
+                self.assertEqual(loaded.get_phase_list(),
+                                 compound.get_phase_list())
+                self.assertEqual(loaded.reference, compound.reference)
+                for phase in compound.get_phase_list():
+                    self.assertEqual(loaded.H(phase, 1200.0),
+                                     compound.H(phase, 1200.0))
+                    self.assertEqual(loaded.S(phase, 1200.0),
+                                     compound.S(phase, 1200.0))
+        thermo.load_data_auxi(thermo._get_default_data_path_())
+
+    def test_convert_data_factsage(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        with open(os.path.join(directory, 'Compound_FeO.txt'), 'w') as f:
+            f.write('Compound: FeO\n'
+                    'Header\n'
+                    '__________\n'
+                    'S1 1 -272044.0 60.752 48.79 0 0.008372 1 298 1650\n'
+                    'S1 2 68.199 0 - - 1650 3687\n'
+                    'S1 2 1.0e-3 1\n'
+                    'L1 1 -249530.0 46.4 68.2 0 - - 298 3687\n'
+                    '__________\n')
+        with open(os.path.join(directory, 'Compound_SiO2.txt'), 'w') as f:
+            f.write('Compound: SiO2\n__________\nS1 1 x 1 2 0 298 500\n')
+        compiled_file_name = os.path.join(directory, 'compounds.npy')
+        results = thermo.convert_data_factsage(
+            directory, directory, compiled_file_name, processes=1)
+        self.assertEqual([r['formula'] for r in results], ['FeO', None])
+        self.assertIsNone(results[0]['error'])
+        self.assertIsNotNone(results[1]['error'])
+        compound = thermo.Compound.read(
+            os.path.join(directory, 'Compound_FeO.json'))
+        self.assertEqual(compound.get_phase_list(), ['L1', 'S1'])
+        phase = compound._phases['S1']
+        self.assertEqual(phase._Tmax_list, [1650.0, 3687.0])
+        self.assertAlmostEqual(phase.Cp(2000.0), 68.199 + 2.0)
+        self.assertAlmostEqual(phase.Cp(298.15),
+                               48.79 + 0.008372*298.15)
+        thermo.load_data_compiled(compiled_file_name)
+        self.assertEqual(list(thermo.compounds.keys()), ['FeO'])
+        thermo.load_data_auxi(thermo._get_default_data_path_())
+
     def test_compound_get_phase_list(self):
         phs = thermo.compounds["Ag"].get_phase_list()
         self.assertEqual(phs[0], "L")
@@ -89,6 +166,539 @@ class ThermoFunctionTester(unittest.TestCase):
                                -4.985780960719607)
         #                       0.0005662425810664761)
 
+    def test_array_arguments(self):
+        T = numpy.array([25.0, 500.0, 1000.0, 1500.0])
+        mass = numpy.array([1.0, 2.0, 3.0, 4.0])
+        for f in [thermo.Cp, thermo.H, thermo.S, thermo.G]:
+            results = f("Al2O3[S]", T, mass)
+            self.assertEqual(results.shape, (4,))
+            for t, m, result in zip(T, mass, results):
+                self.assertAlmostEqual(result, f("Al2O3[S]", t, m), places=12)
+        results = thermo.H("Al2O3[S]", [25.0, 1000.0])
+        self.assertAlmostEqual(results[1], -4.264869218634823, places=12)
+
+    def test_H_tabulated(self):
+        H = thermo.H("Al2O3[S]", 1000.0)
+        errors = thermo.tabulate(["Al2O3[S]"], 25.0, 1500.0, 10.0)
+        self.assertTrue(errors["Al2O3[S]"]["H"] < 1.0e-8)
+        self.assertTrue(abs(thermo.H("Al2O3[S]", 1000.0) - H) <=
+                        errors["Al2O3[S]"]["H"])
+        thermo.untabulate(["Al2O3[S]"])
+        self.assertEqual(thermo.H("Al2O3[S]", 1000.0), H)
+
+    def test_H_cache(self):
+        expected = thermo.H("Al2O3[S]", 1000.0, 2.0)
+        thermo.enable_H_cache(maxsize=2)
+        try:
+            self.assertEqual(thermo.H("Al2O3[S]", 1000.0, 2.0), expected)
+            self.assertEqual(thermo.H("Al2O3[S]", 1000.0, 4.0), 2.0 * expected)
+            self.assertEqual(thermo.get_H_cache_info(),
+                             {'hits': 1, 'misses': 1, 'size': 1, 'maxsize': 2})
+            thermo.H("Al2O3[S]", 500.0)
+            thermo.H("Al2O3[S]", 600.0)
+            self.assertEqual(thermo.get_H_cache_info()['size'], 2)
+            thermo.H("Al2O3[S]", 1000.0)
+            self.assertEqual(thermo.get_H_cache_info()['misses'], 4)
+
+            compound = thermo.compounds["Al2O3"]
+            thermo.compounds["Al2O3"] = compound
+            thermo.H("Al2O3[S]", 1000.0)
+            self.assertEqual(thermo.get_H_cache_info()['misses'], 5)
+            self.assertEqual(thermo.get_H_cache_info()['size'], 1)
+
+            # A handle created before its compound was replaced keeps using
+            # its own phase, also for H.
+            handle = thermo.CompoundPhaseHandle("Al2O3[S]")
+            thermo.compounds["Al2O3"] = thermo.compounds["FeO"]
+            try:
+                self.assertEqual(handle.H(1000.0, 2.0), expected)
+                self.assertEqual(handle.S(1000.0, 2.0),
+                                 compound.S("S", 1273.15) / 3.6E6 /
+                                 handle.molar_mass * 2.0)
+            finally:
+                thermo.compounds["Al2O3"] = compound
+        finally:
+            thermo.disable_H_cache()
+        self.assertIsNone(thermo.get_H_cache_info())
+
+    def test_compound_phase_handle(self):
+        handle = thermo.CompoundPhaseHandle("Al2O3[S]")
+        self.assertEqual(handle.formula, "Al2O3")
+        self.assertEqual(handle.phase, "S")
+        self.assertEqual(handle.molar_mass, thermo.molar_mass("Al2O3"))
+        for f in ['Cp', 'H', 'S', 'G']:
+            self.assertEqual(getattr(handle, f)(1000.0, 2.0),
+                             getattr(thermo, f)("Al2O3[S]", 1000.0, 2.0))
+        results = handle.H([25.0, 1000.0])
+        self.assertAlmostEqual(results[1], thermo.H("Al2O3[S]", 1000.0))
+        self.assertRaises(Exception, thermo.CompoundPhaseHandle, "Al2O3[X]")
+
+    def test_compound_phase_vector(self):
+        compounds = ["Al2O3[S]", "Fe[Salpha]", "H2O[G]", "SiO2[S]", "C[Sgr]"]
+        vector = thermo.CompoundPhaseVector(compounds)
+        for T in [-100.0, 25.0, 500.0, 1234.5, 2500.0, 6000.0]:
+            H = vector.H(T)
+            Cp = vector.Cp(T)
+            for i, compound in enumerate(compounds):
+                self.assertAlmostEqual(H[i], thermo.H(compound, T),
+                                       places=10)
+                self.assertAlmostEqual(Cp[i], thermo.Cp(compound, T),
+                                       places=14)
+
+        masses = [1.0, 2.0, 0.0, 0.5, 0.1]
+        H = sum(thermo.H(c, 812.3, m) for c, m in zip(compounds, masses))
+        for T_guess in [None, 25.0, 2000.0]:
+            self.assertAlmostEqual(
+                vector.T_from_H(H, masses, T_guess=T_guess), 812.3, places=6)
+        self.assertRaises(Exception, vector.T_from_H, H, masses[:2])
+
+        thermo.tabulate(["Al2O3[S]"], 300.0, 2000.0)
+        try:
+            self.assertEqual(vector.H(500.0)[0], thermo.H("Al2O3[S]", 500.0))
+            self.assertEqual(vector._tabulated, [0])
+        finally:
+            thermo.untabulate()
+        vector.H(500.0)
+        self.assertEqual(vector._tabulated, [])
+
+    def test_G_matrix(self):
+        compounds = ["CO[G]", "CO2[G]"]
+        T = [500.0, 1000.0]
+        result = thermo.G_matrix(compounds, T)
+        self.assertEqual(result.shape, (2, 2))
+        self.assertAlmostEqual(result[1, 1],
+                               thermo.compounds["CO2"].G("G", 1273.15),
+                               places=8)
+        self.assertEqual(thermo.H_matrix(compounds, 500.0).shape, (2, 1))
+
+    def test_calculate_reactions(self):
+        boudouard = {"C[Sgr]": -1.0, "CO2[G]": -1.0, "CO[G]": 2.0}
+        combustion = {"CO[G]": -2.0, "O2[G]": -1.0, "CO2[G]": 2.0}
+        T = numpy.array([500.0, 1000.0])
+        result = thermo.calculate_reactions([boudouard, combustion], T)
+        self.assertEqual(result['DG'].shape, (2, 2))
+        TK = 1273.15
+        c = thermo.compounds
+        DG = 2.0*c["CO"].G("G", TK) - c["C"].G("Sgr", TK) - \
+            c["CO2"].G("G", TK)
+        DH = 2.0*c["CO"].H("G", TK) - c["C"].H("Sgr", TK) - \
+            c["CO2"].H("G", TK)
+        self.assertAlmostEqual(result['DG'][0, 1], DG, places=8)
+        self.assertAlmostEqual(result['DH'][0, 1], DH, places=8)
+        self.assertAlmostEqual(result['K'][0, 1],
+                               math.exp(-DG / (thermo.R * TK)), places=8)
+        # The Boudouard reaction is favoured at high temperatures only.
+        self.assertTrue(result['K'][0, 0] < 1.0 < result['K'][0, 1])
+        self.assertTrue(numpy.all(result['DG'][1] < 0.0))
+
+    def test_stable_phase(self):
+        self.assertEqual(thermo.get_stable_phase("H2O", 25.0), "L")
+        self.assertEqual(thermo.get_stable_phase("H2O", 200.0), "G")
+        self.assertEqual(thermo.H("H2O", 25.0, 2.0),
+                         thermo.H("H2O[L]", 25.0, 2.0))
+        self.assertEqual(thermo.G("H2O", 200.0), thermo.G("H2O[G]", 200.0))
+        results = thermo.H("H2O", [25.0, 200.0])
+        self.assertAlmostEqual(results[0], thermo.H("H2O[L]", 25.0))
+        self.assertAlmostEqual(results[1], thermo.H("H2O[G]", 200.0))
+
+        compound = thermo.compounds["Ag"]
+        index = compound.get_stability_index()
+        self.assertIs(compound.get_stability_index(), index)
+        self.assertEqual(index.phases, ["S", "L"])
+        T = index.transitions[0]
+        self.assertTrue(1230.0 < T < 1240.0)
+        self.assertAlmostEqual(compound.G("S", T) / compound.G("L", T), 1.0)
+        self.assertEqual(compound.get_stable_phase(T - 1.0), "S")
+        self.assertEqual(compound.get_stable_phase(T + 1.0), "L")
+        self.assertNotIn('_stability_index', str(compound))
+
+    def test_phase_errors(self):
+        class FailingPhase(object):
+            def H(self, T):
+                raise KeyError('x')
+            S = G = H
+
+        compound = copy.copy(thermo.compounds["Ag"])
+        compound._phases = dict(compound._phases, S=FailingPhase())
+        for f in [compound.H, compound.S, compound.G]:
+            # Errors in a phase's calculation are not reported as a missing
+            # phase.
+            self.assertRaises(KeyError, f, "S", 1000.0)
+            self.assertRaisesRegex(Exception, "phase 'X' was not found", f,
+                                   "X", 1000.0)
+
+    def test_T_from_H(self):
+        for compound_string in ["Fe[Salpha]", "Al2O3[S]", "H2O[G]"]:
+            for T in [25.0, 300.0, 1234.5, 2500.0]:
+                H = thermo.H(compound_string, T, 2.0)
+                self.assertAlmostEqual(
+                    thermo.T_from_H(compound_string, H, 2.0), T, places=6)
+
+        compounds = ["Fe2O3[Salpha]", "FeO[S]", "SiO2[S]", "H2O[G]"]
+        masses = [1.0, 2.0, 0.5, 0.0]
+        H = sum(thermo.H(c, 812.3, m) for c, m in zip(compounds, masses))
+        self.assertAlmostEqual(thermo.T_from_H(compounds, H, masses), 812.3,
+                               places=6)
+        self.assertRaises(Exception, thermo.T_from_H, compounds, H, [1.0])
+
+        H = sum(thermo.H(c, 812.3) for c in compounds)
+        self.assertAlmostEqual(thermo.T_from_H(compounds, H), 812.3,
+                               places=6)
+        self.assertRaisesRegex(Exception, "larger than zero",
+                               thermo.T_from_H, "FeO[S]", H, 0.0)
+        self.assertRaisesRegex(Exception, "larger than zero",
+                               thermo.T_from_H, compounds, H, 0.0)
+
+    def test_compound_list_arguments(self):
+        compounds = ["Al2O3[S]", "SiO2[S]"]
+        results = thermo.H(compounds, [25.0, 1000.0], [2.0, 3.0])
+        self.assertEqual(results.shape, (2, 2))
+        self.assertAlmostEqual(results[0, 1],
+                               thermo.H("Al2O3[S]", 1000.0, 2.0), places=12)
+        self.assertAlmostEqual(results[1, 0], thermo.H("SiO2[S]", 25.0, 3.0),
+                               places=12)
+        results = thermo.G(compounds, 1000.0)
+        self.assertEqual(results.shape, (2,))
+
+
+class PhaseTester(unittest.TestCase):
+    """
+    Tester for the auxi.tools.chemistry.thermochemistry.Phase class.
+    """
+
+    def setUp(self):
+        self.phase_dictionary = {
+            'Symbol': 'S',
+            'DHref': -1000.0,
+            'Sref': 50.0,
+            'Cp_records': {
+                '500.0': {'Tmin': 298.15, 'Tmax': 500.0,
+                          'Terms': [{'Coefficient': 20.0, 'Exponent': 0.0}]},
+                1000.0: {'Tmin': 500.0, 'Tmax': 1000.0,
+                         'Terms': [{'Coefficient': 30.0, 'Exponent': 0.0}]}}}
+        self.phase = thermo.Phase(self.phase_dictionary)
+        self.T = numpy.array([300.0, 500.0, 800.0, 1000.0, 1500.0])
+
+    def test_Cp(self):
+        self.assertEqual(self.phase.Cp(499.0), 20.0)
+        self.assertEqual(self.phase.Cp(500.0), 30.0)
+        self.assertEqual(self.phase.Cp(1500.0), 30.0)
+
+    def test_H(self):
+        self.assertAlmostEqual(self.phase.H(400.0), -1000.0 + 20.0*101.85)
+        self.assertAlmostEqual(self.phase.H(800.0),
+                               -1000.0 + 20.0*201.85 + 30.0*300.0)
+        self.assertAlmostEqual(self.phase.H(1500.0),
+                               -1000.0 + 20.0*201.85 + 30.0*1000.0)
+
+    def test_S(self):
+        self.assertAlmostEqual(self.phase.S(800.0),
+                               50.0 + 20.0*math.log(500.0/298.15) +
+                               30.0*math.log(800.0/500.0))
+        self.assertAlmostEqual(self.phase.S(1500.0),
+                               50.0 + 20.0*math.log(500.0/298.15) +
+                               30.0*math.log(1500.0/500.0))
+
+    def test_G(self):
+        self.assertAlmostEqual(self.phase.G(800.0),
+                               self.phase.H(800.0) -
+                               800.0*self.phase.S(800.0))
+
+    def test_T_from_H(self):
+        self.assertAlmostEqual(self.phase.T_from_H(-1000.0), 298.15)
+        self.assertAlmostEqual(self.phase.T_from_H(-1000.0 + 20.0*101.85),
+                               400.0)
+        self.assertAlmostEqual(self.phase.T_from_H(self.phase.H(800.0)),
+                               800.0)
+        self.assertAlmostEqual(self.phase.T_from_H(self.phase.H(1500.0)),
+                               1500.0)
+        self.assertAlmostEqual(self.phase.T_from_H(-1000.0 - 20.0*100.0),
+                               198.15)
+        self.assertRaises(Exception, self.phase.T_from_H,
+                          self.phase.H(800.0), max_iterations=0)
+
+    def test_solve_T_guess(self):
+        for T_guess in [None, 250.0, 799.0, 1200.0, 5000.0]:
+            self.assertAlmostEqual(
+                thermo._solve_T_(self.phase.H, self.phase.Cp,
+                                 self.phase.H(800.0), self.phase._T_bounds,
+                                 T_guess=T_guess),
+                800.0)
+
+        # An enthalpy below the range of the data is not solved to 0 K.
+        H = self.phase.H(298.15) - 1.0e7
+        for T_guess in [None, 500.0]:
+            self.assertRaisesRegex(
+                Exception, "below the range", thermo._solve_T_, self.phase.H,
+                self.phase.Cp, H, self.phase._T_bounds, T_guess=T_guess)
+        vector = thermo.CompoundPhaseVector(["Fe2O3[Salpha]"])
+        H = vector.H(25.0)[0] * 2.0 - 5.0
+        self.assertRaisesRegex(Exception, "below the range", vector.T_from_H,
+                               H, [2.0], T_guess=500.0)
+
+    def test_array_arguments(self):
+        for f in [self.phase.Cp, self.phase.H, self.phase.S, self.phase.G]:
+            results = f(self.T)
+            for T, result in zip(self.T, results):
+                self.assertAlmostEqual(result, f(float(T)), places=9)
+
+    def test_tabulate(self):
+        phase = thermo.Phase(self.phase_dictionary)
+        phase._Cp_records['500.0']._coefficients.append(-1.0e5)
+        phase._Cp_records['500.0']._exponents.append(-2.0)
+        phase._init()
+        expected = [phase.H(T) for T in self.T]
+        errors = phase.tabulate(298.15, 1300.0, 20.0)
+        self.assertTrue(errors['H'] < 1.0e-3)
+        self.assertEqual(phase._table.Tmax, 1318.15)
+        for T, H in zip(self.T, expected):
+            self.assertAlmostEqual(phase.H(T), H, delta=errors['H'])
+        self.assertEqual(phase._table.interval(500.0), -1)
+        self.assertEqual(phase.Cp(500.0), 30.0)
+        results = phase.H(self.T)
+        for result, H in zip(results, expected):
+            self.assertAlmostEqual(result, H, delta=errors['H'])
+        phase.untabulate()
+        self.assertEqual(phase.H(800.0), expected[2])
+
+    def test_magnetic(self):
+        self.phase_dictionary['magnetic'] = {'Tc': 700.0, 'beta0': 2.22,
+                                             'p': 0.28}
+        phase = thermo.Phase(self.phase_dictionary)
+        self.assertEqual(phase.Tc_mag, 700.0)
+        for T in [400.0, 650.0, 900.0, 1200.0]:
+            self.assertTrue(phase.Cp_mag(T) > 0.0)
+            self.assertAlmostEqual(phase.G_mag(T),
+                                   phase.H_mag(T) - T*phase.S_mag(T),
+                                   places=9)
+            dT = 1.0e-3
+            self.assertAlmostEqual(
+                (phase.H_mag(T + dT) - phase.H_mag(T - dT)) / (2*dT),
+                phase.Cp_mag(T), places=5)
+            self.assertAlmostEqual(
+                (phase.S_mag(T + dT) - phase.S_mag(T - dT)) / (2*dT),
+                phase.Cp_mag(T) / T, places=7)
+        self.assertEqual(phase.H(800.0),
+                         self.phase.H(800.0) + phase.H_mag(800.0))
+        for f in [phase.Cp, phase.H, phase.S, phase.G]:
+            results = f(self.T)
+            for T, result in zip(self.T, results):
+                self.assertAlmostEqual(result, f(float(T)), places=9)
+
+        compound = thermo.Compound({'Formula': 'Fe',
+                                    'Phases': {'S': self.phase_dictionary}})
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        file_name = os.path.join(directory, 'Compound_Fe.json')
+        compound.write(file_name)
+        loaded = thermo.Compound.read(file_name)
+        self.assertEqual(loaded.H('S', 800.0), phase.H(800.0))
+        file_name = os.path.join(directory, 'compounds.npy')
+        thermo.write_compiled_data_file(file_name, {'Fe': compound})
+        loaded = thermo._create_compound_from_compiled_data_(
+            numpy.load(file_name))
+        self.assertEqual(loaded._phases['S'].p_mag, 0.28)
+        self.assertEqual(loaded.H('S', 800.0), phase.H(800.0))
+
+    def test_write_without_compiled_data(self):
+        compound = thermo.Compound({'Formula': 'FeO',
+                                    'Phases': {'S': self.phase_dictionary}})
+        result = str(compound)
+        self.assertNotIn('_H_starts', result)
+        self.assertNotIn('_Tmaxes', result)
+
+
+class ThermoDatabaseTester(unittest.TestCase):
+    """
+    Tester for the auxi.tools.chemistry.thermochemistry.ThermoDatabase
+    class.
+    """
+
+    def setUp(self):
+        self.database = thermo.ThermoDatabase.read_auxi(
+            thermo._get_default_data_path_())
+
+    def test_read_auxi(self):
+        self.assertEqual(len(self.database), 81)
+        self.assertTrue("Fe2O3" in self.database)
+        self.assertEqual(self.database["Fe2O3"].formula, "Fe2O3")
+        self.assertIs(self.database["Fe2O3"], self.database["Fe2O3"])
+
+    def test_read_only(self):
+        def set_item():
+            self.database["FeO"] = None
+        self.assertRaises(TypeError, set_item)
+        self.assertFalse(hasattr(self.database, 'clear'))
+
+    def test_independent_of_module_compounds(self):
+        compound = self.database["Al2O3"]
+        thermo.compounds.clear()
+        try:
+            self.assertEqual(len(self.database), 81)
+            self.assertIs(self.database["Al2O3"], compound)
+            self.assertRaises(KeyError, thermo.H, "Al2O3[S]", 1000.0)
+            self.assertAlmostEqual(
+                thermo.H("Al2O3[S]", 1000.0, database=self.database),
+                -4.264869218634823, places=12)
+        finally:
+            thermo.load_data_auxi(thermo._get_default_data_path_())
+
+    def test_functions(self):
+        for f in [thermo.Cp, thermo.H, thermo.S, thermo.G]:
+            self.assertEqual(f("Fe2O3[Salpha]", 800.0, 2.0,
+                               database=self.database),
+                             f("Fe2O3[Salpha]", 800.0, 2.0))
+        handle = thermo.CompoundPhaseHandle("FeO[S]", self.database)
+        self.assertEqual(handle.H(800.0), thermo.H("FeO[S]", 800.0))
+        self.assertEqual(thermo.G_matrix(["FeO[S]"], [800.0],
+                                         database=self.database)[0, 0],
+                         thermo.compounds["FeO"].G("S", 1073.15))
+
+    def test_threads(self):
+        results = []
+
+        def load():
+            results.append([self.database[f] for f in sorted(self.database)])
+
+        threads = [threading.Thread(target=load) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(results), 8)
+        for result in results[1:]:
+            self.assertEqual([id(c) for c in result],
+                             [id(c) for c in results[0]])
+
+    def test_contains_while_loading(self):
+        registry = thermo.CompoundRegistry()
+        database = thermo.ThermoDatabase(registry)
+        states = []
+
+        def load():
+            states.append(('FeO' in database, len(database)))
+            return 'FeO compound'
+
+        registry.register('FeO', load)
+        self.assertEqual(database['FeO'], 'FeO compound')
+        self.assertEqual(states, [(True, 1)])
+        self.assertTrue('FeO' in database)
+        self.assertEqual(len(database), 1)
+
+    def test_load_data_shared(self):
+        memories = [thermo.publish_shared_data(self.database)
+                    for i in range(2)]
+        try:
+            thermo.load_data_shared(memories[0].name)
+            H = thermo.H("FeO[S]", 1000.0)
+            attached = thermo._shared_memory
+            thermo.load_data_shared(memories[1].name)
+            # The previous block is closed once the compounds that referred
+            # to it were removed.
+            self.assertIsNone(attached.buf)
+            self.assertEqual(thermo.H("FeO[S]", 1000.0), H)
+        finally:
+            thermo.load_data_auxi(thermo._get_default_data_path_())
+            for memory in memories:
+                memory.close()
+                memory.unlink()
+
+    def test_shared_data(self):
+        memory = thermo.publish_shared_data(self.database)
+        try:
+            database = thermo.attach_shared_data(memory.name)
+            self.assertEqual(len(database), 81)
+            self.assertEqual(len(database._registry.get_loaded()), 0)
+            self.assertEqual(database["FeO"].H("S", 1000.0),
+                             self.database["FeO"].H("S", 1000.0))
+
+            compound_strings = ["Fe2O3[Salpha]", "FeO[S]"]
+            with concurrent.futures.ProcessPoolExecutor(
+                    2, initializer=thermo.load_data_shared,
+                    initargs=(memory.name,)) as executor:
+                results = list(executor.map(_calculate_H_, compound_strings))
+            self.assertEqual(results,
+                             [_calculate_H_(c) for c in compound_strings])
+        finally:
+            memory.close()
+            memory.unlink()
+
+
+class CompoundRegistryTester(unittest.TestCase):
+    """
+    Tester for the auxi.tools.chemistry.thermochemistry.CompoundRegistry
+    class.
+    """
+
+    def setUp(self):
+        self.registry = thermo.CompoundRegistry()
+        self.loaded = []
+
+    def _load(self):
+        self.loaded.append('FeO')
+        return 'FeO compound'
+
+    def test_register(self):
+        self.registry.register('FeO', self._load)
+        self.assertEqual(len(self.registry), 1)
+        self.assertTrue('FeO' in self.registry)
+        self.assertEqual(self.loaded, [])
+        self.assertEqual(self.registry['FeO'], 'FeO compound')
+        self.assertEqual(self.registry['FeO'], 'FeO compound')
+        self.assertEqual(self.loaded, ['FeO'])
+        self.assertEqual(len(self.registry), 1)
+
+    def test_setitem(self):
+        self.registry.register('FeO', self._load)
+        self.registry['FeO'] = 'other'
+        self.registry['SiO2'] = 'SiO2 compound'
+        self.assertEqual(self.registry['FeO'], 'other')
+        self.assertEqual(sorted(self.registry.keys()), ['FeO', 'SiO2'])
+        self.assertEqual(self.loaded, [])
+
+    def test_delitem_and_clear(self):
+        self.registry.register('FeO', self._load)
+        self.registry['SiO2'] = 'SiO2 compound'
+        del self.registry['FeO']
+        self.assertFalse('FeO' in self.registry)
+        self.assertRaises(KeyError, lambda: self.registry['FeO'])
+        self.registry.clear()
+        self.assertEqual(len(self.registry), 0)
+
+    def test_loader_error(self):
+        def fail():
+            raise IOError('The data file could not be read.')
+
+        self.registry.register('FeO', fail)
+        self.assertRaises(IOError, lambda: self.registry['FeO'])
+        self.assertTrue('FeO' in self.registry)
+        self.registry.register('FeO', self._load)
+        self.assertEqual(self.registry['FeO'], 'FeO compound')
+
+    def test_threads(self):
+        thermo.load_data_auxi()
+        formulas = sorted(thermo.compounds)
+        results = []
+        errors = []
+
+        def load():
+            try:
+                results.append([thermo.compounds[f] for f in formulas])
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=load) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(results), 8)
+        for result in results[1:]:
+            self.assertEqual([id(c) for c in result],
+                             [id(c) for c in results[0]])
+        self.assertEqual(len(thermo.compounds), len(formulas))
+
 
 if __name__ == '__main__':
     unittest.main()
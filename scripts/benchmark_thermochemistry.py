@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Benchmark the thermochemistry module and compare the results to a baseline.
+
+The results are written to a JSON file containing the time in seconds of
+each benchmark. If a baseline file is specified, every benchmark that is
+slower than the baseline by more than the threshold is reported as a
+regression, and the script exits with a non-zero status.
+
+Examples::
+
+    python3 benchmark_thermochemistry.py -o baseline.json
+    python3 benchmark_thermochemistry.py -o results.json -b baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+
+import numpy
+
+from auxi.tools.chemistry import thermochemistry as thermo
+
+
+def time_call(function, repeat):
+    """
+    Determine the time of one call to a function.
+
+    :param function: Function without parameters.
+    :param repeat: Number of times to repeat the measurement.
+
+    :returns: [s] The best time per call.
+    """
+
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def time_once(function, repeat):
+    """
+    Determine the time of a function that can be called only once per
+    measurement, e.g. loading a database.
+
+    :param function: Function without parameters.
+    :param repeat: Number of times to repeat the measurement.
+
+    :returns: [s] The best time.
+    """
+
+    return min(timeit.repeat(function, repeat=repeat, number=1))
+
+
+def find_phases():
+    """
+    Find the loaded compound phases with the fewest and the most Cp records.
+
+    :returns: Compound strings of the single-range and multi-range phases.
+    """
+
+    phases = []
+    for formula in sorted(thermo.compounds):
+        compound = thermo.compounds[formula]
+        for symbol in compound.get_phase_list():
+            count = len(compound._phases[symbol]._records)
+            phases.append((count, '{}[{}]'.format(formula, symbol)))
+    return min(phases)[1], max(phases)[1]
+
+
+def write_factsage_file(directory, compound):
+    """
+    Write a compound to a file in the FactSage format read by
+    load_data_factsage.
+
+    :param directory: Directory to write the file to.
+    :param compound: Compound object.
+    """
+
+    lines = ['Compound: {}'.format(compound.formula), 'Benchmark data',
+             '_' * 20]
+    for symbol in compound.get_phase_list():
+        phase = compound._phases[symbol]
+        for number, record in enumerate(phase._records, 1):
+            terms = ['{!r} {!r}'.format(c, e) for c, e in
+                     zip(record._coefficients, record._exponents)]
+            terms = terms or ['0.0 0.0']  # a record needs at least one term
+            first = [symbol, str(number)]
+            if number == 1:
+                first += [repr(phase.DHref), repr(phase.Sref)]
+            first += terms[:2] + [repr(record.Tmin), repr(record.Tmax)]
+            lines.append(' '.join(first))
+            for term in terms[2:]:
+                lines.append('{} {} {}'.format(symbol, number, term))
+    lines.append('_' * 20)
+
+    file_name = os.path.join(directory,
+                             'Compound_{}.txt'.format(compound.formula))
+    with open(file_name, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+def benchmark_import(repeat):
+    """
+    :returns: [s] The time to import the module in a new interpreter.
+    """
+
+    command = [sys.executable, '-c',
+               'import time; t = time.perf_counter(); '
+               'import auxi.tools.chemistry.thermochemistry; '
+               'print(time.perf_counter() - t)']
+    return min(float(subprocess.check_output(command))
+               for i in range(repeat))
+
+
+def benchmark_calls(results, repeat):
+    """
+    Time single calls of the property functions for single-range and
+    multi-range phases, and sweeps over 1000 temperatures.
+
+    :param results: Dictionary to add the [s] times to.
+    :param repeat: Number of times to repeat each measurement.
+    """
+
+    single, multi = find_phases()
+    for name, compound_string in [('single', single), ('multi', multi)]:
+        T = thermo.CompoundPhaseHandle(compound_string)._phase._Tmax_list[-1]
+        T = min(T, 2000.0) - 273.15 - 1.0
+        for function in [thermo.Cp, thermo.H, thermo.S, thermo.G]:
+            results['call_{}_{}'.format(function.__name__, name)] = \
+                time_call(lambda: function(compound_string, T), repeat)
+        handle = thermo.CompoundPhaseHandle(compound_string)
+        results['call_handle_H_{}'.format(name)] = \
+            time_call(lambda: handle.H(T), repeat)
+
+    T = numpy.linspace(25.0, 1500.0, 1000)
+    results['sweep_H_array_1000'] = \
+        time_call(lambda: thermo.H(multi, T), repeat)
+    results['sweep_H_scalar_1000'] = \
+        time_call(lambda: [thermo.H(multi, t) for t in T], repeat)
+    results['sweep_G_matrix_1000'] = \
+        time_call(lambda: thermo.G_matrix([single, multi], T), repeat)
+
+
+def benchmark_loading(results, repeat, factsage_path=None):
+    """
+    Time loading the database from auxi, FactSage and compiled data files.
+
+    :param results: Dictionary to add the [s] times to.
+    :param repeat: Number of times to repeat each measurement.
+    :param factsage_path: Directory containing FactSage files. If it is None,
+      FactSage files are generated from the auxi data.
+    """
+
+    data_path = thermo._get_default_data_path_()
+
+    def load_auxi_all():
+        thermo.load_data_auxi(data_path)
+        for formula in thermo.compounds:
+            thermo.compounds[formula]
+
+    results['load_auxi_lazy'] = time_once(
+        lambda: thermo.load_data_auxi(data_path), repeat)
+    results['load_auxi_all'] = time_once(load_auxi_all, repeat)
+
+    directory = tempfile.mkdtemp()
+    try:
+        if factsage_path is None:
+            for formula in thermo.compounds:
+                write_factsage_file(directory, thermo.compounds[formula])
+            factsage_path = directory
+        compiled_file_name = os.path.join(directory, 'compounds.npy')
+        thermo.write_compiled_data_file(compiled_file_name)
+
+        results['load_factsage'] = time_once(
+            lambda: thermo.load_data_factsage(factsage_path), repeat)
+        results['load_compiled'] = time_once(
+            lambda: thermo.load_data_compiled(compiled_file_name), repeat)
+    finally:
+        shutil.rmtree(directory)
+        thermo.load_data_auxi(data_path)
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare benchmark results to a baseline.
+
+    :param results: Dictionary of benchmark times.
+    :param baseline: Dictionary of baseline benchmark times.
+    :param threshold: The fraction by which a benchmark may be slower than
+      the baseline before it is regarded as a regression.
+
+    :returns: List of regressed benchmark names.
+    """
+
+    regressions = []
+    for name in sorted(results):
+        if name not in baseline:
+            print('{:<24} {:>12.3e} s  (no baseline)'.format(
+                name, results[name]))
+            continue
+        ratio = results[name] / baseline[name]
+        regressed = ratio > 1.0 + threshold
+        if regressed:
+            regressions.append(name)
+        print('{:<24} {:>12.3e} s  {:>6.2f}x  {}'.format(
+            name, results[name], ratio, 'REGRESSION' if regressed else ''))
+    return regressions
+
+
+parser = argparse.ArgumentParser(
+    description='Benchmark the auxi thermochemistry module.')
+parser.add_argument('-o', '--output', default='thermochemistry.json',
+                    help='JSON file to write the results to')
+parser.add_argument('-b', '--baseline', default=None,
+                    help='JSON file with baseline results to compare to')
+parser.add_argument('-t', '--threshold', type=float, default=0.2,
+                    help='allowed fractional slowdown (default: 0.2)')
+parser.add_argument('-r', '--repeat', type=int, default=5,
+                    help='number of repeats per benchmark (default: 5)')
+parser.add_argument('--factsage-path', default=None,
+                    help='directory with FactSage files to load (default: '
+                         'files generated from the auxi data)')
+args = parser.parse_args()
+
+results = {'import': benchmark_import(args.repeat)}
+benchmark_calls(results, args.repeat)
+benchmark_loading(results, args.repeat, args.factsage_path)
+
+with open(args.output, 'w') as f:
+    json.dump({'python': platform.python_version(),
+               'numpy': numpy.__version__,
+               'platform': platform.platform(),
+               'results': results}, f, indent=2, sort_keys=True)
+
+if args.baseline is None:
+    compare(results, {}, args.threshold)
+else:
+    with open(args.baseline) as f:
+        baseline = json.load(f)['results']
+    if compare(results, baseline, args.threshold):
+        sys.exit(1)
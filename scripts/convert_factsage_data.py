@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Convert a directory of FactSage thermochemical data files to the auxi format
+and/or a single compiled data file.
+"""
+
+import argparse
+
+from auxi.tools.chemistry import thermochemistry as thermo
+
+
+parser = argparse.ArgumentParser(
+    description='Convert FactSage Compound_*.txt files to auxi data files.')
+parser.add_argument('path', help='directory containing the FactSage files')
+parser.add_argument('-o', '--output', default=None,
+                    help='directory to write the auxi JSON files to')
+parser.add_argument('-c', '--compiled', default=None,
+                    help='name of the compiled .npy data file to write')
+parser.add_argument('-p', '--processes', type=int, default=None,
+                    help='number of processes to use (default: CPU count)')
+args = parser.parse_args()
+
+if args.output is None and args.compiled is None:
+    parser.error('specify an output directory and/or a compiled file name')
+
+results = thermo.convert_data_factsage(args.path, args.output,
+                                       args.compiled, args.processes)
+
+failed = [r for r in results if r['error'] is not None]
+for r in results:
+    status = 'ERROR ' + r['error'] if r['error'] is not None else 'ok'
+    print('{:<60} {:>9.4f} s  {}'.format(r['file'], r['time'], status))
+print('Converted {} of {} files in {:.3f} s of processing time.'.format(
+    len(results) - len(failed), len(results),
+    sum(r['time'] for r in results)))